@@ -9,40 +9,56 @@ import ReportPage from './components/ReportPage';
 import ComparisonInsightCard from './components/ComparisonInsightCard';
 import StoreMemo from './components/StoreMemo';
 import { convertExcelDataToStoreData } from './utils/storeDataConverter';
+import { findSimilarStores, setStoreNeighbors } from './utils/similarStoreAnalyzer';
 import { dataService } from './services/dataService';
+import { setStoreRegistry } from './utils/storeRegistry';
+import { setItemSeasonAnalytics } from './utils/itemSeasonAnalyzer';
+import type { StyleRankings } from './utils/styleRankings';
 
 const App: React.FC = () => {
   const [currentPage, setCurrentPage] = useState<'home' | 'report'>('home');
 
   const [storeData, setStoreData] = useState<any>(null);
   const [performanceData, setPerformanceData] = useState<any>(null);
+  const [performanceCube, setPerformanceCube] = useState<any>(null);
   const [groupSalesData, setGroupSalesData] = useState<any>(null);
   const [itemSeasonData, setItemSeasonData] = useState<any>(null);
   const [inventoryData, setInventoryData] = useState<any>(null);
   const [competitorData, setCompetitorData] = useState<any>(null);
   const [storeStyleSalesData, setStoreStyleSalesData] = useState<any>(null);
+  const [styleRankings, setStyleRankings] = useState<StyleRankings | null>(null);
+  // 지금 들어 있는 샤드 데이터가 어느 매장 목록(shardStoreKey)의 것인지
+  const [loadedShardKey, setLoadedShardKey] = useState<string>('');
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
 
   useEffect(() => {
     const loadData = async () => {
       try {
-        const [sData, pData, gData, iData, invData, cData, ssData] = await Promise.all([
+        // 용량이 큰 아이템시즌/재고/스타일판매는 매장 선택 후 샤드로 따로 불러온다
+        // (샤드 매니페스트는 지금 같이 받아 두어 매장 선택 뒤의 요청 단계를 하나 줄인다)
+        dataService.prefetchShardManifests(['item_season_data', 'store_inventory_data', 'store_style_sales_data']);
+        const [sData, pData, gData, cData, registry, cube, rankings, neighbors, itemSeasonAnalytics] = await Promise.all([
           dataService.getStoreData(),
           dataService.getPerformanceData(),
           dataService.getGroupSalesData(),
-          dataService.getItemSeasonData(),
-          dataService.getStoreInventoryData(),
           dataService.getCompetitorData(),
-          dataService.getStoreStyleSalesData()
+          dataService.getStoreRegistry(),
+          dataService.getPerformanceCube(),
+          dataService.getStyleRankings(),
+          dataService.getStoreNeighbors(),
+          dataService.getItemSeasonAnalytics()
         ]);
+        // 매장 데이터를 변환하기 전에 매장ID 색인 조회와 유사 매장 이웃 테이블을 켠다
+        setStoreRegistry(registry);
+        setStoreNeighbors(neighbors);
+        setItemSeasonAnalytics(itemSeasonAnalytics);
         setStoreData(sData);
         setPerformanceData(pData);
+        setPerformanceCube(cube);
+        setStyleRankings(rankings);
         setGroupSalesData(gData);
-        setItemSeasonData(iData);
-        setInventoryData(invData);
         setCompetitorData(cData);
-        setStoreStyleSalesData(ssData);
       } catch (err) {
         console.error("Failed to load initial data", err);
         setError("데이터를 불러오는 중 오류가 발생했습니다.");
@@ -55,9 +71,9 @@ const App: React.FC = () => {
 
   // Excel 데이터를 변환하여 사용 (실적 데이터 포함)
   const stores = useMemo(() => {
-    if (!storeData || !performanceData || !itemSeasonData) return [];
-    return convertExcelDataToStoreData(storeData, performanceData, itemSeasonData);
-  }, [storeData, performanceData, itemSeasonData]);
+    if (!storeData || !performanceData) return [];
+    return convertExcelDataToStoreData(storeData, performanceData, itemSeasonData, performanceCube);
+  }, [storeData, performanceData, itemSeasonData, performanceCube]);
 
   const [selectedStoreId, setSelectedStoreId] = useState<string>('');
 
@@ -73,6 +89,54 @@ const App: React.FC = () => {
     return stores.find(s => s.store.id === selectedStoreId) || stores[0];
   }, [selectedStoreId, stores]);
 
+  // 선택 매장 + 비교(유사) 매장 목록. 이 매장들의 샤드만 내려받는다
+  const shardStoreKey = useMemo(() => {
+    if (!selectedData) return '';
+    const similarStores = findSimilarStores(selectedData, stores, null);
+    return [selectedData.store.name, ...similarStores.map(s => s.store.name)].join('|');
+  }, [selectedData, stores]);
+
+  useEffect(() => {
+    if (!shardStoreKey) return;
+    let cancelled = false;
+    const storeNames = shardStoreKey.split('|');
+    Promise.all([
+      dataService.getStoreShards('item_season_data', storeNames),
+      dataService.getStoreShards('store_inventory_data', storeNames),
+      // 베스트 아이템 순위가 미리 계산되어 있으면 스타일판매 샤드는 받지 않는다
+      styleRankings ? Promise.resolve(null) : dataService.getStoreShards('store_style_sales_data', storeNames)
+    ])
+      .then(([iData, invData, ssData]) => {
+        if (cancelled) return;
+        setItemSeasonData(iData);
+        setInventoryData(invData);
+        setStoreStyleSalesData(ssData);
+        setLoadedShardKey(shardStoreKey);
+      })
+      .catch(err => {
+        console.error("Failed to load store shards", err);
+        if (cancelled) return;
+        // 이전 매장의 샤드를 새 매장 것으로 쓰지 않도록 비우고 로딩 상태를 끝낸다
+        setItemSeasonData(null);
+        setInventoryData(null);
+        setStoreStyleSalesData(null);
+        setLoadedShardKey(shardStoreKey);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [shardStoreKey, styleRankings]);
+
+  // 매장을 바꾼 직후에는 샤드가 아직 이전 매장 것이라 itemPerformance 등이 비어 있다.
+  // 샤드가 도착할 때까지 샤드를 쓰는 카드 대신 로딩 표시를 보여준다
+  const storeShardsLoading = shardStoreKey !== loadedShardKey;
+  const shardLoadingCard = (
+    <div className="bg-white p-6 rounded-3xl border border-slate-100 shadow-sm mb-6 flex items-center justify-center gap-3">
+      <div className="animate-spin rounded-full h-5 w-5 border-b-2 border-blue-600"></div>
+      <span className="text-xs text-slate-500 font-medium">매장 데이터를 불러오는 중입니다...</span>
+    </div>
+  );
+
   // 연누계 (1~12월)
   const yearToDateRevenue = useMemo(() => {
     if (!selectedData) return 0;
@@ -183,20 +247,27 @@ const App: React.FC = () => {
               <StoreInfoCard store={selectedData.store} />
               <StoreMemo storeId={selectedData.store.id} storeName={selectedData.store.name} />
               {/* AI Comparison Insight */}
-              <ComparisonInsightCard
-                targetStore={selectedData}
-                allStores={stores}
-                itemSeasonData={itemSeasonData}
-                inventoryData={inventoryData}
-                competitorData={competitorData}
-                storeStyleSalesData={storeStyleSalesData}
-              />
+              {storeShardsLoading ? shardLoadingCard : (
+                <ComparisonInsightCard
+                  targetStore={selectedData}
+                  allStores={stores}
+                  itemSeasonData={itemSeasonData}
+                  inventoryData={inventoryData}
+                  competitorData={competitorData}
+                  storeStyleSalesData={storeStyleSalesData}
+                  styleRankings={styleRankings}
+                />
+              )}
               <MonthlySalesTrend monthlyPerformance={selectedData.monthlyPerformance} />
 
-              <StoreBestItems
-                selectedStoreName={selectedData.store.name}
-                data={storeStyleSalesData}
-              />
+              {/* 순위가 미리 계산되어 있으면 스타일판매 샤드를 기다리지 않는다 */}
+              {storeShardsLoading && !styleRankings ? shardLoadingCard : (
+                <StoreBestItems
+                  selectedStoreName={selectedData.store.name}
+                  data={storeStyleSalesData}
+                  rankings={styleRankings}
+                />
+              )}
             </>
           )}
 
@@ -207,7 +278,7 @@ const App: React.FC = () => {
             </svg>
           </button>
         </>
-      ) : (
+      ) : storeShardsLoading ? shardLoadingCard : (
         <ReportPage
           selectedStoreName={selectedData?.store.name || ''}
           data={itemSeasonData}
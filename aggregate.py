@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+시트 집계용 group-by-sum.
+
+필요한 열만 리스트로 모은 뒤 키 열을 정수 코드로 factorize하고 np.bincount로 한 번에 합산한다.
+행마다 튜플 키 dict를 갱신하고 float 변환을 try/except로 감싸던 방식보다 행 수가 늘수록 훨씬 빠르다.
+numpy가 없으면 같은 결과를 내는 순수 파이썬 경로를 쓴다.
+"""
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 dict 누적으로 같은 값을 계산한다
+    np = None
+
+
+def _to_float(value):
+    """기존 추출기의 float 변환 규칙: None이나 숫자로 바꿀 수 없는 값은 None(합산 제외)"""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def to_float_array(values):
+    """값 목록 -> (float64 배열, 숫자로 변환된 위치 마스크). 변환 실패/None 자리는 0."""
+    try:
+        # 숫자와 None만 있으면 (대부분의 시트) 한 번에 변환된다. None -> nan
+        arr = np.array(values, dtype=np.float64)
+    except (TypeError, ValueError, OverflowError):
+        # '-' 같은 문자열이 섞인 열: 같은 값은 한 번만 변환
+        converted = {}
+        arr = np.array([converted[v] if v in converted else converted.setdefault(v, _to_float(v))
+                        for v in values], dtype=np.float64)
+    valid = ~np.isnan(arr)
+    arr[~valid] = 0.0
+    return arr, valid
+
+
+def _factorize(column):
+    """키 열 -> (정렬된 고유값 목록, 행별 코드 배열)"""
+    first_seen = {}
+    codes = np.fromiter((first_seen.setdefault(v, len(first_seen)) for v in column),
+                        dtype=np.int64, count=len(column))
+    uniques = list(first_seen)
+    order = sorted(range(len(uniques)), key=uniques.__getitem__)
+    rank = np.empty(len(uniques), dtype=np.int64)
+    rank[order] = np.arange(len(uniques))
+    return [uniques[i] for i in order], rank[codes]
+
+
+def group_sum(keys, values, first_seen=False):
+    """키 열들(같은 길이의 리스트 목록)로 묶어 values를 합한다.
+
+    Returns: [(키 튜플, 합계)]. 기본은 키 정렬 순, first_seen=True면 그룹이 처음 나온 순서.
+    숫자 값이 하나도 없는 그룹의 합계는 int 0 (기존 dict 누적 결과와 JSON 출력이 같도록).
+    """
+    if not values:
+        return []
+    if np is None:
+        return _group_sum_python(keys, values, first_seen)
+
+    uniques, combined = [], np.zeros(len(values), dtype=np.int64)
+    for column in keys:
+        column_uniques, codes = _factorize(column)
+        uniques.append(column_uniques)
+        combined = combined * len(column_uniques) + codes
+    group_keys, first_index, group_of_row = np.unique(combined, return_index=True, return_inverse=True)
+    group_of_row = group_of_row.reshape(-1)
+
+    arr, valid = to_float_array(values)
+    # bincount는 행 순서대로 더하므로 파이썬 누적과 부동소수점 결과가 같다
+    totals = np.bincount(group_of_row, weights=arr, minlength=len(group_keys)).tolist()
+    has_number = (np.bincount(group_of_row, weights=valid, minlength=len(group_keys)) > 0).tolist()
+
+    order = np.argsort(first_index, kind='stable') if first_seen else range(len(group_keys))
+    result = []
+    for g in order:
+        code = int(group_keys[g])
+        key = []
+        for column_uniques in reversed(uniques):
+            code, index = divmod(code, len(column_uniques))
+            key.append(column_uniques[index])
+        result.append((tuple(reversed(key)), totals[g] if has_number[g] else 0))
+    return result
+
+
+def _group_sum_python(keys, values, first_seen):
+    totals = {}
+    for key, value in zip(zip(*keys), values):
+        value = _to_float(value)
+        totals[key] = totals.get(key, 0) + (value if value is not None else 0)
+    items = list(totals.items())
+    return items if first_seen else sorted(items)
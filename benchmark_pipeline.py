@@ -0,0 +1,379 @@
+# -*- coding: utf-8 -*-
+"""
+backdata.xlsx -> JSON 파이프라인 벤치마크.
+
+실제 시트 구조(실적, 매장별스타일판매, 경쟁사 2행 헤더, 단체 T열 판매액 등)를 흉내 낸
+합성 워크북을 1x/10x/100x 규모로 만들고, 시트 추출기마다 별도 프로세스에서 실행해
+소요 시간 / 최대 메모리(RSS) / 출력 크기를 기록합니다.
+
+사용법:
+  python benchmark_pipeline.py                       # 1x, 10x, 100x
+  python benchmark_pipeline.py --scales 1 10         # 규모 지정
+  python benchmark_pipeline.py --baseline .cache/bench/bench-20260101-000000.json
+      -> 이전 결과와 비교하고, 허용치(--tolerance)보다 느려진 추출기가 있으면 종료 코드 1
+  python benchmark_pipeline.py --reader openpyxl --output .cache/bench/openpyxl.json
+  python benchmark_pipeline.py --baseline .cache/bench/openpyxl.json
+      -> xlsx 리더(openpyxl read-only / native) 비교
+
+합성 워크북은 .cache/bench/에 저장해 재사용합니다 (--regenerate로 다시 생성).
+"""
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from datetime import datetime, timedelta
+from xml.sax.saxutils import escape
+
+try:
+    import resource
+except ImportError:  # Windows: 최대 RSS는 기록하지 않는다
+    resource = None
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BENCH_DIR = os.path.join(SCRIPT_DIR, '.cache', 'bench')
+DEFAULT_SCALES = [1, 10, 100]
+SEED = 20260101
+NS_MAIN = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+NS_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+# 1x = 현재 backdata.xlsx와 비슷한 시트별 데이터 행 수
+BASE_ROWS = {
+    '매장': 65,
+    '아이템시즌별판매': 5000,
+    '매장별스타일판매': 50000,
+    '매장별재고': 5400,
+    '실적': 1600,
+    '단체': 3000,
+    '경쟁사': 69,
+}
+
+MONTHS = [f'{year}{str(month).zfill(2)}' for year in (2024, 2025) for month in range(1, 13)]
+SEASONS = ['18F', '23F', '24S', '24F', '25S', '25F', '26S']
+ITEMS = ['CAP', 'TS', 'BAG', 'JP', 'PT', 'SHOES', 'HOOD']
+BRANDS = ['MLB', '캉골', '라이프워크', 'NEWERA', 'CK', 'GUESS', '커버낫', 'LEE',
+          '와키윌리', '마리떼', '엄브로', '데상트', '뉴발란스', '휠라']
+
+
+def store_names(count):
+    """매장명 목록. 실제 데이터에 있는 변형(괄호, close 접미사, 울산 동구 표기)을 섞는다."""
+    prefixes = ['롯데', '현대', '신세계', '갤러리아', 'AK', '더현대', 'NC']
+    cities = ['본점', '부산', '대구', '광주', '수원', '울산', '판교', '잠실', '센텀', '대전']
+    names = [f'{prefixes[i % len(prefixes)]}{cities[(i // len(prefixes)) % len(cities)]}'
+             + (str(i // (len(prefixes) * len(cities)) + 1) if i >= len(prefixes) * len(cities) else '')
+             for i in range(count)]
+    names[1:4] = ['29CM(롯데본점)', '롯데영플대구close', '현대울산(동구)']
+    return names
+
+
+def _column_letter(index):
+    letters = ''
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+class SyntheticXlsx:
+    """Excel이 저장하는 것과 같은 구조로 xlsx를 스트리밍 작성한다.
+
+    openpyxl write-only 모드는 인라인 문자열을 쓰고 <dimension>을 생략하는데,
+    그러면 read-only 로드가 시트 크기를 알려고 시트 전체를 한 번 더 읽어 실제 파일과 측정값이 달라진다.
+    여기서는 공유 문자열(sharedStrings.xml), <dimension>, 날짜 서식(numFmtId 14) 셀을 쓴다.
+    """
+    EPOCH = datetime(1899, 12, 30)
+
+    def __init__(self, path):
+        self.zf = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED)
+        self.sheets = []
+        self.strings = {}
+
+    def _cell(self, ref, value):
+        if value is None:
+            return ''
+        if isinstance(value, bool):
+            return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+        if isinstance(value, (int, float)):
+            return f'<c r="{ref}"><v>{value!r}</v></c>'
+        if isinstance(value, datetime):
+            serial = (value - self.EPOCH).total_seconds() / 86400
+            return f'<c r="{ref}" s="1"><v>{serial:g}</v></c>'
+        index = self.strings.setdefault(str(value), len(self.strings))
+        return f'<c r="{ref}" t="s"><v>{index}</v></c>'
+
+    def write_sheet(self, name, rows, row_count, width):
+        """rows: 행(값 리스트) iterable, row_count/width: <dimension>에 쓸 전체 행 수/열 수"""
+        self.sheets.append(name)
+        columns = [_column_letter(c) for c in range(width)]
+        with self.zf.open(f'xl/worksheets/sheet{len(self.sheets)}.xml', 'w', force_zip64=True) as f:
+            f.write(('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                     f'<worksheet xmlns="{NS_MAIN}">'
+                     f'<dimension ref="A1:{columns[-1]}{max(row_count, 1)}"/><sheetData>').encode('utf-8'))
+            for r, row in enumerate(rows, start=1):
+                cells = ''.join(self._cell(f'{columns[c]}{r}', value) for c, value in enumerate(row))
+                f.write(f'<row r="{r}">{cells}</row>'.encode('utf-8'))
+            f.write(b'</sheetData></worksheet>')
+
+    def close(self):
+        sheet_entries = ''.join(f'<sheet name="{escape(name)}" sheetId="{i}" r:id="rId{i}"/>'
+                                for i, name in enumerate(self.sheets, start=1))
+        sheet_rels = ''.join(f'<Relationship Id="rId{i}" Type="{NS_REL}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+                             for i in range(1, len(self.sheets) + 1))
+        n = len(self.sheets)
+        self.zf.writestr('[Content_Types].xml', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            + ''.join(f'<Override PartName="/xl/worksheets/sheet{i}.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                      for i in range(1, n + 1)) +
+            '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            '<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+            '</Types>'))
+        self.zf.writestr('_rels/.rels', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f'<Relationship Id="rId1" Type="{NS_REL}/officeDocument" Target="xl/workbook.xml"/></Relationships>'))
+        self.zf.writestr('xl/workbook.xml', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            f'<workbook xmlns="{NS_MAIN}" xmlns:r="{NS_REL}"><sheets>{sheet_entries}</sheets></workbook>'))
+        self.zf.writestr('xl/_rels/workbook.xml.rels', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f'{sheet_rels}'
+            f'<Relationship Id="rId{n + 1}" Type="{NS_REL}/styles" Target="styles.xml"/>'
+            f'<Relationship Id="rId{n + 2}" Type="{NS_REL}/sharedStrings" Target="sharedStrings.xml"/>'
+            '</Relationships>'))
+        self.zf.writestr('xl/styles.xml', (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            f'<styleSheet xmlns="{NS_MAIN}">'
+            '<fonts count="1"><font><sz val="11"/><name val="맑은 고딕"/></font></fonts>'
+            '<fills count="1"><fill><patternFill patternType="none"/></fill></fills>'
+            '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+            '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+            '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+            '<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/></cellXfs>'
+            '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+            '</styleSheet>'))
+        with self.zf.open('xl/sharedStrings.xml', 'w', force_zip64=True) as f:
+            f.write(('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                     f'<sst xmlns="{NS_MAIN}" uniqueCount="{len(self.strings)}">').encode('utf-8'))
+            for value in self.strings:
+                f.write(f'<si><t xml:space="preserve">{escape(value)}</t></si>'.encode('utf-8'))
+            f.write(b'</sst>')
+        self.zf.close()
+
+
+def generate_workbook(path, scale, seed=SEED):
+    """scale배 규모의 합성 backdata.xlsx를 만든다."""
+    rng = random.Random(seed)
+    rows = {sheet: count * scale for sheet, count in BASE_ROWS.items()}
+    stores = store_names(max(BASE_ROWS['매장'], rows['매장']))
+    xlsx = SyntheticXlsx(path)
+
+    def sheet(name, headers, make_row):
+        width = len(headers[0])
+        body = (make_row(i) for i in range(rows[name]))
+        xlsx.write_sheet(name, itertools.chain(headers, body), len(headers) + rows[name], width)
+
+    sheet('매장', [['매장명', '형태', 'PY', '성명', '연락처 ', '생년월일', 'SM근무시작일', '등급', '층수']], lambda i: [
+        stores[i], rng.choice(['박스', '오픈']), round(rng.uniform(10, 60), 1), f'매니저{i}', '010-1234-5678',
+        datetime(1975 + i % 25, 1 + i % 12, 1 + i % 28), 2017.078045, rng.choice(['S', 'A', 'B']), f'{1 + i % 5}F'])
+
+    def item_season_row(i):
+        qty = rng.randint(0, 200)
+        return ([f'{i % len(stores):03d}', rng.choice(stores), rng.choice(ITEMS), rng.choice(SEASONS),
+                 qty, qty * 59000, qty * 69000, qty, qty * 59000, qty * 69000, -rng.randint(0, 5),
+                 -rng.randint(0, 300000), -rng.randint(0, 350000)]
+                + [rng.randint(0, 5 * 10 ** 6) for _ in MONTHS])
+    sheet('아이템시즌별판매', [['매장코드', '매장명', 'ITEM', '시즌', '판매수량', '판매액', '판매택가', '정상_판매수량',
+                          '정상_판매액', '정상_판매택가', '반품_판매수량', '반품_판매액', '반품_판매택가'] + MONTHS],
+          item_season_row)
+
+    def style_row(i):
+        style = rng.randint(0, 3000)
+        return [rng.choice(stores), f'3A{style:05d}', f'상품{style}', rng.randint(0, 10 ** 6),
+                rng.randint(0, 9), datetime(2025, 10, 1) + timedelta(days=rng.randint(0, 150)), rng.choice(SEASONS)]
+    sheet('매장별스타일판매', [['매장명', '품번', '제품명', '판매액', '판매수량', '일자', '시즌']], style_row)
+
+    sheet('매장별재고', [['시즌', '매장코드', '매장명', '매장재고수량', '매장재고택가']], lambda i: [
+        rng.choice(SEASONS), f'{i % len(stores):03d}', rng.choice(stores), rng.randint(0, 500), rng.randint(0, 3 * 10 ** 7)])
+
+    sheet('실적', [['매장코드', '판매시점', '매장명', '판매액']], lambda i: [
+        f'{i % len(stores):03d}', rng.choice(MONTHS + ['202601']), rng.choice(stores),
+        rng.choice([rng.randint(0, 3 * 10 ** 8), None])])
+
+    # 단체: B열 매장명, C열 판매월(YYYYMM), T열 판매액
+    def group_row(i):
+        row = [None] * 20
+        row[0], row[1], row[2] = i, rng.choice(stores), rng.choice(MONTHS)
+        row[19] = rng.choice([rng.randint(0, 5 * 10 ** 6), None])
+        return row
+    sheet('단체', [[f'항목{c + 1}' for c in range(20)]], group_row)
+
+    # 경쟁사: 1행 구간명('월평균(1~12월)' 병합), 2행 브랜드명, 3행부터 A열 백화점
+    sheet('경쟁사', [
+        ['백화점', '월평균(1~12월)'] + [None] * (len(BRANDS) - 1) + ['월 MS'] + [None] * (len(BRANDS) - 1) + ['비고'],
+        [None] + BRANDS + BRANDS + [None],
+    ], lambda i: ([stores[i % len(stores)] + (str(i // len(stores)) if i >= len(stores) else '')]
+                  + [rng.choice([rng.randint(0, 3 * 10 ** 8), None]) for _ in BRANDS]
+                  + [round(rng.random(), 3) for _ in BRANDS] + [None]))
+
+    xlsx.close()
+    return rows
+
+
+def run_job(excel_file, job_index, output_format, reader):
+    """(워커 프로세스) 추출기 하나를 빈 작업 디렉터리에서 실행하고 측정값을 반환한다."""
+    import update_data_unified
+
+    update_data_unified.OUTPUT_FORMAT = output_format
+    update_data_unified.PARSE_CACHE = 'off'  # 파싱 시간까지 측정한다
+    update_data_unified.XLSX_READER = reader
+    extractor, sheet_name, output_filename = update_data_unified.SHEET_JOBS[job_index]
+    os.makedirs(update_data_unified.DATA_DIR, exist_ok=True)
+    log = io.StringIO()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(log):
+        wb = update_data_unified.load_workbook(excel_file, streaming=True)
+        loaded = time.perf_counter()
+        try:
+            ok = extractor(wb, sheet_name, output_filename)
+        finally:
+            wb.close()
+    finished = time.perf_counter()
+
+    output_bytes = 0
+    for root, _, files in os.walk(update_data_unified.DATA_DIR):
+        output_bytes += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+
+    peak_rss = None
+    if resource is not None:
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak_rss *= 1 if sys.platform == 'darwin' else 1024  # Linux는 KB 단위
+    return {
+        'sheet': sheet_name,
+        'output': output_filename,
+        'ok': bool(ok),
+        'load_s': round(loaded - started, 4),
+        'extract_s': round(finished - loaded, 4),
+        'wall_s': round(finished - started, 4),
+        'peak_rss_bytes': peak_rss,
+        'output_bytes': output_bytes,
+    }
+
+
+def measure(excel_file, job_index, output_format, reader):
+    """추출기마다 새 프로세스를 띄워 최대 RSS가 다른 추출기와 섞이지 않게 한다."""
+    with tempfile.TemporaryDirectory(prefix='bench-') as work_dir:
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--run-job', excel_file, str(job_index),
+             '--format', output_format, '--reader', reader],
+            cwd=work_dir, capture_output=True, text=True, encoding='utf-8',
+            env=dict(os.environ, PYTHONPATH=SCRIPT_DIR + os.pathsep + os.environ.get('PYTHONPATH', '')),
+        )
+    if proc.returncode != 0:
+        raise RuntimeError(f"job {job_index} failed:\n{proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline, tolerance):
+    """(규모, 시트) 별로 이전 결과와 소요 시간을 비교하고 허용치를 넘은 항목 목록을 반환한다."""
+    previous = {(r['scale'], r['sheet']): r for r in baseline.get('results', [])}
+    regressions = []
+    print(f"\n이전 결과와 비교 (허용치 +{tolerance:.0%}):")
+    for r in results:
+        old = previous.get((r['scale'], r['sheet']))
+        if not old or not old.get('wall_s'):
+            continue
+        change = r['wall_s'] / old['wall_s'] - 1
+        flag = ''
+        if change > tolerance:
+            regressions.append(r)
+            flag = '  <-- 느려짐'
+        print(f"  {r['scale']:>4}x  {r['sheet']:<12} {old['wall_s']:8.2f}s -> {r['wall_s']:8.2f}s ({change:+.0%}){flag}")
+    return regressions
+
+
+def format_bytes(size):
+    if size is None:
+        return '-'
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024 or unit == 'GB':
+            return f"{size:.1f}{unit}" if unit != 'B' else f"{size}B"
+        size /= 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description='backdata.xlsx -> JSON 파이프라인 벤치마크')
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES, help='워크북 규모 배수 (기본: 1 10 100)')
+    parser.add_argument('--sheets', nargs='+', default=None, help='측정할 시트 (기본: 전체)')
+    parser.add_argument('--format', choices=['rows', 'columnar'], default='rows', help='표 형식 출력 포맷')
+    parser.add_argument('--reader', choices=['native', 'openpyxl'], default='native', help='xlsx 리더')
+    parser.add_argument('--regenerate', action='store_true', help='저장된 합성 워크북을 다시 생성')
+    parser.add_argument('--output', default=None, help='결과 JSON 경로 (기본: .cache/bench/bench-<시각>.json)')
+    parser.add_argument('--baseline', default=None, help='비교할 이전 결과 JSON')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='느려짐 허용 비율 (기본 0.25 = +25%%)')
+    parser.add_argument('--run-job', nargs=2, metavar=('XLSX', 'JOB_INDEX'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_job:
+        print(json.dumps(run_job(args.run_job[0], int(args.run_job[1]), args.format, args.reader), ensure_ascii=False))
+        return 0
+
+    sys.path.insert(0, SCRIPT_DIR)
+    from update_data_unified import SHEET_JOBS
+
+    os.makedirs(BENCH_DIR, exist_ok=True)
+    jobs = [idx for idx, (_, sheet, _) in enumerate(SHEET_JOBS) if not args.sheets or sheet in args.sheets]
+    results = []
+    for scale in args.scales:
+        excel_file = os.path.join(BENCH_DIR, f'backdata_x{scale}.xlsx')
+        if args.regenerate or not os.path.exists(excel_file):
+            started = time.perf_counter()
+            print(f"\n[{scale}x] 합성 워크북 생성 중... ", end='', flush=True)
+            generate_workbook(excel_file, scale)
+            print(f"{time.perf_counter() - started:.1f}s ({format_bytes(os.path.getsize(excel_file))})")
+
+        print(f"\n[{scale}x] {os.path.basename(excel_file)}")
+        print(f"  {'시트':<12} {'전체':>9} {'로드':>8} {'추출':>9} {'최대 RSS':>10} {'출력':>10}")
+        for idx in jobs:
+            r = measure(excel_file, idx, args.format, args.reader)
+            r['scale'] = scale
+            results.append(r)
+            status = '' if r['ok'] else '  (skipped/failed)'
+            print(f"  {r['sheet']:<12} {r['wall_s']:8.2f}s {r['load_s']:7.2f}s {r['extract_s']:8.2f}s "
+                  f"{format_bytes(r['peak_rss_bytes']):>10} {format_bytes(r['output_bytes']):>10}{status}")
+
+    output_path = args.output or os.path.join(BENCH_DIR, f"bench-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'format': args.format,
+            'reader': args.reader,
+            'base_rows': BASE_ROWS,
+            'results': results,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output_path}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)}개 추출기가 허용치보다 느려졌습니다.")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+public/data 증분 빌드 캐시.
+
+시트 내용 지문 + 추출기 버전 + 출력 옵션으로 키를 만들고,
+키가 이전 실행과 같고 출력 파일이 남아 있으면 해당 시트 추출을 건너뛴다.
+"""
+import hashlib
+import json
+import os
+
+from xlsx_stream import sheet_fingerprints
+
+CACHE_PATH = os.path.join('.cache', 'build_cache.json')
+
+
+def file_digest(path):
+    """파일 내용 해시 (추출 스크립트 버전으로 사용: 코드가 바뀌면 캐시가 무효화된다)"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class BuildCache:
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        self.data = {'sheets': {}, 'outputs': {}}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    loaded = json.load(f)
+                self.data['sheets'] = loaded.get('sheets', {})
+                self.data['outputs'] = loaded.get('outputs', {})
+            except (OSError, ValueError) as e:
+                print(f"Warning: ignoring unreadable build cache {path}: {e}")
+
+    def sheet_fingerprints(self, excel_file):
+        """시트명 -> 내용 해시. 원본 XML이 그대로인 시트는 이전 해시를 재사용한다."""
+        fingerprints = sheet_fingerprints(excel_file, known=self.data['sheets'])
+        self.data['sheets'] = fingerprints
+        return {name: fp['content'] for name, fp in fingerprints.items()}
+
+    @staticmethod
+    def make_key(sheet_fingerprint, extractor_version, *options):
+        payload = json.dumps([sheet_fingerprint, extractor_version, *options], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _stat(output_path):
+        st = os.stat(output_path)
+        return [st.st_size, st.st_mtime_ns]
+
+    def is_fresh(self, output_path, key):
+        """같은 키로 만든 출력 파일이 그대로 남아 있는지.
+        다른 스크립트가 같은 파일을 덮어썼을 수 있으므로 크기/수정시각도 비교한다."""
+        entry = self.data['outputs'].get(os.path.abspath(output_path))
+        if not entry or entry.get('key') != key or not os.path.exists(output_path):
+            return False
+        return entry.get('stat') == self._stat(output_path)
+
+    def record(self, output_path, key):
+        self.data['outputs'][os.path.abspath(output_path)] = {'key': key, 'stat': self._stat(output_path)}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
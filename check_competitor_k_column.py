@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
-import openpyxl
+import workbook_cache
 
 excel_file = 'backdata.xlsx'
 
 try:
-    workbook = openpyxl.load_workbook(excel_file, data_only=True)
+    workbook = workbook_cache.load_workbook(excel_file, data_only=True)
     sheet = workbook['경쟁사']
     
     print("K열 (11번 컬럼) 데이터 확인:")
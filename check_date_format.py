@@ -1,6 +1,6 @@
-import openpyxl
+import workbook_cache
 
-wb = openpyxl.load_workbook('backdata.xlsx', data_only=True)
+wb = workbook_cache.load_workbook('backdata.xlsx', data_only=True)
 sheet = wb['단체']
 
 print("=== 더현대서울의 모든 행 확인 ===")
@@ -1,6 +1,6 @@
-import openpyxl
+import workbook_cache
 
-wb = openpyxl.load_workbook('backdata.xlsx', data_only=True)
+wb = workbook_cache.load_workbook('backdata.xlsx', data_only=True)
 sheet = wb['경쟁사']
 
 # Row 1에서 "월평균"이 있는 컬럼 찾기
@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
-import openpyxl
+import workbook_cache
 
 excel_file = 'backdata.xlsx'
 
 try:
-    workbook = openpyxl.load_workbook(excel_file, data_only=True)
+    workbook = workbook_cache.load_workbook(excel_file, data_only=True)
     sheet = workbook['경쟁사']
     
     print("Row 1에서 '월평균' 헤더 찾기:")
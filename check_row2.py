@@ -1,6 +1,6 @@
-import openpyxl
+import workbook_cache
 
-wb = openpyxl.load_workbook('backdata.xlsx')
+wb = workbook_cache.load_workbook('backdata.xlsx')
 sheet = wb['경쟁사']
 
 print("=== Row 2 전체 확인 (컬럼 11번부터 30번까지) ===")
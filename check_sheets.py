@@ -1,7 +1,7 @@
-import openpyxl
+import workbook_cache
 
 excel_file = 'backdata.xlsx'
-workbook = openpyxl.load_workbook(excel_file)
+workbook = workbook_cache.load_workbook(excel_file)
 
 print("사용 가능한 모든 시트:")
 for idx, sheet_name in enumerate(workbook.sheetnames, 1):
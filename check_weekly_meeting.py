@@ -1,11 +1,11 @@
-import openpyxl
+import workbook_cache
 import json
 
 excel_file = 'backdata.xlsx'
 sheet_name = '주간회의'
 
 try:
-    workbook = openpyxl.load_workbook(excel_file)
+    workbook = workbook_cache.load_workbook(excel_file)
     
     print(f"사용 가능한 시트: {workbook.sheetnames}")
     
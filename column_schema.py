@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+시트 열 스키마: 시트마다 열 -> 변환 종류를 선언해 두고, 실제 헤더에 맞춰 열별 변환 함수로 컴파일한다.
+
+추출기가 셀마다 format_date / normalize_store_name / float()을 부르던 것을 스키마 하나로 모은다.
+- 변환 함수는 열마다 따로 만들고 같은 값의 결과를 기억한다 (매장명, 시즌, 일자처럼 반복되는 값은 한 번만 변환).
+- 기억한 문자열 결과는 시트(compile 한 번)마다 둔 문자열 풀로 같은 객체를 공유한다. 수백 개 매장명/시즌이
+  행마다 새 문자열로 생기지 않아 행을 모아 두는 columnar 출력에서 메모리가 줄어든다.
+  풀에는 기억하는 값의 결과만 넣으므로 크기가 기억 상한을 넘지 않고, 시트를 다 읽으면 함께 버려진다.
+- 기억은 종류마다 정한 타입(str/int/datetime 중)의 값만 한다. 1, 1.0, True는 서로 같은 키로 취급되므로
+  타입을 섞어 기억하면 결과가 바뀔 수 있다 (float/bool은 매번 변환한다). 금액처럼 값이 제각각인 숫자도 기억하지 않는다.
+
+변환 종류 (SheetSchema columns/default에 쓰는 값, 또는 값 하나를 받는 함수):
+  RAW         그대로
+  DATE        datetime -> 'YYYY-MM-DD', 나머지는 그대로 (format_date)
+  CATEGORY    DATE와 같고, 문자열은 공유 객체로
+  TEXT        str(값).strip() (빈 셀은 호출 전에 거른다)
+  STORE_NAME  normalize_store_name
+  NUMBER      float(값). None이나 숫자로 바꿀 수 없는 값은 0
+  DAY         parse_date (date 또는 None)
+"""
+import re
+from datetime import date, datetime
+
+from store_registry import normalize_store_name
+
+RAW, DATE, CATEGORY, TEXT, STORE_NAME, NUMBER, DAY = 'raw', 'date', 'category', 'text', 'store_name', 'number', 'day'
+MAX_MEMO_ENTRIES = 1 << 16  # 열 하나가 기억하는 값 수 상한 (넘으면 새 값은 기억하지 않고 변환만 한다)
+
+
+def format_date(value):
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d')
+    return value
+
+_DATE_RE = re.compile(r'^\s*(\d{4})([-./])(\d{1,2})\2(\d{1,2})(?:[ T].*)?$')
+_COMPACT_DATE_RE = re.compile(r'^\s*(\d{4})(\d{2})(\d{2})\s*$')
+
+def parse_date(value):
+    """셀 값 -> date. datetime/date 셀, 'YYYY-MM-DD'('.', '/' 구분자, 뒤에 시각 허용), YYYYMMDD 숫자/문자열을
+    받는다. 날짜로 해석할 수 없으면 None."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        if value != int(value):
+            return None
+        value = str(int(value))
+    match = _DATE_RE.match(value) if isinstance(value, str) else None
+    if match:
+        parts = match.group(1), match.group(3), match.group(4)
+    else:
+        match = _COMPACT_DATE_RE.match(value) if isinstance(value, str) else None
+        if not match:
+            return None
+        parts = match.groups()
+    try:
+        return date(*(int(part) for part in parts))
+    except ValueError:
+        return None
+
+
+def _text(value):
+    return str(value).strip()
+
+
+def _number(value):
+    if value is None:
+        return 0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+# 변환 종류 -> (변환 함수, 결과를 기억할 입력 타입, 그 밖의 타입은 변환 없이 그대로인지)
+_KINDS = {
+    DATE: (format_date, (datetime,), True),
+    CATEGORY: (format_date, (str, datetime), True),
+    TEXT: (_text, (str, int), False),
+    STORE_NAME: (normalize_store_name, (str, int), False),
+    NUMBER: (_number, (str,), False),
+    DAY: (parse_date, (str, int, datetime), False),
+}
+_DEFAULT_MEMO_TYPES = (str, int, datetime)
+
+
+def memoized(convert, types=_DEFAULT_MEMO_TYPES, passthrough=False, max_entries=MAX_MEMO_ENTRIES, pool=None):
+    """convert를 types 값별로 기억하는 변환 함수. 기억하는 문자열 결과는 pool(없으면 열마다 새로)의 객체로 바꾼다.
+    passthrough면 types 밖의 값은 convert를 부르지 않고 그대로 돌려준다 (숫자 셀이 대부분인 DATE 열)."""
+    cache = {}
+    types = frozenset(types)
+    pool = {} if pool is None else pool
+
+    def converter(value):
+        if type(value) not in types:
+            return value if passthrough else convert(value)
+        try:
+            return cache[value]
+        except KeyError:
+            result = convert(value)
+            if len(cache) < max_entries:
+                if type(result) is str:
+                    result = pool.setdefault(result, result)
+                cache[value] = result
+            return result
+
+    converter.cache = cache
+    return converter
+
+
+def converter(kind, pool=None):
+    """변환 종류(또는 함수) -> 새 변환 함수. RAW는 None (그대로 쓰면 된다). pool은 memoized와 같다."""
+    if kind == RAW:
+        return None
+    if callable(kind):
+        return memoized(kind, pool=pool)
+    if kind not in _KINDS:
+        raise ValueError(f'unknown column kind {kind!r}')
+    return memoized(*_KINDS[kind], pool=pool)
+
+
+class SheetSchema:
+    """시트 열 스키마. columns: 헤더 이름(또는 0부터 센 열 위치) -> 변환 종류, 나머지 열은 default."""
+
+    def __init__(self, columns=None, default=RAW):
+        self.columns = dict(columns or {})
+        self.default = default
+
+    def kind_of(self, position, header):
+        if header in self.columns:
+            return self.columns[header]
+        return self.columns.get(position, self.default)
+
+    def compile(self, headers):
+        """헤더 순서대로 열별 변환 함수 목록 (RAW 열은 None). 시트를 읽을 때마다 새로 만든다.
+        열들이 문자열 풀 하나를 함께 쓰고, 변환 함수를 버리면 풀도 같이 버려진다."""
+        pool = {}
+        return [converter(self.kind_of(position, header), pool) for position, header in enumerate(headers)]
+
+    def column(self, key):
+        """열 하나(헤더 이름 또는 위치)의 변환 함수. RAW 열도 호출할 수 있게 항등 함수를 돌려준다."""
+        return converter(self.columns.get(key, self.default)) or (lambda value: value)
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+경쟁사 브랜드 순위: 백화점 × 브랜드 월평균 행렬에서 순위를 한 번에 계산해 둔다.
+
+- 점포별 브랜드 순위: 점포 안에서 월평균이 0보다 큰 브랜드를 내림차순으로 (ReportPage, 비교 인사이트)
+- 브랜드별 점포 순위: 브랜드마다 월평균이 0보다 큰 점포를 내림차순으로 (read_competitor_final.py의 brand_rankings)
+- MLB 점유율(점포 브랜드 합계 대비)과 직전 경쟁사 데이터 대비 순위 변동
+
+순위 변동의 기준(직전 데이터의 점포 내 순위)은 순위 파일에 source_sha256(순위 입력 해시)과 함께 남긴다.
+같은 데이터로 다시 내보내면(--force, 캐시 무효화, --full-load) 저장해 둔 기준을 그대로 쓰고,
+경쟁사 데이터가 바뀐 경우에만 직전 내보내기의 순위가 새 기준이 된다.
+
+동점이면 먼저 나온 브랜드/점포가 앞선다 (클라이언트의 안정 정렬과 같은 순서).
+"""
+import hashlib
+import json
+import os
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 순수 파이썬으로 같은 값을 계산한다
+    np = None
+
+RANKINGS_FILENAME = 'competitor_rankings.json'
+MLB = 'MLB'
+
+
+def _rank_matrix(matrix, axis):
+    """값이 0보다 큰 칸의 내림차순 순위(1부터). 0 이하인 칸은 0. axis=1이면 행(점포) 안, 0이면 열(브랜드) 안."""
+    if np is not None:
+        values = np.asarray(matrix, dtype=np.float64).reshape(len(matrix), -1)
+        order = np.argsort(-values, axis=axis, kind='stable')
+        ranks = np.empty_like(order)
+        positions = np.arange(1, values.shape[axis] + 1)
+        if axis == 1:
+            np.put_along_axis(ranks, order, np.broadcast_to(positions, values.shape), axis=1)
+        else:
+            np.put_along_axis(ranks, order, np.broadcast_to(positions[:, None], values.shape), axis=0)
+        return np.where(values > 0, ranks, 0).tolist()
+
+    rows, cols = len(matrix), len(matrix[0]) if matrix else 0
+    ranks = [[0] * cols for _ in range(rows)]
+    lines = [[(r, c) for c in range(cols)] for r in range(rows)] if axis == 1 else \
+        [[(r, c) for r in range(rows)] for c in range(cols)]
+    for line in lines:
+        ordered = sorted(line, key=lambda rc: -matrix[rc[0]][rc[1]])
+        for position, (r, c) in enumerate(ordered, start=1):
+            if matrix[r][c] > 0:
+                ranks[r][c] = position
+    return ranks
+
+
+def _rank_table(ranks):
+    """{(백화점, 브랜드): 순위} -> 파일에 쓰는 {백화점: {브랜드: 순위}}"""
+    table = {}
+    for (store, brand), rank in ranks.items():
+        table.setdefault(store, {})[brand] = rank
+    return table
+
+
+def source_digest(stores_data, brands):
+    """순위 입력(점포 순서, 브랜드, 월평균 행렬)의 해시"""
+    h = hashlib.sha256()
+    h.update(json.dumps(list(brands), ensure_ascii=False).encode('utf-8'))
+    for store in stores_data:
+        h.update(json.dumps([store['백화점'], [store['브랜드별_월평균'].get(brand, 0) for brand in brands]],
+                            ensure_ascii=False).encode('utf-8'))
+    return h.hexdigest()
+
+
+def load_previous(data_dir):
+    """이전 내보내기 -> {'source_sha256', 'ranks': 그때의 순위, 'baseline': 그때 순위 변동의 기준}
+    ranks/baseline은 {(백화점, 브랜드): 점포 내 순위}. 없거나 읽을 수 없으면 빈 dict."""
+    path = os.path.join(data_dir, RANKINGS_FILENAME)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {
+        'source_sha256': previous.get('source_sha256'),
+        'ranks': {(entry['백화점'], item['브랜드']): item['순위']
+                  for entry in previous.get('store_rankings', []) for item in entry.get('brands', [])},
+        'baseline': {(store, brand): rank for store, ranks in (previous.get('previous_ranks') or {}).items()
+                     for brand, rank in ranks.items()},
+    }
+
+
+def build_competitor_rankings(stores_data, brands, previous=None):
+    """process_competitor의 점포 목록({'백화점', '브랜드별_월평균', '매장ID'}) -> 순위 dict. 점포가 없으면 None.
+
+    previous: load_previous()의 결과. 있으면 점포 내 순위 변동(기준 순위 - 현재 순위, 오르면 양수)을 채운다.
+    입력이 이전 내보내기와 같으면 그때의 기준을, 다르면 이전 내보내기의 순위를 기준으로 쓴다.
+    """
+    if not stores_data or not brands:
+        return None
+    brands = list(dict.fromkeys(brands))
+    digest = source_digest(stores_data, brands)
+    previous = previous or {}
+    if previous.get('source_sha256') == digest:
+        baseline = previous.get('baseline', {})
+    else:
+        baseline = previous.get('ranks', {})
+    matrix = [[store['브랜드별_월평균'].get(brand, 0) for brand in brands] for store in stores_data]
+    in_store = _rank_matrix(matrix, axis=1)
+    in_brand = _rank_matrix(matrix, axis=0)
+    mlb = brands.index(MLB) if MLB in brands else None
+
+    store_rankings = []
+    for r, store in enumerate(stores_data):
+        name = store['백화점']
+        ranked = sorted((in_store[r][c], c) for c in range(len(brands)) if in_store[r][c])
+        total = sum(v for v in matrix[r] if v > 0)
+        items = []
+        for rank, c in ranked:
+            before = baseline.get((name, brands[c]))
+            items.append({'브랜드': brands[c], '월평균': matrix[r][c], '순위': rank,
+                          '순위변동': before - rank if before else None})
+        mlb_rank = in_store[r][mlb] if mlb is not None and in_store[r][mlb] else None
+        store_rankings.append({
+            '백화점': name,
+            '매장ID': store.get('매장ID'),
+            'brands': items,
+            'mlb_rank': mlb_rank,
+            'mlb_share': round(matrix[r][mlb] / total, 4) if mlb_rank and total > 0 else 0,
+            'mlb_rank_delta': items[mlb_rank - 1]['순위변동'] if mlb_rank else None,
+        })
+
+    brand_rankings = {}
+    for c, brand in enumerate(brands):
+        ranked = sorted((in_brand[r][c], r) for r in range(len(stores_data)) if in_brand[r][c])
+        brand_rankings[brand] = [{'백화점': stores_data[r]['백화점'], '월평균': matrix[r][c], '순위': rank}
+                                 for rank, r in ranked]
+
+    return {
+        'format': 'competitor_rankings',
+        'brands': brands,
+        'store_rankings': store_rankings,  # competitor_data_v2.json의 stores와 같은 순서
+        'brand_rankings': brand_rankings,
+        'source_sha256': digest,
+        'previous_ranks': _rank_table(baseline),  # 순위변동의 기준 (같은 데이터로 다시 내보낼 때 그대로 쓴다)
+    }
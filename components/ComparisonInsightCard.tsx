@@ -2,6 +2,7 @@ import React, { useState, useEffect, useMemo } from 'react';
 import { StoreData } from '../types';
 import { findSimilarStores } from '../utils/similarStoreAnalyzer';
 import { getComparisonInsights } from '../services/comparisonInsightService';
+import type { StyleRankings } from '../utils/styleRankings';
 
 interface ComparisonInsightCardProps {
   targetStore: StoreData;
@@ -10,6 +11,7 @@ interface ComparisonInsightCardProps {
   inventoryData: any;
   competitorData: any;
   storeStyleSalesData: any;
+  styleRankings?: StyleRankings | null;
 }
 
 const ComparisonInsightCard: React.FC<ComparisonInsightCardProps> = ({
@@ -18,7 +20,8 @@ const ComparisonInsightCard: React.FC<ComparisonInsightCardProps> = ({
   itemSeasonData,
   inventoryData,
   competitorData,
-  storeStyleSalesData
+  storeStyleSalesData,
+  styleRankings = null
 }) => {
   const [insight, setInsight] = useState<string>('');
   const [loading, setLoading] = useState<boolean>(false);
@@ -52,7 +55,8 @@ const ComparisonInsightCard: React.FC<ComparisonInsightCardProps> = ({
         inventoryData,
         competitorData,
         storeStyleSalesData,
-        itemSeasonData
+        itemSeasonData,
+        styleRankings
       );
       setInsight(result);
     } catch (e) {
@@ -11,7 +11,7 @@ import {
   CartesianGrid
 } from 'recharts';
 import { dataService } from '../services/dataService';
-import { getCompetitorSearchNames } from '../utils/competitorStoreMapping';
+import { getCompetitorSearchNames, getStoreBrandRanking } from '../utils/competitorStoreMapping';
 
 interface ItemSeasonData {
   매장코드: string;
@@ -275,20 +275,8 @@ const ReportPage: React.FC<ReportPageProps> = ({
                     store.백화점.includes(alias) || alias.includes(store.백화점)
                   );
 
-                // 해당 점포의 브랜드별 데이터를 순위대로 정렬
-                const brandRankings = Object.entries(store.브랜드별_월평균)
-                  .filter(([_, value]) => Number(value) > 0) // 0보다 큰 값만
-                  .map(([brandName, monthlyAvg]) => ({
-                    브랜드: brandName,
-                    월평균: Number(monthlyAvg),
-                    순위: 0 // 나중에 할당
-                  }))
-                  .sort((a, b) => Number(b.월평균) - Number(a.월평균)); // 월평균 내림차순 정렬
-
-                // 순위 할당
-                brandRankings.forEach((item, idx) => {
-                  item.순위 = idx + 1;
-                });
+                // 해당 점포의 브랜드별 순위 (월평균 0보다 큰 브랜드, 내림차순)
+                const brandRankings = getStoreBrandRanking(competitorData, store);
 
                 if (brandRankings.length === 0) return null;
 
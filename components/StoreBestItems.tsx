@@ -1,5 +1,7 @@
 import React, { useMemo, useState, useEffect } from 'react';
 import { dataService } from '../services/dataService';
+import { selectStoreRows } from '../utils/storeRegistry';
+import { findStyleRanking, StyleRankings } from '../utils/styleRankings';
 
 interface StoreStyleSalesData {
   매장코드: string;
@@ -20,19 +22,26 @@ interface StoreStyleSalesDataJson {
 interface StoreBestItemsProps {
   selectedStoreName: string;
   data: StoreStyleSalesDataJson | null;
+  rankings?: StyleRankings | null;
 }
 
-const StoreBestItems: React.FC<StoreBestItemsProps> = ({ selectedStoreName, data }) => {
+const StoreBestItems: React.FC<StoreBestItemsProps> = ({ selectedStoreName, data, rankings = null }) => {
   // useEffect removed as data is passed as prop
 
 
   // 선택한 매장의 BEST 5 아이템 계산 (품번과 제품명 기준)
   const bestItems = useMemo(() => {
+    // 미리 계산된 순위가 있으면 그대로 사용 (style_rankings.json)
+    const ranking = findStyleRanking(rankings, selectedStoreName);
+    if (ranking) {
+      return ranking.sales.slice(0, 5).map((item, index) => ({ 순위: index + 1, ...item }));
+    }
+
     if (!selectedStoreName || !data) {
       return [];
     }
 
-    const storeItems = data.data.filter((item: StoreStyleSalesData) => {
+    const storeItems = selectStoreRows(data.data, selectedStoreName, (item: StoreStyleSalesData) => {
       const itemStoreName = item.매장명 || '';
 
       // 1. Exact match
@@ -84,7 +93,7 @@ const StoreBestItems: React.FC<StoreBestItemsProps> = ({ selectedStoreName, data
         판매수량: item.판매수량,
         판매금액: item.판매금액
       }));
-  }, [data, selectedStoreName]);
+  }, [data, rankings, selectedStoreName]);
 
   if (bestItems.length === 0) {
     return (
@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+"""
+로컬 데이터 API 서버: public/data에 내보낸 표를 한 번 읽어 색인해 두고,
+대시보드가 화면에 필요한 매장/기간의 행만 받아가게 한다.
+
+    python data_server.py [--port 8787] [--data-dir public/data]
+    (대시보드는 VITE_DATA_API_URL=http://localhost:8787 로 띄우면 이 서버를 쓴다)
+
+- GET /api/datasets                          표 목록 (열, 행 수, 색인 종류)
+- GET /api/<dataset>?store=<매장ID|매장명>&from=YYYY-MM&to=YYYY-MM
+    store는 store_registry 기준 같은 매장의 모든 표기(정적 매장 샤드와 같은 범위)의 행을 고른다.
+    여러 번 줄 수 있고, 기간은 일자/판매시점이 있는 표만.
+    응답은 정적 파일과 같은 { headers, data, total_rows } 모양이다.
+- GET /data/<파일>                           public/data 정적 파일 (대시보드의 나머지 요청용)
+    assets/ 아래 내용 해시 이름 파일(publish_artifacts.py)은 영구 캐시로 보내고,
+    미리 압축한 .br/.gz가 있으면 (update_data_unified.py --precompress) 압축하지 않고 그대로 보낸다.
+
+응답은 ETag(If-None-Match면 304)와 gzip(Accept-Encoding)을 지원하고,
+인코딩한 본문은 LRU로 재사용한다. 내보낸 파일이 바뀌면 다음 요청에서 색인을 다시 만든다.
+요청마다 스레드 하나(ThreadingHTTPServer)이며 색인은 만든 뒤 바꾸지 않으므로 잠금 없이 읽는다.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from publish_artifacts import ASSET_DIR, ENCODING_SUFFIXES
+from store_registry import REGISTRY_FILENAME, STORE_ID_KEY, canonical_store_name, store_id_for
+from update_data_unified import DATA_DIR, read_table
+
+DEFAULT_PORT = 8787
+
+# 서버가 색인하는 표: 데이터셋 -> 기간 열 ('일자'는 YYYY-MM-DD, '판매시점'은 YYYYMM)
+TABLE_DATASETS = {
+    'store_data': None,
+    'item_season_data': None,
+    'store_inventory_data': None,
+    'store_style_sales_data': '일자',
+    'performance_data': '판매시점',
+}
+
+RELOAD_CHECK_INTERVAL = 2.0  # 초. 이 간격으로만 내보낸 파일의 변경을 확인한다
+RESPONSE_CACHE_BYTES = 256 << 20  # 인코딩해 둔 응답 본문 합계 상한
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+def period_of(value, column):
+    """행의 기간 값 -> 'YYYY-MM'. 알 수 없으면 None"""
+    if value is None:
+        return None
+    text = str(value)
+    if column == '판매시점':
+        return f'{text[:4]}-{text[4:6]}' if len(text) >= 6 and text[:6].isdigit() else None
+    return text[:7] if len(text) >= 7 and text[4] == '-' else None
+
+
+class TableIndex:
+    """표 하나의 행과 매장ID/기간 -> 행 번호 색인"""
+
+    def __init__(self, name, headers, rows, period_column):
+        self.name = name
+        self.headers = headers
+        self.rows = rows
+        self.period_column = period_column
+        self.by_store, self.by_period = {}, {}
+        for i, row in enumerate(rows):
+            store_id = row.get(STORE_ID_KEY)
+            if store_id:
+                self.by_store.setdefault(store_id, []).append(i)
+            if period_column:
+                period = period_of(row.get(period_column), period_column)
+                if period:
+                    self.by_period.setdefault(period, []).append(i)
+        self.periods = sorted(self.by_period)
+
+    def select(self, store_ids=None, date_from=None, date_to=None):
+        """조건에 맞는 행 (원래 순서). 조건이 없으면 전체"""
+        selected = None
+        if store_ids is not None:
+            selected = set()
+            for store_id in store_ids:
+                selected.update(self.by_store.get(store_id, ()))
+        if self.period_column and (date_from or date_to):
+            in_range = set()
+            for period in self.periods:
+                if (not date_from or period >= date_from) and (not date_to or period <= date_to):
+                    in_range.update(self.by_period[period])
+            selected = in_range if selected is None else selected & in_range
+        if selected is None:
+            return self.rows
+        return [self.rows[i] for i in sorted(selected)]
+
+    def describe(self):
+        return {'headers': self.headers, 'total_rows': len(self.rows), 'stores': len(self.by_store),
+                'period_column': self.period_column, 'periods': self.periods}
+
+
+class DataSnapshot:
+    """한 시점의 내보낸 파일 색인. 만든 뒤에는 바꾸지 않는다."""
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self.version = snapshot_version(data_dir)
+        self.tables = {}
+        for name, period_column in TABLE_DATASETS.items():
+            headers, rows = read_table(f'{name}.json', data_dir)
+            if headers:
+                self.tables[name] = TableIndex(name, headers, rows, period_column)
+        self.aliases = {}
+        registry_path = os.path.join(data_dir, REGISTRY_FILENAME)
+        if os.path.exists(registry_path):
+            with open(registry_path, 'r', encoding='utf-8') as f:
+                registry = json.load(f)
+            self.aliases = dict(registry.get('aliases', {}))
+            self.aliases.update({store_id: store_id for store_id in registry.get('stores', {})})
+
+    def resolve_store(self, value):
+        """매장ID, 원본 매장명, 표준 매장명 어느 것이든 매장ID로"""
+        store_id = self.aliases.get(value)
+        if store_id:
+            return store_id
+        canonical, _ = canonical_store_name(value)
+        return store_id_for(canonical) if canonical else None
+
+
+def snapshot_version(data_dir):
+    """색인에 쓰는 파일들의 (크기, 수정시각)으로 만든 버전 문자열"""
+    h = hashlib.sha1()
+    for name in sorted(list(TABLE_DATASETS) + [os.path.splitext(REGISTRY_FILENAME)[0]]):
+        path = os.path.join(data_dir, f'{name}.json')
+        if os.path.exists(path):
+            st = os.stat(path)
+            h.update(f'{name}:{st.st_size}:{st.st_mtime_ns};'.encode('utf-8'))
+    return h.hexdigest()[:16]
+
+
+class ResponseCache:
+    """(키) -> [ETag, 본문, gzip 본문] LRU. 본문 합계가 max_bytes를 넘으면 오래된 것부터 버린다.
+    gzip 본문은 처음 요청될 때 만든다."""
+
+    def __init__(self, max_bytes=RESPONSE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def put(self, key, entry):
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= len(previous[1])
+            self.entries[key] = entry
+            self.total_bytes += len(entry[1])
+            while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+                _, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= len(evicted[1])
+
+
+class DataStore:
+    """현재 스냅샷과 응답 캐시. 내보낸 파일이 바뀌면 스냅샷을 새로 만들어 통째로 바꾼다."""
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self.snapshot = DataSnapshot(data_dir)
+        self.responses = ResponseCache()
+        self.reload_lock = threading.Lock()
+        self.checked_at = time.monotonic()
+
+    def current(self):
+        now = time.monotonic()
+        if now - self.checked_at >= RELOAD_CHECK_INTERVAL and self.reload_lock.acquire(blocking=False):
+            try:
+                self.checked_at = now
+                if snapshot_version(self.data_dir) != self.snapshot.version:
+                    started = time.perf_counter()
+                    try:
+                        self.snapshot = DataSnapshot(self.data_dir)
+                    except (OSError, ValueError) as e:
+                        # 내보내기가 아직 파일을 쓰는 중이면 이전 색인을 유지하고 다음 확인 때 다시 시도한다
+                        print(f'Warning: keeping previous index, reload failed: {e}')
+                    else:
+                        print(f'Reloaded {self.data_dir} ({time.perf_counter() - started:.2f}s)')
+            finally:
+                self.reload_lock.release()
+        return self.snapshot
+
+    def encoded(self, key, etag, build):
+        """캐시에 있으면 그대로, 없으면 build()로 본문(bytes)을 만들어 넣는다 -> [ETag, 본문, gzip 본문]"""
+        entry = self.responses.get(key)
+        if entry is None or entry[0] != etag:
+            entry = [etag, build(), None]
+            self.responses.put(key, entry)
+        return entry
+
+
+def _json_bytes(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class DataRequestHandler(BaseHTTPRequestHandler):
+    server_version = 'SmartFieldData/1.0'
+    protocol_version = 'HTTP/1.1'
+    store = None  # DataStore (make_server에서 지정)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_OPTIONS(self):
+        self.send_response(HTTPStatus.NO_CONTENT)
+        self._cors()
+        self.send_header('Access-Control-Allow-Headers', 'If-None-Match')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        path = unquote(parts.path)
+        snapshot = self.store.current()
+        if path == '/api/datasets':
+            etag = f'"{snapshot.version}"'
+            if self._not_modified(etag):
+                return
+            entry = self.store.encoded(('datasets',), etag, lambda: _json_bytes(
+                {name: table.describe() for name, table in snapshot.tables.items()}))
+            return self._send(entry, 'application/json; charset=utf-8')
+        if path.startswith('/api/'):
+            return self._table(snapshot, path[len('/api/'):], parse_qs(parts.query))
+        if path.startswith('/data/'):
+            return self._static(path[len('/data/'):])
+        self._error(HTTPStatus.NOT_FOUND, 'not found')
+
+    def _table(self, snapshot, name, query):
+        table = snapshot.tables.get(name)
+        if table is None:
+            return self._error(HTTPStatus.NOT_FOUND, f'unknown dataset {name!r}')
+        store_ids = sorted({snapshot.resolve_store(value) for value in query.get('store', [])} - {None}) \
+            if 'store' in query else None
+        date_from = (query.get('from') or [None])[0]
+        date_to = (query.get('to') or [None])[0]
+        key = (name, snapshot.version, tuple(store_ids) if store_ids is not None else None, date_from, date_to)
+        etag = '"' + hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:20] + '"'
+
+        def build():
+            data = table.select(store_ids, date_from, date_to)
+            return _json_bytes({'headers': table.headers, 'data': data, 'total_rows': len(data)})
+
+        if self._not_modified(etag):
+            return
+        self._send(self.store.encoded(key, etag, build), 'application/json; charset=utf-8')
+
+    def _static(self, relative):
+        root = os.path.realpath(self.store.data_dir)
+        path = os.path.realpath(os.path.join(root, relative))
+        if not path.startswith(root + os.sep) or not os.path.isfile(path):
+            return self._error(HTTPStatus.NOT_FOUND, 'not found')
+        st = os.stat(path)
+        etag = f'"{st.st_size:x}-{st.st_mtime_ns:x}"'
+        if self._not_modified(etag):
+            return
+
+        def build():
+            with open(path, 'rb') as f:
+                return f.read()
+
+        content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if content_type == 'application/json':
+            content_type += '; charset=utf-8'
+        if relative.replace(os.sep, '/').startswith(ASSET_DIR + '/'):
+            return self._asset(path, content_type)
+        self._send(self.store.encoded(('static', path), etag, build), content_type)
+
+    def _asset(self, path, content_type):
+        """내용 해시 이름 산출물: 이름이 곧 버전이므로 영구 캐시, 미리 압축한 변형이 있으면 그것을 보낸다"""
+        accepted = {token.split(';')[0].strip() for token in self.headers.get('Accept-Encoding', '').split(',')}
+        encoding, variant = None, path
+        for candidate in ('br', 'gzip'):
+            if candidate in accepted and os.path.isfile(path + ENCODING_SUFFIXES[candidate]):
+                encoding, variant = candidate, path + ENCODING_SUFFIXES[candidate]
+                break
+        etag = f'"{os.path.basename(path)}{"-" + encoding if encoding else ""}"'
+        if self._not_modified(etag):
+            return
+
+        def build():
+            with open(variant, 'rb') as f:
+                return f.read()
+
+        self._send(self.store.encoded(('static', variant), etag, build), content_type,
+                   encoding=encoding, cache_control=IMMUTABLE_CACHE_CONTROL)
+
+    def _not_modified(self, etag):
+        if etag not in [value.strip() for value in self.headers.get('If-None-Match', '').split(',')]:
+            return False
+        self.send_response(HTTPStatus.NOT_MODIFIED)
+        self._cors()
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+        return True
+
+    def _send(self, entry, content_type, encoding=None, cache_control='no-cache'):
+        """encoding: 본문이 이미 압축돼 있으면 그 Content-Encoding (없으면 크기에 따라 gzip으로 압축한다)"""
+        etag, body, _ = entry
+        if encoding is None and len(body) >= GZIP_MIN_BYTES and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            if entry[2] is None:
+                entry[2] = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+            body, encoding = entry[2], 'gzip'
+        self.send_response(HTTPStatus.OK)
+        self._cors()
+        self.send_header('Content-Type', content_type)
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', cache_control)  # 기본은 매번 ETag로 재검증
+        self.send_header('Vary', 'Accept-Encoding')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status, message):
+        body = _json_bytes({'error': message})
+        self.send_response(status)
+        self._cors()
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _cors(self):
+        # Vite 개발 서버(다른 포트)에서 바로 부를 수 있게 한다
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Expose-Headers', 'ETag')
+
+
+class DataServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+    verbose = False
+
+
+def make_server(data_dir=DATA_DIR, host='127.0.0.1', port=DEFAULT_PORT, verbose=False):
+    store = DataStore(data_dir)
+    handler = type('BoundDataRequestHandler', (DataRequestHandler,), {'store': store})
+    server = DataServer((host, port), handler)
+    server.verbose = verbose
+    return server
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='public/data 색인 API 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    parser.add_argument('--verbose', action='store_true', help='요청마다 로그 출력')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    server = make_server(args.data_dir, args.host, args.port, args.verbose)
+    tables = server.RequestHandlerClass.store.snapshot.tables
+    print(f"Indexed {len(tables)} tables from {args.data_dir} in {time.perf_counter() - started:.2f}s")
+    for name, table in tables.items():
+        print(f"  {name}: {len(table.rows)} rows, {len(table.by_store)} stores, {len(table.periods)} periods")
+    print(f"Serving on http://{args.host}:{args.port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-import openpyxl
+import workbook_cache
 
 EXCEL_FILE = 'backdata.xlsx'
 
@@ -9,7 +9,7 @@ def safe_str(val):
 
 try:
     print("Loading workbook...")
-    wb = openpyxl.load_workbook(EXCEL_FILE, read_only=True, data_only=True)
+    wb = workbook_cache.load_workbook(EXCEL_FILE, read_only=True, data_only=True)
     print("\nSHEET NAMES:")
     for i, name in enumerate(wb.sheetnames):
         print(f"{i+1}. [{name}] (Length: {len(name)})")
@@ -1,6 +1,6 @@
-import openpyxl
+import workbook_cache
 
-wb = openpyxl.load_workbook('backdata.xlsx', data_only=True)
+wb = workbook_cache.load_workbook('backdata.xlsx', data_only=True)
 sheet = wb['매장별스타일판매']
 headers = [cell.value for cell in sheet[1]]
 print(f"Full Headers: {headers}")
@@ -1,7 +1,7 @@
-import openpyxl
+import workbook_cache
 from datetime import datetime
 
-wb = openpyxl.load_workbook('backdata.xlsx', data_only=True)
+wb = workbook_cache.load_workbook('backdata.xlsx', data_only=True)
 sheet = wb['매장별스타일판매']
 headers = [cell.value for cell in sheet[1]]
 print(f"Headers: {headers}")
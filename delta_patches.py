@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""
+연속된 내보내기 사이의 행 단위 변경분(델타 패치).
+
+한 달치 판매가 추가돼도 사용자는 public/data/*.json 전체를 다시 받는다. 여기서는 이전 내보내기를
+SNAPSHOT_DIR에 남겨 두었다가, 새 내보내기와 행 키(ROW_KEYS)로 비교해 바뀐 행만 담은 패치를 쓴다.
+dataService.ts는 브라우저에 보관한 이전 버전에 패치를 차례로 적용해 최신 표를 만든다.
+
+스냅샷에는 행 값 대신 행 키와 행 해시만 남기고, 새 표는 두 번 스트리밍으로 읽는다 (키/해시를 모아 비교한 뒤,
+바뀐 행 값만 골라 패치 파일에 바로 쓴다). 메모리에는 양쪽 표의 키/해시 목록만 올라간다.
+
+패치 (patches/<dataset>/<from>-<to>.json):
+  deletes  지워진 행의 키 목록
+  upserts  [새 표에서의 위치, 키, 행 값 배열(headers 순서)] - 키가 이전 표에 있으면 그 자리에서 교체, 없으면 위치에 삽입
+적용 순서: 삭제 -> 교체 -> 위치 오름차순 삽입. 순서가 바뀐 행은 삭제 + 삽입(이동)으로 표현한다.
+헤더가 바뀌면 패치를 만들지 않는다 (클라이언트는 체인이 끊긴 것으로 보고 전체 파일을 받는다).
+diff_tables/apply_patch는 같은 패치를 메모리의 행 목록으로 만들고 적용하는 기준 구현이다 (테스트용).
+
+행 키는 키 열 값을 KEY_SEPARATOR로 이은 문자열이고, 같은 키가 여러 번 나오면 두 번째부터 '#<순번>'을 붙인다.
+키 열 값은 문자열/정수/None만 허용한다 (JS String()과 표기가 같도록).
+"""
+import hashlib
+import json
+import os
+import shutil
+from bisect import bisect_left
+
+PATCH_DIR = 'patches'
+PATCH_MANIFEST = 'manifest.json'
+SNAPSHOT_DIR = os.path.join('.cache', 'snapshots')
+MAX_PATCHES = 8  # 데이터셋별로 남겨 둘 최근 패치 수 (더 오래된 버전은 전체 파일을 받는다)
+KEY_SEPARATOR = '\x1f'
+
+# 출력 파일 -> 행 키 열. 키가 같은 행은 같은 행으로 보고 값이 바뀌면 교체(upsert)한다
+ROW_KEYS = {
+    'store_data.json': ['매장명'],
+    'item_season_data.json': ['매장코드', '매장명', 'ITEM', '시즌'],
+    'store_style_sales_data.json': ['매장명', '품번', '일자'],
+    'store_inventory_data.json': ['시즌', '매장코드', '매장명'],
+    'performance_data.json': ['판매시점', '매장명'],
+}
+
+
+class UnsupportedChange(Exception):
+    """패치로 표현할 수 없는 변경 (헤더 변경, 키 열에 문자열/정수 외 값 등)"""
+
+
+def table_version(headers, rows):
+    """출력 포맷(rows/columnar)과 무관한 표 내용 해시 (앞 16자리)"""
+    h = hashlib.sha256()
+    h.update(json.dumps(headers, ensure_ascii=False).encode('utf-8'))
+    for row in rows:
+        h.update(b'\n')
+        h.update(_row_line(headers, row))
+    return h.hexdigest()[:16]
+
+
+def _key_part(value):
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return value
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    raise UnsupportedChange(f'key value {value!r} is not a string or integer')
+
+
+def _row_key(row, key_columns, seen):
+    key = KEY_SEPARATOR.join(_key_part(row.get(column)) for column in key_columns)
+    count = seen.get(key, 0)
+    seen[key] = count + 1
+    return f'{key}#{count}' if count else key
+
+
+def row_keys(rows, key_columns):
+    """행마다 키 문자열. 중복 키는 나온 순서대로 '#1', '#2', ...를 붙인다 (dataService.ts rowKeys와 같다)."""
+    seen = {}
+    return [_row_key(row, key_columns, seen) for row in rows]
+
+
+def _row_line(headers, row):
+    """행 값 배열의 JSON (table_version과 행 해시에 쓴다)"""
+    return json.dumps([row.get(header) for header in headers], ensure_ascii=False,
+                      separators=(',', ':')).encode('utf-8')
+
+
+def summarize(headers, rows, key_columns):
+    """행 iterator를 한 번 훑어 {'version', 'keys', 'digests'}를 만든다 (행 값은 남기지 않는다).
+    digests: 행 값 배열 JSON의 짧은 해시. 키가 같고 해시가 같으면 같은 행으로 본다."""
+    version = hashlib.sha256()
+    version.update(json.dumps(headers, ensure_ascii=False).encode('utf-8'))
+    seen, keys, digests = {}, [], []
+    for row in rows:
+        if len(row) != len(headers) or any(header not in row for header in headers):
+            raise UnsupportedChange('row columns differ from headers')
+        line = _row_line(headers, row)
+        version.update(b'\n')
+        version.update(line)
+        keys.append(_row_key(row, key_columns, seen))
+        digests.append(hashlib.blake2b(line, digest_size=8).hexdigest())
+    return {'version': version.hexdigest()[:16], 'keys': keys, 'digests': digests}
+
+
+def _stationary(sequence):
+    """sequence(서로 다른 정수)의 최장 증가 부분 수열에 든 값들. 나머지는 이동한 행이다."""
+    tails, tail_index, parent = [], [], [None] * len(sequence)
+    for i, value in enumerate(sequence):
+        j = bisect_left(tails, value)
+        if j == len(tails):
+            tails.append(value)
+            tail_index.append(i)
+        else:
+            tails[j] = value
+            tail_index[j] = i
+        parent[i] = tail_index[j - 1] if j else None
+    result = set()
+    i = tail_index[-1] if tail_index else None
+    while i is not None:
+        result.add(sequence[i])
+        i = parent[i]
+    return result
+
+
+def diff_keys(old_keys, old_digests, new_keys, new_digests):
+    """키/해시 목록끼리 비교한다 -> (지울 키 목록, 새 표에서 upsert할 위치 목록)"""
+    old_position = {key: i for i, key in enumerate(old_keys)}
+    new_key_set = set(new_keys)
+
+    # 양쪽에 다 있는 행 중 상대 순서가 유지된 행만 제자리에 두고, 나머지는 지웠다가 새 위치에 넣는다
+    # (중복 키의 한 행이 지워져 '#<순번>'이 밀린 경우 등)
+    stationary = _stationary([old_position[key] for key in new_keys if key in old_position])
+    moved = {key for key in new_keys if key in old_position and old_position[key] not in stationary}
+    deletes = [key for key in old_keys if key not in new_key_set or key in moved]
+
+    upserts = []
+    for position, (key, digest) in enumerate(zip(new_keys, new_digests)):
+        old = old_position.get(key)
+        if old is None or key in moved or old_digests[old] != digest:
+            upserts.append(position)
+    return deletes, upserts
+
+
+def diff_tables(old_headers, old_rows, new_headers, new_rows, key_columns):
+    """이전 표 -> 새 표 패치 본문 {'deletes': [...], 'upserts': [...]}. 표현할 수 없으면 UnsupportedChange."""
+    if old_headers != new_headers:
+        raise UnsupportedChange('headers changed')
+    headers = new_headers
+    old, new = summarize(headers, old_rows, key_columns), summarize(headers, new_rows, key_columns)
+    deletes, positions = diff_keys(old['keys'], old['digests'], new['keys'], new['digests'])
+    upserts = [[position, new['keys'][position], [new_rows[position][header] for header in headers]]
+               for position in positions]
+    return {'deletes': deletes, 'upserts': upserts}
+
+
+def apply_patch(headers, rows, key_columns, patch):
+    """rows에 패치를 적용한 새 행 목록 (dataService.ts applyPatch와 같은 순서로 적용한다)."""
+    deleted = set(patch['deletes'])
+    keys = row_keys(rows, key_columns)
+    kept = [(key, row) for key, row in zip(keys, rows) if key not in deleted]
+    position_of = {key: i for i, (key, _) in enumerate(kept)}
+    result = [row for _, row in kept]
+    inserts = []
+    for position, key, values in patch['upserts']:
+        row = dict(zip(headers, values))
+        if key in position_of:
+            result[position_of[key]] = row
+        else:
+            inserts.append((position, row))
+    for position, row in sorted(inserts, key=lambda item: item[0]):
+        result.insert(position, row)
+    return result
+
+
+def _read_json(path, default=None):
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: ignoring unreadable {path}: {e}")
+        return default
+
+
+def _write_json(path, obj):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+class PatchWriter:
+    """data_dir/patches 아래 패치와 manifest.json을 관리한다. 모든 데이터셋을 update()한 뒤 save()."""
+
+    def __init__(self, data_dir, snapshot_dir=SNAPSHOT_DIR):
+        self.data_dir = data_dir
+        self.patch_dir = os.path.join(data_dir, PATCH_DIR)
+        self.snapshot_dir = snapshot_dir
+        manifest = _read_json(os.path.join(self.patch_dir, PATCH_MANIFEST), {})
+        self.datasets = manifest.get('datasets', {}) if manifest.get('format') == 'delta_patches' else {}
+
+    def unchanged(self, output_filename, file_sha256):
+        """출력 파일이 마지막으로 update()한 그대로면 True (표를 다시 읽지 않아도 된다)"""
+        dataset = os.path.splitext(output_filename)[0]
+        entry = self.datasets.get(dataset)
+        return bool(entry and entry.get('sha256') == file_sha256
+                    and os.path.exists(os.path.join(self.snapshot_dir, f'{dataset}.json')))
+
+    def _snapshot(self, dataset, key_columns):
+        """이전 스냅샷 {'version', 'headers', 'keys', 'digests'} 또는 None.
+        행 값을 그대로 담은 이전 형식 스냅샷('data')은 키/해시로 바꿔 읽는다."""
+        snapshot = _read_json(os.path.join(self.snapshot_dir, f'{dataset}.json'))
+        if snapshot and 'digests' not in snapshot:
+            try:
+                summary = summarize(snapshot['headers'], snapshot['data'], key_columns)
+            except (KeyError, UnsupportedChange):
+                return None
+            snapshot = dict(summary, version=snapshot.get('version'), headers=snapshot['headers'])
+        return snapshot
+
+    def update(self, output_filename, read_rows, file_sha256=None):
+        """새 내보내기를 이전 스냅샷과 비교해 패치를 쓰고 스냅샷을 바꾼다. -> 새로 쓴 패치 정보 또는 None
+
+        read_rows() -> (headers, 행 iterator). 키/해시를 모을 때와 바뀐 행 값을 쓸 때 두 번 부른다."""
+        dataset = os.path.splitext(output_filename)[0]
+        key_columns = ROW_KEYS[output_filename]
+        headers, rows = read_rows()
+        summary = summarize(headers, rows, key_columns)
+        version = summary['version']
+        entry = self.datasets.get(dataset, {})
+        snapshot_path = os.path.join(self.snapshot_dir, f'{dataset}.json')
+        snapshot = self._snapshot(dataset, key_columns)
+        full_bytes = os.path.getsize(os.path.join(self.data_dir, output_filename))
+        total_rows = len(summary['keys'])
+        if entry.get('version') == version and snapshot and snapshot.get('version') == version:
+            entry.update(bytes=full_bytes, sha256=file_sha256)  # 포맷만 바뀐 경우 (rows <-> columnar)
+            return None
+
+        patches = entry.get('patches', [])
+        written = None
+        if snapshot and snapshot.get('version') != version:
+            relative = f"{dataset}/{snapshot['version']}-{version}.json"
+            patch_path = os.path.join(self.patch_dir, relative)
+            try:
+                if snapshot['headers'] != headers:
+                    raise UnsupportedChange('headers changed')
+                deletes, positions = diff_keys(snapshot['keys'], snapshot['digests'],
+                                               summary['keys'], summary['digests'])
+                head = {'format': 'delta_patch', 'dataset': dataset, 'from': snapshot['version'], 'to': version,
+                        'key': key_columns, 'headers': headers, 'total_rows': total_rows, 'deletes': deletes}
+                size = self._write_patch(patch_path, head, read_rows, summary, positions)
+            except UnsupportedChange as e:
+                print(f"  {dataset}: no patch from {snapshot['version']} ({e}); clients reload the full file")
+                patches = []
+            else:
+                written = {'from': snapshot['version'], 'to': version, 'file': relative, 'bytes': size,
+                           'upserts': len(positions), 'deletes': len(deletes)}
+                patches = patches + [written]
+        elif not snapshot:
+            patches = []  # 기준이 될 이전 내보내기가 없다 (첫 실행, 또는 스냅샷 삭제)
+
+        self.datasets[dataset] = {'file': output_filename, 'version': version, 'key': key_columns,
+                                  'total_rows': total_rows, 'bytes': full_bytes, 'sha256': file_sha256,
+                                  'patches': patches[-MAX_PATCHES:]}
+        _write_json(snapshot_path, {'version': version, 'headers': headers,
+                                    'keys': summary['keys'], 'digests': summary['digests']})
+        return written
+
+    @staticmethod
+    def _write_patch(path, head, read_rows, summary, positions):
+        """패치 파일을 쓴다. upserts는 표를 다시 훑으며 positions의 행만 바로 직렬화한다 -> 파일 크기"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        wanted = set(positions)
+        keys, digests = summary['keys'], summary['digests']
+        headers, rows = read_rows()
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(head, ensure_ascii=False, separators=(',', ':'))[:-1] + ',"upserts":[')
+                first = True
+                position = -1
+                for position, row in enumerate(rows):
+                    if position not in wanted:
+                        continue
+                    line = _row_line(headers, row)
+                    if position >= len(keys) or hashlib.blake2b(line, digest_size=8).hexdigest() != digests[position]:
+                        raise UnsupportedChange('table changed while writing the patch')
+                    f.write(('' if first else ',') + f'[{position},'
+                            + json.dumps(keys[position], ensure_ascii=False) + ',' + line.decode('utf-8') + ']')
+                    first = False
+                if position + 1 != len(keys):
+                    raise UnsupportedChange('table changed while writing the patch')
+                f.write(']}')
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return os.path.getsize(path)
+
+    def save(self):
+        """manifest.json을 쓰고 목록에서 빠진 패치 파일을 지운다. 패치를 다 쓴 뒤 마지막에 호출한다."""
+        keep = {patch['file'] for entry in self.datasets.values() for patch in entry['patches']}
+        for dataset in self.datasets:
+            directory = os.path.join(self.patch_dir, dataset)
+            if not os.path.isdir(directory):
+                continue
+            for name in os.listdir(directory):
+                if f'{dataset}/{name}' not in keep:
+                    os.remove(os.path.join(directory, name))
+        for name in os.listdir(self.patch_dir) if os.path.isdir(self.patch_dir) else []:
+            if name != PATCH_MANIFEST and name not in self.datasets:
+                shutil.rmtree(os.path.join(self.patch_dir, name), ignore_errors=True)
+        return _write_json(os.path.join(self.patch_dir, PATCH_MANIFEST),
+                           {'format': 'delta_patches', 'datasets': self.datasets})
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+매장별재고 바이너리 저장소: store_inventory_data.json과 같은 행을 고정폭 열로 저장해
+매장 하나의 재고를 복사 없이(mmap + memoryview) 잘라 읽을 수 있게 한다.
+
+store_inventory_data.json은 시즌 × 매장마다 dict 하나라서 매장 하나를 보려 해도 전체를 읽고 훑어야 한다.
+분석 스크립트나 API 서버는 이 파일을 열고 InventoryStore.slice(매장코드)로 해당 구간만 읽으면 된다.
+
+레이아웃 (리틀 엔디언, 구역마다 8바이트 정렬):
+  [MAGIC][헤더 길이 int64][헤더 JSON]
+  quantity   int32[rows]   매장재고수량 (값이 없으면 NULL_QUANTITY)
+  tag_price  int64[rows]   매장재고택가 (값이 없으면 NULL_TAG_PRICE)
+  season     int32[rows]   시즌 문자열 번호
+  name       int32[rows]   매장명 문자열 번호
+  store_id   int32[rows]   매장ID 문자열 번호
+  index      int64[codes+1]  매장코드별 행 구간 [index[i], index[i+1])
+  code       int32[codes]    매장코드 문자열 번호 (매장코드 문자열 순으로 정렬)
+  strings    int64[n+1] 오프셋 + UTF-8 바이트
+행은 매장코드 순으로 정렬되어 있고, 같은 매장코드 안에서는 원래 순서를 유지한다.
+문자열이 없는 칸(None)은 문자열 번호 -1이다. 매장코드가 없는 행은 매장코드 ''로 묶는다.
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+INVENTORY_STORE_FILENAME = 'store_inventory.bin'
+MAGIC = b'INVSTOR1'
+FORMAT_VERSION = 1
+
+SEASON, CODE, NAME, QUANTITY, TAG_PRICE, STORE_ID = '시즌', '매장코드', '매장명', '매장재고수량', '매장재고택가', '매장ID'
+NULL_QUANTITY = -(1 << 31)
+NULL_TAG_PRICE = -(1 << 63)
+NO_STRING = -1
+
+# (구역 이름, array 타입 코드) - 파일에 쓰는 순서
+ROW_COLUMNS = (('quantity', 'i'), ('tag_price', 'q'), ('season', 'i'), ('name', 'i'), ('store_id', 'i'))
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+def _integer(value, null, bits):
+    """숫자를 고정폭 정수로. 값이 없으면 null, 소수는 반올림한다 (원 단위 택가/수량이라 실제로는 없다)."""
+    if value is None or value == '' or isinstance(value, bool):
+        return null, False
+    if not isinstance(value, (int, float)):
+        return null, False
+    number = int(value) if isinstance(value, int) or float(value).is_integer() else int(round(value))
+    if not -(1 << (bits - 1)) < number < (1 << (bits - 1)):
+        raise ValueError(f'{value!r} does not fit in int{bits}')
+    return number, number != value
+
+
+def write_inventory_store(path, rows):
+    """재고 행(dict)을 바이너리 저장소로 쓴다. -> (행 수, 매장코드 수)"""
+    strings = {}
+
+    def string(value):
+        if value is None:
+            return NO_STRING
+        text = str(value)
+        index = strings.get(text)
+        if index is None:
+            index = strings[text] = len(strings)
+        return index
+
+    def code_of(row):
+        code = row.get(CODE)
+        return '' if code is None else str(code)
+
+    ordered = sorted(rows, key=code_of)
+    columns = {name: array(typecode) for name, typecode in ROW_COLUMNS}
+    index, codes = array('q'), array('i')
+    rounded = 0
+    previous = object()
+    for position, row in enumerate(ordered):
+        code = code_of(row)
+        if code != previous:
+            index.append(position)
+            codes.append(string(code))
+            previous = code
+        quantity, q_rounded = _integer(row.get(QUANTITY), NULL_QUANTITY, 32)
+        tag_price, p_rounded = _integer(row.get(TAG_PRICE), NULL_TAG_PRICE, 64)
+        rounded += q_rounded + p_rounded
+        columns['quantity'].append(quantity)
+        columns['tag_price'].append(tag_price)
+        columns['season'].append(string(row.get(SEASON)))
+        columns['name'].append(string(row.get(NAME)))
+        columns['store_id'].append(string(row.get(STORE_ID)))
+    index.append(len(ordered))
+
+    encoded = [text.encode('utf-8') for text in strings]
+    offsets = array('q', [0])
+    for item in encoded:
+        offsets.append(offsets[-1] + len(item))
+    sections = [(name, columns[name]) for name, _ in ROW_COLUMNS] + [('index', index), ('code', codes),
+                                                                       ('string_offsets', offsets)]
+    if sys.byteorder != 'little':
+        for _, values in sections:
+            values.byteswap()
+
+    header = {'format': 'inventory_store', 'version': FORMAT_VERSION, 'rows': len(ordered), 'codes': len(codes),
+              'strings': len(encoded), 'rounded': rounded}
+    # 구역 위치는 행/코드/문자열 수로 정해지지만 헤더에도 남겨 다른 언어에서 바로 읽을 수 있게 한다
+    header_bytes = b''
+    while True:  # 헤더 길이가 구역 오프셋에 영향을 주므로 길이가 바뀌지 않을 때까지 다시 계산한다
+        assumed = len(header_bytes)
+        offset = _align(len(MAGIC) + 8 + assumed)
+        layout = {}
+        for name, values in sections:
+            layout[name] = [offset, values.itemsize * len(values)]
+            offset = _align(offset + values.itemsize * len(values))
+        layout['string_bytes'] = [offset, sum(len(item) for item in encoded)]
+        header['layout'] = layout
+        header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+        if len(header_bytes) == assumed:
+            break
+
+    tmp_path = path + '.tmp'
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<q', len(header_bytes)))
+        f.write(header_bytes)
+        for name, values in sections:
+            f.write(b'\0' * (layout[name][0] - f.tell()))
+            f.write(values.tobytes())
+        f.write(b'\0' * (layout['string_bytes'][0] - f.tell()))
+        f.write(b''.join(encoded))
+    os.replace(tmp_path, path)
+    return len(ordered), len(codes)
+
+
+class InventorySlice:
+    """매장코드 하나의 행 구간. quantity/tag_price/season 등은 파일을 가리키는 memoryview (복사 없음)."""
+
+    def __init__(self, store, code, start, end):
+        self.store = store
+        self.code = code
+        self.start = start
+        self.end = end
+        for name, _ in ROW_COLUMNS:
+            setattr(self, name, store.columns[name][start:end])
+
+    def __len__(self):
+        return self.end - self.start
+
+    def rows(self):
+        """store_inventory_data.json과 같은 모양의 행 dict"""
+        string = self.store.string
+        for i in range(len(self)):
+            quantity, tag_price = self.quantity[i], self.tag_price[i]
+            yield {SEASON: string(self.season[i]), CODE: self.code, NAME: string(self.name[i]),
+                   QUANTITY: None if quantity == NULL_QUANTITY else quantity,
+                   TAG_PRICE: None if tag_price == NULL_TAG_PRICE else tag_price,
+                   STORE_ID: string(self.store_id[i])}
+
+    def totals(self):
+        """(총재고수량, 총재고택가) - 값이 없는 칸은 0으로 본다"""
+        quantity = sum(v for v in self.quantity if v != NULL_QUANTITY)
+        tag_price = sum(v for v in self.tag_price if v != NULL_TAG_PRICE)
+        return quantity, tag_price
+
+
+class InventoryStore:
+    """store_inventory.bin을 mmap으로 연다. numpy가 있으면 np.frombuffer(slice.quantity, np.int32)로 바로 감쌀 수 있다."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        if bytes(view[:len(MAGIC)]) != MAGIC:
+            view.release()
+            self._mmap.close()
+            raise ValueError(f'{path} is not an inventory store')
+        header_length = struct.unpack_from('<q', view, len(MAGIC))[0]
+        self.header = json.loads(bytes(view[len(MAGIC) + 8:len(MAGIC) + 8 + header_length]).decode('utf-8'))
+        layout = self.header['layout']
+        self._views = [view]
+
+        def section(name, typecode):
+            start, size = layout[name]
+            part = view[start:start + size].cast(typecode)
+            self._views.append(part)
+            return part
+
+        self.columns = {name: section(name, typecode) for name, typecode in ROW_COLUMNS}
+        self._index = section('index', 'q')
+        self._offsets = section('string_offsets', 'q')
+        self._blob_start = layout['string_bytes'][0]
+        self._view = view
+        self._strings = [None] * self.header['strings']
+        self.codes = [self.string(number) for number in section('code', 'i')]
+        self._by_store_id = None
+
+    def __len__(self):
+        return self.header['rows']
+
+    def string(self, number):
+        if number == NO_STRING:
+            return None
+        text = self._strings[number]
+        if text is None:
+            start = self._blob_start + self._offsets[number]
+            end = self._blob_start + self._offsets[number + 1]
+            text = self._strings[number] = bytes(self._view[start:end]).decode('utf-8')
+        return text
+
+    def slice(self, code):
+        """매장코드 code의 행 구간. 없으면 None"""
+        code = str(code)
+        i = bisect_left(self.codes, code)
+        if i == len(self.codes) or self.codes[i] != code:
+            return None
+        return InventorySlice(self, code, self._index[i], self._index[i + 1])
+
+    def slices_for_store_id(self, store_id):
+        """매장ID(store_registry) 행이 하나라도 들어 있는 매장코드 구간들"""
+        if self._by_store_id is None:
+            self._by_store_id = {}
+            ids = self.columns['store_id']
+            for i, code in enumerate(self.codes):
+                for number in set(ids[self._index[i]:self._index[i + 1]]):
+                    self._by_store_id.setdefault(self.string(number), []).append(i)
+        return [InventorySlice(self, self.codes[i], self._index[i], self._index[i + 1])
+                for i in self._by_store_id.get(store_id, [])]
+
+    def close(self):
+        """열어 둔 InventorySlice(의 memoryview)를 모두 버린 뒤 닫아야 한다."""
+        for view in reversed(self._views):
+            view.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
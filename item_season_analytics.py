@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+매장별 아이템시즌 분석 번들: itemSeasonAnalyzer.ts(analyzeItemSeasonData)가 매장을 열 때마다
+item_season_data 전체를 매장명 정규식으로 거르고 다시 집계하던 값을 모든 매장에 대해 한 번에 계산해 둔다.
+
+- 시즌별/ITEM별 판매액(만원)·판매수량 상위 TOP_N
+- 반품 분석용 정상 판매액 / 반품 판매액 합계
+- 올해·전년 1~11월 월별 판매액 (최근 3개월 추이는 오늘 날짜 기준이라 클라이언트가 여기서 고른다)
+- 올해 최고 판매월, 시즌/ITEM별 전년 대비 신장률 상위 TOP_N, 전체 신장률
+
+숫자와 정렬 순서는 클라이언트 계산과 같다 (JS Math.round, 객체 키 순서, 안정 정렬).
+"""
+import math
+
+ANALYTICS_FILENAME = 'item_season_analytics.json'
+CURRENT_YEAR, PREVIOUS_YEAR = 2025, 2024
+COMPARE_MONTHS = range(1, 12)  # 1~11월 (12월 제외, itemSeasonAnalyzer.ts와 같다)
+TOP_N = 5
+
+
+def _number(value):
+    """클라이언트의 `value || 0`처럼 숫자가 아니면 0으로 본다."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return 0
+    return value
+
+
+def _round_half_up(value):
+    """JS Math.round와 같은 반올림"""
+    return math.floor(value + 0.5)
+
+
+def _label(value):
+    """클라이언트의 `value || '기타'`를 객체 키로 쓴 문자열"""
+    if not value:
+        return '기타'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _js_key_order(keys):
+    """JS 객체 키 순서: 배열 인덱스 같은 정수 키가 먼저(오름차순), 나머지는 넣은 순서"""
+    integers = sorted((key for key in keys if key.isdigit() and str(int(key)) == key and int(key) < 2 ** 32 - 1),
+                      key=int)
+    integer_set = set(integers)
+    return integers + [key for key in keys if key not in integer_set]
+
+
+def _top_sales(groups, label):
+    """{키: [판매액, 판매수량]} -> 판매액(만원) 내림차순 상위 TOP_N"""
+    entries = [{label: key, '판매액': _round_half_up(groups[key][0] / 10000), '판매수량': groups[key][1]}
+               for key in _js_key_order(list(groups))]
+    return sorted(entries, key=lambda entry: -entry['판매액'])[:TOP_N]
+
+
+def _top_growth(groups, label):
+    """{키: [올해, 작년]} -> 올해(만원) 내림차순 상위 TOP_N과 신장률(%)"""
+    entries = []
+    for key in _js_key_order(list(groups)):
+        current, previous = groups[key]
+        growth = ((current - previous) / previous) * 100 if previous > 0 else 0
+        entries.append({label: key, '올해': _round_half_up(current / 10000), '작년': _round_half_up(previous / 10000),
+                        'growthRate': growth})
+    return sorted(entries, key=lambda entry: -entry['올해'])[:TOP_N]
+
+
+class _StoreAccumulator:
+    def __init__(self):
+        self.rows = 0
+        self.seasons = {}         # 시즌 -> [판매액, 판매수량]
+        self.items = {}           # ITEM -> [판매액, 판매수량]
+        self.season_growth = {}   # 시즌 -> [올해 1~11월, 전년 1~11월]
+        self.item_growth = {}     # ITEM -> [올해 1~11월, 전년 1~11월]
+        self.normal_sales = 0
+        self.return_sales = 0
+        self.current = [0] * len(COMPARE_MONTHS)
+        self.previous = [0] * len(COMPARE_MONTHS)
+
+    def add(self, row, current_keys, previous_keys):
+        self.rows += 1
+        season, item = _label(row.get('시즌')), _label(row.get('ITEM'))
+        sales, quantity = _number(row.get('판매액')), _number(row.get('판매수량'))
+        for groups, key in ((self.seasons, season), (self.items, item)):
+            entry = groups.setdefault(key, [0, 0])
+            entry[0] += sales
+            entry[1] += quantity
+        self.normal_sales += _number(row.get('정상_판매액'))
+        self.return_sales += _number(row.get('반품_판매액'))
+
+        current = [_number(row.get(key)) for key in current_keys]
+        previous = [_number(row.get(key)) for key in previous_keys]
+        for i in range(len(current)):
+            self.current[i] += current[i]
+            self.previous[i] += previous[i]
+        for groups, key in ((self.season_growth, season), (self.item_growth, item)):
+            entry = groups.setdefault(key, [0, 0])
+            for value in current:
+                entry[0] += value
+            for value in previous:
+                entry[1] += value
+
+    def build(self):
+        # 최고 판매월: 0보다 큰 달 중 판매액이 가장 큰 달 (같으면 앞선 달)
+        peak = None
+        for month, value in zip(COMPARE_MONTHS, self.current):
+            if value > 0 and (peak is None or value > peak['판매액']):
+                peak = {'month': month, '판매액': value}
+        total_current, total_previous = 0, 0
+        for i in range(len(COMPARE_MONTHS)):
+            total_current += self.current[i]
+            total_previous += self.previous[i]
+        growth = ((total_current - total_previous) / total_previous) * 100 if total_previous > 0 else 0
+        return {
+            'rows': self.rows,
+            'seasons': _top_sales(self.seasons, '시즌'),
+            'items': _top_sales(self.items, 'ITEM'),
+            'normal_sales': self.normal_sales,
+            'return_sales': abs(self.return_sales),
+            'monthly': {'current': self.current, 'previous': self.previous},
+            'peak_month': peak,
+            'season_growth': _top_growth(self.season_growth, '시즌'),
+            'item_growth': _top_growth(self.item_growth, 'ITEM'),
+            'growth': _round_half_up(growth * 10) / 10,
+        }
+
+
+def build_item_season_analytics(rows, store_key='매장ID'):
+    """아이템시즌별판매 행 -> 매장ID별 분석 번들. 매장ID가 있는 행이 없으면 None."""
+    current_keys = [f'{CURRENT_YEAR}{month:02d}' for month in COMPARE_MONTHS]
+    previous_keys = [f'{PREVIOUS_YEAR}{month:02d}' for month in COMPARE_MONTHS]
+    stores = {}
+    for row in rows:
+        store_id = row.get(store_key)
+        if not store_id:
+            continue
+        accumulator = stores.get(store_id)
+        if accumulator is None:
+            accumulator = stores[store_id] = _StoreAccumulator()
+        accumulator.add(row, current_keys, previous_keys)
+    if not stores:
+        return None
+    return {
+        'format': 'item_season_analytics',
+        'current_year': CURRENT_YEAR,
+        'previous_year': PREVIOUS_YEAR,
+        'months': list(COMPARE_MONTHS),
+        'top_n': TOP_N,
+        'stores': {store_id: stores[store_id].build() for store_id in sorted(stores)},
+    }
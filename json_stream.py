@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+headers/data/total_rows 표 JSON을 행 단위로 바로 파일에 쓰는 스트리밍 writer (와 읽는 reader).
+
+추출기가 행 목록을 다 모은 뒤 json.dump 하면 시트 전체가 메모리에 (dict 목록 + 직렬화 버퍼로) 두 번 올라간다.
+TableWriter는 행을 받는 즉시 직렬화해 쓰고, 행 수(total_rows)는 마지막에 채운다.
+출력은 json.dump(..., ensure_ascii=False, indent=2)와 바이트 단위로 같다.
+iter_table은 반대로 그런 파일을 행 하나씩 디코딩해 돌려준다.
+"""
+import hashlib
+import json
+import os
+import re
+
+SHARD_BATCH_ROWS = 512  # 샤드마다 이만큼 모이면 파일에 이어쓴다
+READ_CHUNK_CHARS = 1 << 20
+
+_TABLE_HEAD_RE = re.compile(r'\s*\{\s*"headers"\s*:\s*')
+_DATA_START_RE = re.compile(r'\s*,\s*"data"\s*:\s*\[')
+_ROW_GAP_RE = re.compile(r'[\s,]*')
+
+
+def _dumps(value, indent_level):
+    """indent=2로 직렬화한 값을 indent_level 깊이에 맞게 들여쓴다 (JSON 문자열 안에는 개행이 없다)."""
+    return json.dumps(value, ensure_ascii=False, indent=2).replace('\n', '\n' + '  ' * indent_level)
+
+
+def table_head(headers):
+    return '{\n  "headers": ' + _dumps(headers, 1) + ',\n  "data": ['
+
+
+def table_row(row, first):
+    return ('\n    ' if first else ',\n    ') + _dumps(row, 2)
+
+
+def table_tail(total_rows):
+    return ('' if total_rows == 0 else '\n  ') + '],\n  "total_rows": ' + str(total_rows) + '\n}'
+
+
+class TableWriter:
+    """표 하나를 스트리밍으로 쓴다. with 블록이 끝나면 닫히고 total_rows가 기록된다."""
+
+    def __init__(self, path, headers):
+        self.path = path
+        self.total_rows = 0
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.file = open(path, 'w', encoding='utf-8')
+        self.file.write(table_head(headers))
+
+    def write(self, row):
+        self.file.write(table_row(row, self.total_rows == 0))
+        self.total_rows += 1
+
+    def close(self):
+        if self.file is not None:
+            self.file.write(table_tail(self.total_rows))
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class ShardWriter:
+    """키(매장)별 표 파일을 한 번의 순회로 쓴다.
+
+    매장 수만큼 파일을 열어 두지 않도록, 키마다 직렬화한 행을 SHARD_BATCH_ROWS개까지 모았다가
+    append 모드로 이어쓴다. 메모리 사용량은 키 수 × 배치 크기로 제한된다.
+    """
+
+    def __init__(self, directory, headers, filename_for):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.head = table_head(headers)
+        self.filename_for = filename_for
+        self.shards = {}  # 키 -> [파일명, 행 수, 대기 중인 직렬화 조각]
+
+    def write(self, key, row):
+        shard = self.shards.get(key)
+        if shard is None:
+            shard = self.shards[key] = [self.filename_for(key), 0, [self.head]]
+        shard[2].append(table_row(row, shard[1] == 0))
+        shard[1] += 1
+        if len(shard[2]) >= SHARD_BATCH_ROWS:
+            self._flush(shard)
+
+    def _flush(self, shard):
+        path = os.path.join(self.directory, shard[0])
+        # 첫 조각(표 머리)이 남아 있으면 새 파일, 아니면 이어쓰기
+        mode = 'w' if shard[2][0] is self.head else 'a'
+        with open(path, mode, encoding='utf-8') as f:
+            f.write(''.join(shard[2]))
+        shard[2] = []
+
+    def close(self):
+        """모든 샤드를 마무리하고 {키: {'file', 'rows', 'bytes', 'sha256'}}를 반환한다."""
+        entries = {}
+        for key, shard in sorted(self.shards.items()):
+            shard[2].append(table_tail(shard[1]))
+            self._flush(shard)
+            path = os.path.join(self.directory, shard[0])
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+            entries[key] = {
+                'file': shard[0],
+                'rows': shard[1],
+                'bytes': os.path.getsize(path),
+                'sha256': digest.hexdigest()
+            }
+        self.shards = {}
+        return entries
+
+
+def _is_prefix_of(text, expected):
+    """공백을 뺀 text가 expected의 앞부분(덜 읽힌 상태 포함)인지"""
+    compact = ''.join(text[:len(expected) * 8].split())[:len(expected)]
+    return expected.startswith(compact)
+
+
+def iter_table(path):
+    """{headers, data, ...} 행 형식 표 파일 -> (headers, 행 dict iterator).
+    행을 하나씩 디코딩하므로 표 전체를 메모리에 올리지 않는다. headers가 data보다 먼저 나오는
+    행 형식(TableWriter/json.dump 출력)이 아니면 (columnar 등) ValueError."""
+    decoder = json.JSONDecoder()
+    f = open(path, 'r', encoding='utf-8')
+    try:
+        # '"data": [' 까지 읽힐 때까지 이어 읽는다 (조각 경계가 머리 중간에 걸릴 수 있다).
+        # 읽은 부분이 이미 행 형식 머리와 어긋나면 파일 끝까지 읽지 않고 바로 ValueError
+        buffer, start = '', None
+        while start is None:
+            block = f.read(READ_CHUNK_CHARS)
+            buffer += block
+            match = _TABLE_HEAD_RE.match(buffer)
+            if match is None:
+                complete = not _is_prefix_of(buffer, '{"headers":')
+            else:
+                try:
+                    headers, pos = decoder.raw_decode(buffer, match.end())
+                except json.JSONDecodeError:
+                    complete = False
+                else:
+                    start = _DATA_START_RE.match(buffer, pos)
+                    complete = not _is_prefix_of(buffer[pos:], ',"data":[')
+            if start is None and (complete or not block):
+                raise ValueError(f'{path} is not a row-format table')
+    except BaseException:
+        f.close()
+        raise
+
+    def rows(buffer, pos):
+        with f:
+            while True:
+                pos = _ROW_GAP_RE.match(buffer, pos).end()
+                if pos < len(buffer) and buffer[pos] == ']':
+                    return
+                try:
+                    row, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    block = f.read(READ_CHUNK_CHARS)
+                    if not block:
+                        raise
+                    buffer, pos = buffer[pos:] + block, 0
+                    continue
+                yield row
+                pos = end
+
+    return headers, rows(buffer, start.end())
@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
-import openpyxl
+import workbook_cache
 
 EXCEL_FILE = 'backdata.xlsx'
 
 try:
-    wb = openpyxl.load_workbook(EXCEL_FILE, read_only=True, data_only=True)
+    wb = workbook_cache.load_workbook(EXCEL_FILE, read_only=True, data_only=True)
     if '경쟁사' in wb.sheetnames:
         sheet = wb['경쟁사']
         print("Dumping first 5 rows of '경쟁사':")
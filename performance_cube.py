@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+실적 큐브: 매장 × 월 판매액 행렬과 매장별 연누계/전년 동기/신장률을 미리 계산해 둔다.
+
+대시보드의 processPerformanceData(utils/performanceConverter.ts)는 매장을 고를 때마다
+performance_data.json 전체를 훑어 같은 값을 다시 계산했다. 큐브가 있으면 매장 행 하나만 읽는다.
+계산 규칙(최신 연도, 만원 반올림, 실적 있는 월만 연누계에 포함, 신장률 소수 첫째 자리)은
+processPerformanceData와 같다.
+"""
+import math
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 순수 파이썬으로 같은 값을 계산한다
+    np = None
+
+CUBE_FILENAME = 'performance_cube.json'
+WON_PER_UNIT = 10000  # 만원
+
+
+def _parse_period(period):
+    """'YYYYMM...' -> (연, 월). processPerformanceData와 같이 앞 6자리만 본다."""
+    if not isinstance(period, str) or len(period) < 6 or not period[:4].isdigit() or not period[4:6].isdigit():
+        return None
+    year, month = int(period[:4]), int(period[4:6])
+    if not 1 <= month <= 12:
+        return None
+    return year, month
+
+
+def _round_half_up(value):
+    """JS Math.round와 같은 반올림 (.5는 +무한대 방향)"""
+    return math.floor(value + 0.5)
+
+
+def _summary(current, last_year):
+    """만원 단위 1~12월 배열 -> (연누계, 전년 동기 연누계, 신장률, 실적 월 수)"""
+    ytd = sum(c for c in current if c > 0)
+    ytd_last = sum(l for c, l in zip(current, last_year) if c > 0)
+    active = sum(1 for c in current if c > 0) or 1
+    growth = (ytd - ytd_last) / ytd_last * 100 if ytd_last > 0 else 0
+    return ytd, ytd_last, _round_half_up(growth * 10) / 10, active
+
+
+def build_performance_cube(rows, store_names):
+    """집계된 실적 행({'판매시점', '판매액', '매장ID'}) -> 큐브 dict.
+
+    store_names: 매장ID -> 표준 매장명 (store_registry.REGISTRY.stores 기준)
+    같은 매장ID의 변형(예: '29CM(롯데본점)'과 '롯데본점')은 한 행으로 합쳐진다.
+    """
+    parsed = []
+    for row in rows:
+        ym = _parse_period(row.get('판매시점'))
+        if ym and row.get('매장ID'):
+            parsed.append((row['매장ID'], ym[0], ym[1], row.get('판매액') or 0))
+    if not parsed:
+        return None
+
+    years = [year for _, year, _, _ in parsed if 2000 < year <= 2100]
+    if not years:
+        return None
+    first_year, current_year = min(years), max(years)
+    store_ids = sorted({store_id for store_id, _, _, _ in parsed})
+    n_months = (current_year - first_year + 1) * 12
+
+    if np is not None:
+        ids = np.array([p[0] for p in parsed])
+        year = np.array([p[1] for p in parsed], dtype=np.int64)
+        month = np.array([p[2] for p in parsed], dtype=np.int64)
+        sales = np.array([p[3] for p in parsed], dtype=np.float64)
+        in_range = (year >= first_year) & (year <= current_year)
+        store_codes = np.searchsorted(np.array(store_ids), ids[in_range])
+        month_idx = (year[in_range] - first_year) * 12 + month[in_range] - 1
+        matrix = np.zeros((len(store_ids), n_months), dtype=np.float64)
+        # 행 순서대로 누적하므로 클라이언트에서 더하는 것과 부동소수점 결과가 같다
+        np.add.at(matrix, (store_codes, month_idx), sales[in_range])
+
+        current_won = matrix[:, n_months - 12:]
+        last_won = matrix[:, n_months - 24:n_months - 12] if n_months >= 24 else np.zeros_like(current_won)
+        current = np.floor(current_won / WON_PER_UNIT + 0.5).astype(np.int64)
+        last_year = np.floor(last_won / WON_PER_UNIT + 0.5).astype(np.int64)
+        active_mask = current > 0
+        ytd = np.where(active_mask, current, 0).sum(axis=1)
+        ytd_last = np.where(active_mask, last_year, 0).sum(axis=1)
+        active = np.maximum(active_mask.sum(axis=1), 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth = np.where(ytd_last > 0, (ytd - ytd_last) / np.where(ytd_last > 0, ytd_last, 1) * 100, 0.0)
+        growth = np.floor(growth * 10 + 0.5) / 10
+
+        matrix_list = matrix.tolist()
+        current_list, last_list = current.tolist(), last_year.tolist()
+        summaries = list(zip(ytd.tolist(), ytd_last.tolist(), growth.tolist(), active.tolist()))
+    else:
+        store_index = {store_id: i for i, store_id in enumerate(store_ids)}
+        matrix_list = [[0.0] * n_months for _ in store_ids]
+        for store_id, year, month, sales in parsed:
+            if first_year <= year <= current_year:
+                matrix_list[store_index[store_id]][(year - first_year) * 12 + month - 1] += sales
+        current_list, last_list, summaries = [], [], []
+        for values in matrix_list:
+            current = [_round_half_up(v / WON_PER_UNIT) for v in values[n_months - 12:]]
+            last_year = ([_round_half_up(v / WON_PER_UNIT) for v in values[n_months - 24:n_months - 12]]
+                         if n_months >= 24 else [0] * 12)
+            current_list.append(current)
+            last_list.append(last_year)
+            summaries.append(_summary(current, last_year))
+
+    periods = [f'{first_year + i // 12}{str(i % 12 + 1).zfill(2)}' for i in range(n_months)]
+    ytd, ytd_last, growth, active = (list(col) for col in zip(*summaries))
+    return {
+        'format': 'performance_cube',
+        'current_year': current_year,
+        'periods': periods,
+        'store_ids': store_ids,
+        'store_names': [store_names.get(store_id, {}).get('name', store_id) for store_id in store_ids],
+        'sales': matrix_list,        # 원, 매장 × periods
+        'current': current_list,     # 만원, current_year 1~12월
+        'last_year': last_list,      # 만원, 전년 1~12월
+        'ytd': ytd,
+        'ytd_last_year': ytd_last,
+        'growth_rate': growth,
+        'active_months': active,
+    }
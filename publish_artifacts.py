@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+배포용 데이터 산출물: public/data의 파일을 내용 해시 이름으로 한 벌 더 만든다.
+
+    python publish_artifacts.py [--data-dir public/data] [--precompress]
+    (update_data_unified.py는 실행 끝에 자동으로 호출한다. read_*.py로 파일을 직접 고친 뒤에는 따로 실행)
+
+추출 스크립트들은 고정된 이름에 들여쓰기한 JSON을 쓰므로 정적 호스팅이 오래 캐시할 수도,
+압축을 미리 해 둘 수도 없다. 여기서는 파일마다
+  assets/<경로>/<이름>.<sha256 앞 HASH_LENGTH자리><확장자>      공백 없는 JSON (JSON이 아니면 원본 그대로)
+  ... .gz / .br                                               미리 압축한 gzip / brotli (--precompress일 때만,
+                                                              br은 brotli 모듈이 있을 때만)
+를 쓰고, 논리 이름 -> 해시 파일을 ARTIFACT_MANIFEST(artifacts.json)에 적는다.
+미리 압축한 변형은 data_server.py만 쓴다. 정적 호스팅(Vercel 등)은 직접 압축하므로 기본으로는 만들지 않는다.
+해시 이름 파일은 내용이 바뀌면 이름도 바뀌므로 브라우저가 영구 캐시하고, 재검증은 매니페스트만 한다.
+원래 이름의 파일은 그대로 두어 매니페스트를 모르는 이전 클라이언트도 동작한다.
+
+같은 원본(크기, 수정 시각)은 다시 읽지 않는다. 다시 쓰였어도 원본 sha256이 직전 발행과 같으면
+다시 줄이거나 압축하지 않고, 같은 해시의 산출물이 이미 있으면 다시 쓰지 않는다.
+현재/직전 매니페스트가 가리키지 않는 산출물은 지운다 (배포 중 이전 매니페스트로 요청하는 클라이언트용으로 한 벌 남긴다).
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 gzip 변형만 만든다
+    brotli = None
+
+ASSET_DIR = 'assets'
+ARTIFACT_MANIFEST = 'artifacts.json'
+HASH_LENGTH = 16
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+ENCODING_SUFFIXES = {'gzip': '.gz', 'br': '.br'}  # Content-Encoding -> 산출물 파일 접미사
+EXCLUDED_SUFFIXES = ('.tmp',)  # 쓰는 중인 임시 파일
+
+
+def minified(path):
+    """JSON이면 공백 없이 다시 쓴 바이트, 아니면 원본 바이트"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if not path.endswith('.json'):
+        return data
+    try:
+        obj = json.loads(data.decode('utf-8'))
+    except ValueError:
+        return data  # 깨진 JSON은 고치지 않고 그대로 배포한다
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def asset_name(logical, digest):
+    """'shards/item_season_data/a.json' -> 'assets/shards/item_season_data/a.<hash>.json'"""
+    stem, ext = os.path.splitext(logical)
+    return f'{ASSET_DIR}/{stem}.{digest[:HASH_LENGTH]}{ext}'
+
+
+def _source_digest(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _variant_paths(data_dir, entry, encodings):
+    return [os.path.join(data_dir, *(entry['file'] + suffix).split('/'))
+            for suffix in [''] + [ENCODING_SUFFIXES[e] for e in encodings]]
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _read_manifest(path):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: ignoring unreadable {path}: {e}")
+        return {}
+    return manifest if manifest.get('format') == 'artifacts' else {}
+
+
+def source_files(data_dir):
+    """data_dir 아래 배포할 파일들의 논리 이름 ('/' 구분, 정렬)"""
+    names = []
+    for root, dirs, files in os.walk(data_dir):
+        relative_root = os.path.relpath(root, data_dir)
+        if relative_root == '.':
+            dirs[:] = [d for d in dirs if d != ASSET_DIR]
+        for filename in files:
+            logical = filename if relative_root == '.' else f"{relative_root.replace(os.sep, '/')}/{filename}"
+            if logical == ARTIFACT_MANIFEST or filename.endswith(EXCLUDED_SUFFIXES):
+                continue
+            names.append(logical)
+    return sorted(names)
+
+
+def publish(data_dir, precompress=False):
+    """산출물과 매니페스트를 쓴다. precompress면 gzip/brotli 변형도 만든다.
+    -> (파일 수, 새로 만든 산출물 수, 지운 파일 수)"""
+    manifest_path = os.path.join(data_dir, ARTIFACT_MANIFEST)
+    previous = _read_manifest(manifest_path)
+    previous_files = previous.get('files', {})
+    encodings = (['gzip'] + (['br'] if brotli else [])) if precompress else []
+
+    files, created = {}, 0
+    for logical in source_files(data_dir):
+        path = os.path.join(data_dir, *logical.split('/'))
+        st = os.stat(path)
+        stat = [st.st_size, st.st_mtime_ns]
+        entry = previous_files.get(logical)
+        reusable = (entry is not None and all(os.path.exists(p) for p in _variant_paths(data_dir, entry, encodings)))
+        if reusable and entry.get('source') == stat:
+            files[logical] = _with_encodings(entry, encodings)
+            continue
+        source_sha256 = _source_digest(path)
+        if reusable and entry.get('source_sha256') == source_sha256:
+            # 다시 쓰였지만 내용은 그대로: 산출물을 그대로 가리키고 원본 상태만 갱신한다
+            files[logical] = dict(_with_encodings(entry, encodings), source=stat)
+            continue
+
+        data = minified(path)
+        digest = hashlib.sha256(data).hexdigest()
+        asset = asset_name(logical, digest)
+        asset_path = os.path.join(data_dir, *asset.split('/'))
+        entry = {'file': asset, 'sha256': digest, 'bytes': len(data), 'source': stat, 'source_sha256': source_sha256}
+        variants = {None: lambda: data, 'gzip': lambda: gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)}
+        if brotli:
+            variants['br'] = lambda: brotli.compress(data, quality=BROTLI_QUALITY)
+        for encoding, build in variants.items():
+            if encoding and encoding not in encodings:
+                continue
+            variant_path = asset_path + ENCODING_SUFFIXES.get(encoding, '')
+            if not os.path.exists(variant_path):
+                _write(variant_path, build())
+                created += 1
+            if encoding:
+                entry[encoding] = os.path.getsize(variant_path)
+        files[logical] = entry
+
+    removed = _prune(data_dir, files, previous_files)
+    _write(manifest_path, json.dumps({'format': 'artifacts', 'hash_length': HASH_LENGTH, 'encodings': encodings,
+                                      'files': files}, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    return len(files), created, removed
+
+
+def _with_encodings(entry, encodings):
+    """이번 발행에서 만들지 않는 압축 변형은 항목에서 뺀다 (_prune이 그 파일을 지운다)"""
+    return {key: value for key, value in entry.items() if key not in ENCODING_SUFFIXES or key in encodings}
+
+
+def _prune(data_dir, files, previous_files):
+    """현재/직전 매니페스트가 가리키지 않는 산출물을 지운다 -> 지운 파일 수"""
+    keep = set()
+    for entry in list(files.values()) + list(previous_files.values()):
+        keep.update(entry['file'] + suffix for encoding, suffix in [(None, '')] + list(ENCODING_SUFFIXES.items())
+                    if encoding is None or encoding in entry)
+    removed = 0
+    asset_root = os.path.join(data_dir, ASSET_DIR)
+    for root, _, filenames in os.walk(asset_root, topdown=False):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            if os.path.relpath(path, data_dir).replace(os.sep, '/') not in keep:
+                os.remove(path)
+                removed += 1
+        if root != asset_root and not os.listdir(root):
+            os.rmdir(root)
+    return removed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='public/data -> 내용 해시 이름의 압축 산출물 + artifacts.json')
+    parser.add_argument('--data-dir', default=os.path.join('public', 'data'))
+    parser.add_argument('--precompress', action='store_true',
+                        help='data_server.py용으로 gzip/brotli 변형(.gz/.br)도 미리 만든다')
+    args = parser.parse_args()
+    count, created, removed = publish(args.data_dir, precompress=args.precompress)
+    encodings = f"gzip{', br' if brotli else ''}" if args.precompress else 'none'
+    print(f"Published {count} files to {args.data_dir}/{ASSET_DIR} "
+          f"({created} new artifacts, {removed} removed, precompressed: {encodings})")
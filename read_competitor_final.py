@@ -1,10 +1,10 @@
-import openpyxl
+import workbook_cache
 import json
 
 def read_competitor_data(file_path, output_json_path):
     try:
         # data_only=True로 실제 계산된 값을 읽기
-        workbook = openpyxl.load_workbook(file_path, data_only=True)
+        workbook = workbook_cache.load_workbook(file_path, data_only=True)
         sheet = workbook['경쟁사']
         
         # Row 1에서 "월평균" 헤더가 있는 첫 번째 컬럼 찾기 (1~11월 또는 1~12월)
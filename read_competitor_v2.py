@@ -1,10 +1,10 @@
-import openpyxl
+import workbook_cache
 import json
 
 def read_competitor_data(file_path, output_json_path):
     try:
         # data_only=True로 실제 계산된 값을 읽기
-        workbook = openpyxl.load_workbook(file_path, data_only=True)
+        workbook = workbook_cache.load_workbook(file_path, data_only=True)
         sheet = workbook['경쟁사']
         
         # Row 2에서 브랜드 목록 읽기 (L열 = 12번째 컬럼부터)
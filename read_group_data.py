@@ -1,9 +1,9 @@
-import openpyxl
+import workbook_cache
 import json
 
 def read_group_data(file_path, output_json_path):
     try:
-        workbook = openpyxl.load_workbook(file_path, data_only=True)
+        workbook = workbook_cache.load_workbook(file_path, data_only=True)
         
         if '단체' not in workbook.sheetnames:
             print("'단체' 시트를 찾을 수 없습니다.")
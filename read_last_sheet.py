@@ -1,9 +1,9 @@
-import openpyxl
+import workbook_cache
 import json
 from datetime import datetime
 
 excel_file = 'backdata.xlsx'
-workbook = openpyxl.load_workbook(excel_file, data_only=True)
+workbook = workbook_cache.load_workbook(excel_file, data_only=True)
 
 print("모든 시트:")
 for idx, name in enumerate(workbook.sheetnames, 1):
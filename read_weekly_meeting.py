@@ -1,10 +1,10 @@
-import openpyxl
+import workbook_cache
 import json
 from datetime import datetime
 
 def read_excel_sheet_to_json(file_path, sheet_name, output_json_path):
     try:
-        workbook = openpyxl.load_workbook(file_path, data_only=True)
+        workbook = workbook_cache.load_workbook(file_path, data_only=True)
         
         if sheet_name not in workbook.sheetnames:
             print(f"'{sheet_name}' 시트를 찾을 수 없습니다.")
@@ -73,7 +73,7 @@ def read_excel_sheet_to_json(file_path, sheet_name, output_json_path):
 excel_file = 'backdata.xlsx'
 possible_sheet_names = ['주간회의', 'WeeklyMeeting', 'weekly_meeting', '주간 회의']
 
-workbook = openpyxl.load_workbook(excel_file)
+workbook = workbook_cache.load_workbook(excel_file)
 print(f"사용 가능한 시트: {workbook.sheetnames}")
 
 # 실제 시트 이름 찾기
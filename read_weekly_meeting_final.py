@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-import openpyxl
+import workbook_cache
 import json
 from datetime import datetime
 
@@ -7,7 +7,7 @@ excel_file = 'backdata.xlsx'
 sheet_name = '주간회의'
 
 try:
-    workbook = openpyxl.load_workbook(excel_file, data_only=True)
+    workbook = workbook_cache.load_workbook(excel_file, data_only=True)
     
     print(f"사용 가능한 시트: {workbook.sheetnames}")
     
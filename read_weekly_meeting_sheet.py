@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
-import openpyxl
+import workbook_cache
 import json
 from datetime import datetime
 
 def read_excel_sheet_to_json(file_path, sheet_name, output_json_path):
     try:
-        workbook = openpyxl.load_workbook(file_path, data_only=True)
+        workbook = workbook_cache.load_workbook(file_path, data_only=True)
         
         if sheet_name not in workbook.sheetnames:
             print(f"'{sheet_name}' 시트를 찾을 수 없습니다.")
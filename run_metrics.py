@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+추출 파이프라인 단계별 계측.
+
+추출기마다 행 순회(iterate) / 값 변환(convert) / 집계(aggregate) / 정렬(sort) /
+JSON 직렬화(serialize) / 샤드 쓰기(shards) / 월별 파티션 쓰기(partitions) 시간과 행 수, 쓴 바이트 수를 모아
+.cache/runs/run-<시각>.json으로 남긴다. 단계는 중첩될 수 있고, 각 단계 시간은
+안쪽 단계를 뺀 값이다 (예: iterate = 루프 전체 - convert).
+
+행마다 들어가는 단계(convert, 행 단위 serialize/shards/partitions/aggregate)는
+row_stage()로 만들며 row_stages가 켜졌을 때(--profile)만 계측한다. 평소에는 아무것도 하지 않는
+NO_STAGE를 돌려주므로 그 시간은 바깥 단계(iterate)에 포함된다.
+"""
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+RUNS_DIR = os.path.join('.cache', 'runs')
+
+
+class Stage:
+    """with 블록 하나의 시간을 단계에 더한다. 행 루프 안에서 재사용하도록 가볍게 유지한다."""
+    __slots__ = ('metrics', 'name', 'started', 'child')
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.child = 0.0
+        self.metrics._stack.append(self)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.started
+        stack = self.metrics._stack
+        stack.pop()
+        self.metrics._add(self.name, elapsed - self.child)
+        if stack:
+            stack[-1].child += elapsed
+        return False
+
+
+class _NoStage:
+    """계측하지 않는 단계. 행 루프의 with 문 비용만 남긴다."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NO_STAGE = _NoStage()
+
+
+class RunMetrics:
+    def __init__(self):
+        self.row_stages = False  # 행 단위 단계 계측 (--profile)
+        self.reset()
+
+    def reset(self):
+        self.started_at = datetime.now()
+        self.run_stages = {}  # 추출기 밖 단계 (변경 확인, 워크북 열기 등)
+        self.jobs = []
+        self._job = None
+        self._stack = []
+
+    def stage(self, name):
+        return Stage(self, name)
+
+    def row_stage(self, name):
+        """행 루프 안에서 쓰는 단계. row_stages가 꺼져 있으면 NO_STAGE."""
+        return Stage(self, name) if self.row_stages else NO_STAGE
+
+    def _add(self, name, seconds):
+        stages = self._job['stages'] if self._job is not None else self.run_stages
+        stages[name] = stages.get(name, 0.0) + seconds
+
+    def count(self, rows=0, bytes_written=0):
+        if self._job is not None:
+            self._job['rows'] += rows
+            self._job['bytes'] += bytes_written
+
+    @contextmanager
+    def job(self, sheet_name, output_filename):
+        """추출기 하나의 계측 범위. tracemalloc이 켜져 있으면 추출기별 최대 할당량도 기록한다."""
+        self._job = {'sheet': sheet_name, 'output': output_filename, 'ok': False,
+                     'stages': {}, 'rows': 0, 'bytes': 0}
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        started = time.perf_counter()
+        try:
+            yield self._job
+        finally:
+            job, self._job = self._job, None
+            job['wall_s'] = time.perf_counter() - started
+            if tracemalloc.is_tracing():
+                job['traced_peak_bytes'] = tracemalloc.get_traced_memory()[1]
+            self.jobs.append(job)
+
+    def add_jobs(self, jobs):
+        """병렬 모드 워커가 보낸 계측 결과를 합친다."""
+        self.jobs.extend(jobs)
+
+    def take_jobs(self):
+        jobs, self.jobs = self.jobs, []
+        return jobs
+
+    def print_report(self):
+        names = []
+        for job in self.jobs:
+            names += [name for name in job['stages'] if name not in names]
+        print("\nStage timings (s):")
+        widths = [max(10, len(name) + 1) for name in names]
+        print(f"  {'sheet':<12}" + ''.join(f"{name:>{w}}" for name, w in zip(names, widths))
+              + f"{'total':>10}{'rows':>10}{'MB':>9}")
+        for job in self.jobs:
+            print(f"  {job['sheet']:<12}"
+                  + ''.join(f"{job['stages'].get(name, 0):{w}.2f}" for name, w in zip(names, widths))
+                  + f"{job['wall_s']:10.2f}{job['rows']:10d}{job['bytes'] / 1e6:9.2f}")
+        for name, seconds in self.run_stages.items():
+            print(f"  {name}: {seconds:.2f}s")
+
+    def write_run_file(self, path=None, **info):
+        """계측 결과를 JSON으로 저장하고 경로를 반환한다. info는 실행 옵션 등 추가 항목."""
+        path = path or os.path.join(RUNS_DIR, f"run-{self.started_at.strftime('%Y%m%d-%H%M%S')}.json")
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'started_at': self.started_at.isoformat(timespec='seconds'),
+                'total_s': (datetime.now() - self.started_at).total_seconds(),
+                **info,
+                'stages': self.run_stages,
+                'jobs': self.jobs,
+            }, f, ensure_ascii=False, indent=2)
+        return path
+
+
+METRICS = RunMetrics()
@@ -1,12 +1,12 @@
 # -*- coding: utf-8 -*-
-import openpyxl
+import workbook_cache
 import json
 from datetime import datetime
 
 excel_file = 'backdata.xlsx'
 
 try:
-    workbook = openpyxl.load_workbook(excel_file, data_only=True)
+    workbook = workbook_cache.load_workbook(excel_file, data_only=True)
     
     # 모든 시트 확인
     print("모든 시트 확인 중...")
@@ -1,8 +1,10 @@
 import { GoogleGenerativeAI } from "@google/generative-ai";
 import { StoreData } from "../types";
 import { collectComparisonData, getTop3SeasonsBySales } from "../utils/similarStoreAnalyzer";
-import { getCompetitorSearchNames } from "../utils/competitorStoreMapping";
+import { getCompetitorSearchNames, getStoreBrandRanking } from "../utils/competitorStoreMapping";
 import { analyzeItemSeasonData } from "../utils/itemSeasonAnalyzer";
+import { selectStoreRows } from "../utils/storeRegistry";
+import { findStyleRanking, StyleRankings } from "../utils/styleRankings";
 import { dataService } from "./dataService";
 
 interface ComparisonData {
@@ -25,7 +27,8 @@ export const getComparisonInsights = async (
   storeInventoryDataJson: any,
   competitorDataV2Json: any,
   storeStyleSalesDataJson: any,
-  itemSeasonDataJson: any
+  itemSeasonDataJson: any,
+  styleRankings: StyleRankings | null = null
 ): Promise<string> => {
   // Vite에서는 클라이언트 사이드에서 import.meta.env를 사용해야 함
   const apiKey = (import.meta as any).env.VITE_GEMINI_API_KEY || (import.meta as any).env.GEMINI_API_KEY || '';
@@ -167,8 +170,19 @@ export const getComparisonInsights = async (
 
   // Best 5 아이템 비교 (1월 기준, 품번별)
   const getBestItems = (storeName: string) => {
+    // 미리 계산된 순위가 있으면 양수 판매액 합계 순위를 그대로 사용 (style_rankings.json)
+    const ranking = findStyleRanking(styleRankings, storeName);
+    if (ranking) {
+      return ranking.gross_sales.slice(0, 5).map(item => ({
+        품번: item.품번,
+        제품명: item.제품명,
+        판매금액: Math.round(item.판매금액 / 10000)
+      }));
+    }
+
     const styleData = storeStyleSalesDataJson as any;
-    const storeItems = styleData.data.filter((item: any) => {
+    if (!styleData) return [];
+    const storeItems = selectStoreRows(styleData.data, storeName, (item: any) => {
       const itemStoreName = item.매장명 || '';
       const match = itemStoreName.match(/\(([^)]+)\)/);
       if (match) {
@@ -265,7 +279,8 @@ export const getComparisonInsights = async (
 
     const searchNames = getCompetitorSearchNames(storeName);
 
-    const storeData = competitorData.stores.find((store: any) => {
+    // 경쟁사 행의 매장ID는 경쟁사 별칭(STORE_TO_COMPETITOR_ALIAS)까지 풀어 둔 값
+    const [storeData] = selectStoreRows(competitorData.stores, storeName, (store: any) => {
       const storeNameInData = (store.백화점 || '').trim();
       return searchNames.some((alias: string) =>
         storeNameInData === alias ||
@@ -276,17 +291,7 @@ export const getComparisonInsights = async (
 
     if (!storeData) return null;
 
-    const brandRankings = Object.entries(storeData.브랜드별_월평균 || {})
-      .filter(([_, value]) => (value as number) > 0)
-      .map(([brandName, monthlyAvg]) => ({
-        브랜드: brandName,
-        월평균: monthlyAvg as number
-      }))
-      .sort((a, b) => b.월평균 - a.월평균)
-      .map((item, idx) => ({
-        ...item,
-        순위: idx + 1
-      }));
+    const brandRankings = getStoreBrandRanking(competitorData, storeData);
 
     const mlbRanking = brandRankings.find(r => r.브랜드 === 'MLB');
 
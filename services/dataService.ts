@@ -1,3 +1,10 @@
+import type { PerformanceCube } from '../utils/performanceConverter';
+import type { StoreRegistry } from '../utils/storeRegistry';
+import { resolveStoreId } from '../utils/storeRegistry';
+import type { StyleRankings } from '../utils/styleRankings';
+import type { StoreNeighborTable } from '../utils/similarStoreAnalyzer';
+import type { ItemSeasonAnalytics } from '../utils/itemSeasonAnalyzer';
+
 export interface DataService {
   getStoreData: () => Promise<any>;
   getPerformanceData: () => Promise<any>;
@@ -6,29 +13,466 @@ export interface DataService {
   getStoreInventoryData: () => Promise<any>;
   getCompetitorData: () => Promise<any>;
   getStoreStyleSalesData: () => Promise<any>;
+  getStoreShards: (dataset: ShardedDataset, storeNames: string[]) => Promise<any>;
+  getDatePartitions: (dataset: PartitionedDataset, fromMonth: string, toMonth: string) => Promise<any>;
+  getStoreRegistry: () => Promise<StoreRegistry | null>;
+  getPerformanceCube: () => Promise<PerformanceCube | null>;
+  getStyleRankings: () => Promise<StyleRankings | null>;
+  getStoreNeighbors: () => Promise<StoreNeighborTable | null>;
+  getItemSeasonAnalytics: () => Promise<ItemSeasonAnalytics | null>;
+  prefetch: (filenames: string[]) => Promise<void>;
+  prefetchShardManifests: (datasets: ShardedDataset[]) => Promise<void>;
+}
+
+// 매장별 샤드로도 내보내는 데이터셋 (update_data_unified.py SHARDED_OUTPUTS)
+export type ShardedDataset = 'item_season_data' | 'store_inventory_data' | 'store_style_sales_data';
+
+interface ShardManifest {
+  dataset: string;
+  headers: string[];
+  total_rows: number;
+  stores: { [storeId: string]: { name: string; file: string; rows: number; bytes: number; sha256: string } };
+}
+
+// 일자 기준 월별 파티션으로도 내보내는 데이터셋 (update_data_unified.py PARTITIONED_OUTPUTS)
+export type PartitionedDataset = 'store_style_sales_data';
+
+interface PartitionManifest {
+  dataset: string;
+  headers: string[];
+  partition_key: string;
+  date_from: string;
+  date_to: string;
+  total_rows: number;
+  partitions: { [month: string]: { file: string; rows: number; bytes: number; sha256: string } };
+}
+
+// 로컬 데이터 API 서버 (data_server.py). 설정하면 매장/기간 조회는 서버 색인에서 필요한 행만 받고,
+// 나머지 정적 파일도 서버(/data)에서 받는다. 비어 있으면 기존처럼 정적 /data만 쓴다
+const DATA_API_URL: string = ((import.meta as any).env?.VITE_DATA_API_URL || '').replace(/\/+$/, '');
+const BASE_PATH = DATA_API_URL ? `${DATA_API_URL}/data` : '/data';
+
+// 배포 산출물 매니페스트 (publish_artifacts.py): public/data 기준 경로 -> 내용 해시 이름 파일 (assets/ 아래)
+// 해시 이름 파일은 내용이 바뀌면 이름도 바뀌므로 한 번 받으면 재검증하지 않고, 매니페스트만 재검증한다
+interface ArtifactManifest {
+  format: 'artifacts';
+  files: { [path: string]: { file: string; sha256: string; bytes: number; gzip?: number; br?: number } };
 }
 
-const BASE_PATH = '/data';
+const ASSET_PATH = `${BASE_PATH}/assets/`;
+
+// update_data_unified.py --format columnar 출력 (to_columnar 참고)
+// 사전 인코딩된 열은 { dict: 고유값 목록, codes: 인덱스 배열 } 형태
+type ColumnarColumn = any[] | { dict: any[]; codes: (number | null)[] };
 
-const fetchData = async (filename: string) => {
-  try {
-    const response = await fetch(`${BASE_PATH}/${filename}`);
-    if (!response.ok) {
-      throw new Error(`Failed to load ${filename}: ${response.statusText}`);
+interface ColumnarTable {
+  format: 'columnar';
+  headers: string[];
+  columns: ColumnarColumn[];
+  total_rows: number;
+}
+
+// 열 단위 포맷을 기존 { headers, data: [행 객체], total_rows } 형태로 복원
+// 사전 인코딩된 문자열은 같은 문자열 인스턴스를 공유하므로 메모리 사용량도 줄어든다
+export const decodeColumnar = (table: ColumnarTable) => {
+  const columns = table.columns.map(column =>
+    Array.isArray(column)
+      ? column
+      : column.codes.map(code => (code === null ? null : column.dict[code]))
+  );
+  const data = new Array(table.total_rows);
+  for (let i = 0; i < table.total_rows; i++) {
+    const row: { [key: string]: any } = {};
+    for (let c = 0; c < table.headers.length; c++) {
+      row[table.headers[c]] = columns[c][i];
     }
-    return await response.json();
-  } catch (error) {
+    data[i] = row;
+  }
+  return { headers: table.headers, data, total_rows: table.total_rows };
+};
+
+const decodeTable = (json: any) =>
+  json && json.format === 'columnar' ? decodeColumnar(json as ColumnarTable) : json;
+
+// 응답 캐시: 같은 URL 요청은 진행 중인 Promise를 공유하고(여러 컴포넌트가 동시에 불러도 요청/JSON 파싱은 한 번),
+// 받은 결과는 최근 사용 순(LRU)으로 MAX_CACHED_RESPONSES개까지 보관한다.
+// REVALIDATE_AFTER_MS가 지나면 ETag/Last-Modified 조건부 요청으로 재검증하고, 304면 파싱해 둔 값을 그대로 쓴다
+const MAX_CACHED_RESPONSES = 48;
+const REVALIDATE_AFTER_MS = 5 * 60 * 1000;
+
+interface CachedResponse {
+  promise: Promise<any>;
+  value?: any;
+  etag?: string | null;
+  lastModified?: string | null;
+  fetchedAt?: number; // 응답을 받은 시각 (진행 중이면 undefined)
+}
+
+const responseCache = new Map<string, CachedResponse>();
+
+const rememberResponse = (url: string, entry: CachedResponse) => {
+  responseCache.delete(url);
+  responseCache.set(url, entry);
+  while (responseCache.size > MAX_CACHED_RESPONSES) {
+    responseCache.delete(responseCache.keys().next().value as string);
+  }
+};
+
+// url의 JSON (columnar 표는 풀어서). optional이면 파일이 없거나(404 등) 실패해도 예외 대신 null
+const fetchJson = (url: string, optional = false): Promise<any> => {
+  const cached = responseCache.get(url);
+  if (cached && (cached.fetchedAt === undefined || url.startsWith(ASSET_PATH)
+    || Date.now() - cached.fetchedAt < REVALIDATE_AFTER_MS)) {
+    rememberResponse(url, cached);
+    return optional ? cached.promise.catch(() => null) : cached.promise;
+  }
+
+  const headers: { [name: string]: string } = {};
+  if (cached?.etag) headers['If-None-Match'] = cached.etag;
+  if (cached?.lastModified) headers['If-Modified-Since'] = cached.lastModified;
+  const entry: CachedResponse = { promise: Promise.resolve(null) };
+  entry.promise = fetch(url, { headers })
+    .then(async response => {
+      if (response.status === 304 && cached && 'value' in cached) {
+        entry.value = cached.value;
+        entry.etag = cached.etag;
+        entry.lastModified = cached.lastModified;
+      } else if (response.ok) {
+        entry.value = decodeTable(await response.json());
+        entry.etag = response.headers.get('ETag');
+        entry.lastModified = response.headers.get('Last-Modified');
+      } else if (optional) {
+        // 없는 선택 파일도 캐시해 두어 같은 화면에서 다시 요청하지 않는다
+        entry.value = null;
+      } else {
+        throw new Error(`Failed to load ${url}: ${response.status} ${response.statusText}`);
+      }
+      entry.fetchedAt = Date.now();
+      return entry.value;
+    })
+    .catch(error => {
+      if (responseCache.get(url) === entry) responseCache.delete(url);
+      // 재검증이 실패하면(오프라인 등) 이전에 받은 값을 쓴다
+      if (cached && cached.fetchedAt !== undefined) {
+        rememberResponse(url, cached);
+        return cached.value;
+      }
+      throw error;
+    });
+  rememberResponse(url, entry);
+  return optional ? entry.promise.catch(() => null) : entry.promise;
+};
+
+// 산출물 매니페스트가 없는 이전 배포에서는 null (원래 이름의 파일을 받는다)
+const getArtifactManifest = (): Promise<ArtifactManifest | null> =>
+  fetchJson(`${BASE_PATH}/artifacts.json`, true)
+    .then(manifest => (manifest && manifest.format === 'artifacts' ? manifest : null));
+
+// public/data 기준 path의 JSON. 매니페스트에 있으면 내용 해시 이름 파일을 받는다
+const fetchDataFile = async (path: string, optional = false): Promise<any> => {
+  const entry = (await getArtifactManifest())?.files[path];
+  return fetchJson(`${BASE_PATH}/${entry ? entry.file : path}`, optional);
+};
+
+const fetchData = (filename: string) =>
+  fetchDataFile(filename).catch(error => {
     console.error(`Error loading ${filename}:`, error);
     throw error;
+  });
+
+// 델타 패치 (update_data_unified.py write_delta_patches, delta_patches.py)
+// 표 파일은 브라우저(IndexedDB)에 마지막으로 받은 버전을 보관하고, 새 버전이 나오면 그 사이의 패치만 받아 적용한다
+interface PatchInfo { from: string; to: string; file: string; bytes: number; upserts: number; deletes: number }
+
+interface PatchManifest {
+  format: 'delta_patches';
+  datasets: {
+    [dataset: string]: { file: string; version: string; key: string[]; total_rows: number; bytes: number; patches: PatchInfo[] };
+  };
+}
+
+interface DeltaPatch {
+  format: 'delta_patch';
+  from: string;
+  to: string;
+  key: string[];
+  headers: string[];
+  total_rows: number;
+  deletes: string[];
+  upserts: [number, string, any[]][]; // [새 표에서의 위치, 행 키, headers 순서의 값]
+}
+
+interface TableSnapshot { version: string; table: { headers: string[]; data: any[]; total_rows: number } }
+
+const KEY_SEPARATOR = '\u001f';
+
+// delta_patches.py row_keys와 같은 행 키 (중복 키는 두 번째부터 '#<순번>')
+const rowKeys = (rows: any[], keyColumns: string[]): string[] => {
+  const seen = new Map<string, number>();
+  return rows.map(row => {
+    const key = keyColumns.map(column => (row[column] == null ? '' : String(row[column]))).join(KEY_SEPARATOR);
+    const count = seen.get(key) || 0;
+    seen.set(key, count + 1);
+    return count ? `${key}#${count}` : key;
+  });
+};
+
+// 삭제 -> 제자리 교체 -> 위치 오름차순 삽입 (delta_patches.py apply_patch와 같은 순서)
+export const applyPatch = (table: TableSnapshot['table'], patch: DeltaPatch): TableSnapshot['table'] => {
+  const deleted = new Set(patch.deletes);
+  const keys = rowKeys(table.data, patch.key);
+  const data: any[] = [];
+  const positionOf = new Map<string, number>();
+  table.data.forEach((row, i) => {
+    if (deleted.has(keys[i])) return;
+    positionOf.set(keys[i], data.length);
+    data.push(row);
+  });
+  const inserts: [number, any][] = [];
+  for (const [position, key, values] of patch.upserts) {
+    const row: { [key: string]: any } = {};
+    patch.headers.forEach((header, c) => { row[header] = values[c]; });
+    const at = positionOf.get(key);
+    if (at !== undefined) {
+      data[at] = row;
+    } else {
+      inserts.push([position, row]);
+    }
+  }
+  inserts.sort((a, b) => a[0] - b[0]).forEach(([position, row]) => data.splice(position, 0, row));
+  if (data.length !== patch.total_rows) throw new Error(`patch ${patch.from}->${patch.to} produced ${data.length} rows`);
+  return { headers: patch.headers, data, total_rows: data.length };
+};
+
+const SNAPSHOT_DB = 'dashboard-data';
+const SNAPSHOT_STORE = 'snapshots';
+let snapshotDb: Promise<IDBDatabase | null> | null = null;
+
+// IndexedDB를 쓸 수 없으면(사생활 보호 모드 등) null -> 항상 전체 파일을 받는다
+const openSnapshotDb = (): Promise<IDBDatabase | null> => {
+  if (!snapshotDb) {
+    snapshotDb = new Promise(resolve => {
+      if (typeof indexedDB === 'undefined') return resolve(null);
+      const request = indexedDB.open(SNAPSHOT_DB, 1);
+      request.onupgradeneeded = () => request.result.createObjectStore(SNAPSHOT_STORE);
+      request.onsuccess = () => resolve(request.result);
+      request.onerror = () => resolve(null);
+      request.onblocked = () => resolve(null);
+    });
   }
+  return snapshotDb;
 };
 
+const snapshotRequest = async <T,>(mode: IDBTransactionMode, run: (store: IDBObjectStore) => IDBRequest): Promise<T | null> => {
+  const db = await openSnapshotDb();
+  if (!db) return null;
+  return new Promise(resolve => {
+    try {
+      const request = run(db.transaction(SNAPSHOT_STORE, mode).objectStore(SNAPSHOT_STORE));
+      request.onsuccess = () => resolve((request.result as T) ?? null);
+      request.onerror = () => resolve(null);
+    } catch {
+      resolve(null); // 용량 초과 등: 보관하지 못해도 이번 결과는 그대로 쓴다
+    }
+  });
+};
+
+const readSnapshot = (dataset: string) =>
+  snapshotRequest<TableSnapshot>('readonly', store => store.get(dataset));
+
+const writeSnapshot = (dataset: string, snapshot: TableSnapshot) =>
+  snapshotRequest<IDBValidKey>('readwrite', store => store.put(snapshot, dataset));
+
+// 패치가 없는 이전 배포에서는 null (표 파일을 그대로 받는다)
+const getPatchManifest = (): Promise<PatchManifest | null> =>
+  fetchDataFile('patches/manifest.json', true)
+    .then(manifest => (manifest && manifest.format === 'delta_patches' ? manifest : null));
+
+// from 버전에서 최신 버전까지 이어지는 패치 목록. 중간이 끊겼으면 null
+const findPatchChain = (patches: PatchInfo[], from: string, to: string): PatchInfo[] | null => {
+  const chain: PatchInfo[] = [];
+  for (let version = from; version !== to;) {
+    const next = patches.find(patch => patch.from === version);
+    if (!next || chain.length >= patches.length) return null;
+    chain.push(next);
+    version = next.to;
+  }
+  return chain;
+};
+
+const patchedTables = new Map<string, Promise<any>>();
+
+// 보관한 버전 + 패치로 최신 표를 만든다. 보관본이 없거나 패치가 전체 파일보다 크면 전체 파일을 받는다
+const loadPatchedTable = async (dataset: string, entry: PatchManifest['datasets'][string]) => {
+  const snapshot = await readSnapshot(dataset);
+  if (snapshot && snapshot.version === entry.version) return snapshot.table;
+
+  const chain = snapshot ? findPatchChain(entry.patches, snapshot.version, entry.version) : null;
+  let table;
+  if (snapshot && chain && chain.reduce((sum, patch) => sum + patch.bytes, 0) < entry.bytes) {
+    const patches: DeltaPatch[] = await Promise.all(chain.map(patch => fetchDataFile(`patches/${patch.file}`)));
+    table = patches.reduce(applyPatch, snapshot.table);
+  } else {
+    table = await fetchData(entry.file);
+  }
+  writeSnapshot(dataset, { version: entry.version, table });
+  return table;
+};
+
+// 표 파일(store_data.json 등). 패치 매니페스트에 있는 표는 보관본 + 패치로, 아니면 파일을 그대로 받는다
+const fetchTable = async (filename: string) => {
+  const dataset = filename.replace(/\.json$/, '');
+  const entry = (await getPatchManifest())?.datasets[dataset];
+  if (!entry) return fetchData(filename);
+
+  const id = `${dataset}@${entry.version}`;
+  let promise = patchedTables.get(id);
+  if (!promise) {
+    promise = loadPatchedTable(dataset, entry).catch(error => {
+      console.warn(`Failed to patch ${filename}, loading the full file`, error);
+      return fetchData(filename);
+    });
+    // 같은 데이터셋의 이전 버전은 버린다
+    Array.from(patchedTables.keys())
+      .filter(key => key.startsWith(`${dataset}@`))
+      .forEach(key => patchedTables.delete(key));
+    patchedTables.set(id, promise);
+  }
+  return promise;
+};
+
+// 데이터 API 서버의 색인 조회 (/api/<dataset>?store=..&from=..&to=..). 서버를 쓰지 않거나 실패하면 null
+const fetchFromApi = (dataset: string, params: [string, string][]): Promise<any> => {
+  if (!DATA_API_URL) return Promise.resolve(null);
+  return fetchJson(`${DATA_API_URL}/api/${dataset}?${new URLSearchParams(params).toString()}`, true);
+};
+
+// 샤드가 아직 생성되지 않은 배포에서는 매니페스트가 없으므로 null (전체 파일로 대체)
+const getShardManifest = (dataset: ShardedDataset): Promise<ShardManifest | null> =>
+  fetchDataFile(`shards/${dataset}/manifest.json`, true)
+    .then(manifest => (manifest && manifest.stores ? manifest : null));
+
+// 샤드/파티션이 없을 때 대신 받는 전체 파일
+const getFullDataset = (dataset: string) => fetchTable(`${dataset}.json`);
+
+// 지정한 매장들의 샤드만 받아 { headers, data, total_rows } 하나로 합친다 (데이터 API 서버가 있으면 서버에서 한 번에)
+// 샤드는 매장ID로 나뉘어 있으므로 매장명을 레지스트리로 매장ID로 바꿔 찾는다.
+// 레지스트리가 없거나 모르는 매장명이 있으면 (이전 데이터) 전체 파일로 대체한다.
+const getStoreShards = async (dataset: ShardedDataset, storeNames: string[]) => {
+  const storeIds = storeNames.map(resolveStoreId);
+  if (storeIds.some(storeId => !storeId)) {
+    return getFullDataset(dataset);
+  }
+  const ids = Array.from(new Set(storeIds as string[])).sort();
+  if (ids.length > 0) {
+    const fromApi = await fetchFromApi(dataset, ids.map(storeId => ['store', storeId] as [string, string]));
+    if (fromApi) return fromApi;
+  }
+
+  const manifest = await getShardManifest(dataset);
+  if (!manifest) {
+    return getFullDataset(dataset);
+  }
+
+  const files = ids
+    .filter(storeId => manifest.stores[storeId])
+    .map(storeId => `shards/${dataset}/${manifest.stores[storeId].file}`);
+  const tables = await Promise.all(files.map(fetchData));
+
+  const data = tables.flatMap(table => table.data);
+  return { headers: manifest.headers, data, total_rows: data.length };
+};
+
+// 파티션이 아직 생성되지 않은 배포에서는 매니페스트가 없으므로 null (전체 파일로 대체)
+const getPartitionManifest = (dataset: PartitionedDataset): Promise<PartitionManifest | null> =>
+  fetchDataFile(`partitions/${dataset}/manifest.json`, true)
+    .then(manifest => (manifest && manifest.partitions ? manifest : null));
+
+// fromMonth~toMonth ('YYYY-MM', 양끝 포함) 파티션만 받아 { headers, data, total_rows } 하나로 합친다
+const getDatePartitions = async (dataset: PartitionedDataset, fromMonth: string, toMonth: string) => {
+  const fromApi = await fetchFromApi(dataset, [['from', fromMonth], ['to', toMonth]]);
+  if (fromApi) return fromApi;
+
+  const manifest = await getPartitionManifest(dataset);
+  if (!manifest) {
+    const table = await getFullDataset(dataset);
+    const data = table.data.filter((row: any) => {
+      const month = String(row['일자'] ?? '').slice(0, 7);
+      return month >= fromMonth && month <= toMonth;
+    });
+    return { headers: table.headers, data, total_rows: data.length };
+  }
+
+  const files = Object.keys(manifest.partitions)
+    .filter(month => month >= fromMonth && month <= toMonth)
+    .sort()
+    .map(month => `partitions/${dataset}/${manifest.partitions[month].file}`);
+  const tables = await Promise.all(files.map(fetchData));
+
+  const data = tables.flatMap(table => table.data);
+  return { headers: manifest.headers, data, total_rows: data.length };
+};
+
+// 레지스트리가 없는 이전 배포에서는 null (매장명 매칭으로 대체)
+const getStoreRegistry = (): Promise<StoreRegistry | null> =>
+  fetchDataFile('store_registry.json', true);
+
+// 큐브가 없는 이전 배포에서는 null (performance_data.json 전체 스캔으로 대체)
+const getPerformanceCube = (): Promise<PerformanceCube | null> =>
+  fetchDataFile('performance_cube.json', true)
+    .then(cube => (cube && cube.format === 'performance_cube' ? cube : null));
+
+// 순위 파일이 없는 이전 배포에서는 null (스타일판매 행을 받아 클라이언트에서 집계)
+const getStyleRankings = (): Promise<StyleRankings | null> =>
+  fetchDataFile('style_rankings.json', true)
+    .then(rankings => (rankings && rankings.format === 'style_rankings' ? rankings : null));
+
+// 이웃 테이블이 없는 이전 배포에서는 null (findSimilarStores가 매번 전체 매장을 훑는다)
+const getStoreNeighbors = (): Promise<StoreNeighborTable | null> =>
+  fetchDataFile('store_neighbors.json', true)
+    .then(table => (table && table.format === 'store_neighbors' ? table : null));
+
+// 분석 번들이 없는 이전 배포에서는 null (analyzeItemSeasonData가 매장 샤드 행을 받아 다시 집계한다)
+const getItemSeasonAnalytics = (): Promise<ItemSeasonAnalytics | null> =>
+  fetchDataFile('item_season_analytics.json', true)
+    .then(bundle => (bundle && bundle.format === 'item_season_analytics' ? bundle : null));
+
+// 경쟁사 데이터에 competitor_rankings.json(점포별/브랜드별 순위)을 합친다. 순위 파일이 없으면 원본 그대로
+const getCompetitorData = async () => {
+  const [data, rankings] = await Promise.all([
+    fetchData('competitor_data_v2.json'),
+    fetchDataFile('competitor_rankings.json', true)
+  ]);
+  if (!data || !rankings || rankings.format !== 'competitor_rankings') return data;
+  return { ...data, store_rankings: rankings.store_rankings, brand_rankings: rankings.brand_rankings };
+};
+
+// 화면이 곧 쓸 파일(public/data 기준 경로)을 미리 병렬로 받아 응답 캐시에 넣어 둔다. 실패는 무시한다
+const prefetch = (filenames: string[]): Promise<void> =>
+  Promise.all(filenames.map(filename => fetchDataFile(filename).catch(() => undefined)))
+    .then(() => undefined);
+
+// 매장을 고르면 바로 필요한 샤드 매니페스트를 초기 데이터와 함께 받아 둔다 (데이터 API 서버를 쓰면 필요 없음)
+const prefetchShardManifests = (datasets: ShardedDataset[]): Promise<void> =>
+  DATA_API_URL
+    ? Promise.resolve()
+    : prefetch(datasets.map(dataset => `shards/${dataset}/manifest.json`));
+
 export const dataService: DataService = {
-  getStoreData: () => fetchData('store_data.json'),
-  getPerformanceData: () => fetchData('performance_data.json'),
+  getStoreData: () => fetchTable('store_data.json'),
+  getPerformanceData: () => fetchTable('performance_data.json'),
   getGroupSalesData: () => fetchData('group_sales_data.json'),
-  getItemSeasonData: () => fetchData('item_season_data.json'),
-  getStoreInventoryData: () => fetchData('store_inventory_data.json'),
-  getCompetitorData: () => fetchData('competitor_data_v2.json'),
-  getStoreStyleSalesData: () => fetchData('store_style_sales_data.json'),
+  getItemSeasonData: () => fetchTable('item_season_data.json'),
+  getStoreInventoryData: () => fetchTable('store_inventory_data.json'),
+  getCompetitorData,
+  getStoreStyleSalesData: () => fetchTable('store_style_sales_data.json'),
+  getStoreShards,
+  getDatePartitions,
+  getStoreRegistry,
+  getPerformanceCube,
+  getStyleRankings,
+  getStoreNeighbors,
+  getItemSeasonAnalytics,
+  prefetch,
+  prefetchShardManifests,
 };
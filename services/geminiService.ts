@@ -1,7 +1,7 @@
 import { GoogleGenerativeAI } from "@google/generative-ai";
 import { StoreData } from "../types";
 import { generateLocalInsight } from "../utils/localAIInsight";
-import { analyzeItemSeasonData } from "../utils/itemSeasonAnalyzer";
+import { analyzeItemSeasonData, hasItemSeasonAnalytics } from "../utils/itemSeasonAnalyzer";
 
 import { dataService } from "./dataService";
 
@@ -17,12 +17,14 @@ export const getStoreInsights = async (storeData: StoreData): Promise<string> =>
     envKeys: Object.keys((import.meta as any).env).filter((k: string) => k.includes('GEMINI'))
   });
 
-  // 아이템시즌별판매 데이터 로드
+  // 아이템시즌별판매 데이터 로드 (해당 매장 샤드만, 분석 번들에 이미 있는 매장이면 받지 않는다)
   let itemSeasonData;
-  try {
-    itemSeasonData = await dataService.getItemSeasonData();
-  } catch (err) {
-    console.error("Failed to load item season data", err);
+  if (!hasItemSeasonAnalytics(storeData.store.name)) {
+    try {
+      itemSeasonData = await dataService.getStoreShards('item_season_data', [storeData.store.name]);
+    } catch (err) {
+      console.error("Failed to load item season data", err);
+    }
   }
 
   if (!apiKey) {
@@ -41,11 +43,12 @@ export const getStoreInsights = async (storeData: StoreData): Promise<string> =>
     .map(p => `${p.month}: ${p.revenue}만원 (전년 ${p.target}만원, ${p.growthRate && p.growthRate >= 0 ? '+' : ''}${p.growthRate?.toFixed(1) || 0}%)`)
     .join('\n');
 
-  const topItems = storeData.itemPerformance
+  // itemPerformance가 비어 있으면 (아이템시즌 샤드가 아직 없거나 매장 데이터 없음) 빈 목록 대신 표시 문구
+  const topItems = [...storeData.itemPerformance]
     .sort((a, b) => b.sales - a.sales)
     .slice(0, 5)
     .map(i => `- ${i.name}: ${i.sales}만원 판매 (25년 1~11월), 전년 대비 ${i.growth >= 0 ? '+' : ''}${i.growth.toFixed(1)}%`)
-    .join('\n');
+    .join('\n') || '- ITEM별 판매 데이터 없음';
 
   // 매니저 근속연수 계산
   const managerYears = storeData.store.manager.startDate
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+유사 매장 이웃 테이블: 매장마다 매출이 비슷한 매장 목록과 비교 화면에 쓰는 요약값을 미리 계산해 둔다.
+
+대시보드의 findSimilarStores(utils/similarStoreAnalyzer.ts)는 매장을 고를 때마다 전체 매장을 훑어
+±20% 매출 구간을 찾았고, collectComparisonData는 이웃마다 아이템시즌/재고 행을 다시 걸렀다.
+
+- 매출 구간 이웃: 월별로 매출 순 정렬한 색인에서 bisect로 [r(1-t), r(1+t)] 구간만 꺼내고
+  매출 차이가 작은 순으로 TOP_K개를 고른다. 구간(t)은 NEIGHBOR_BANDS마다 따로 저장한다.
+  기준 월은 findSimilarStores와 같이 대상 매장의 올해 첫 실적 월이다.
+- 다중 특성 이웃: 월평균 매출(log), PY, 등급, ITEM 구성비로 거리(FEATURE_WEIGHTS 가중)를 재서 가까운 순.
+- 매장 요약: 최신 월 ITEM/시즌별 판매액, 최신 월 매출(만원), 시즌별 재고 (collectComparisonData와 같은 규칙)
+"""
+import math
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 특성 거리를 순수 파이썬으로 계산한다
+    np = None
+
+NEIGHBORS_FILENAME = 'store_neighbors.json'
+NEIGHBOR_BANDS = (0.1, 0.2, 0.3)  # 매출 ±10% / ±20% (findSimilarStores 기본) / ±30%
+TOP_K = 5
+GRADE_ORDER = {'S': 0, 'A': 1, 'B': 2, 'C': 3, 'D': 4}
+# 특성별 가중치. 수치 특성은 표준화한 차이, ITEM 구성비는 총변동 거리(0~1)에 ITEM_MIX_SCALE을 곱해 쓴다
+FEATURE_WEIGHTS = {'revenue': 1.0, 'py': 0.5, 'grade': 0.5, 'item_mix': 1.0}
+ITEM_MIX_SCALE = 2.0
+
+
+def _number(value):
+    """클라이언트의 `value || 0`처럼 숫자가 아니면 0으로 본다."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return 0
+    return value
+
+
+def _round_half_up(value):
+    """JS Math.round와 같은 반올림"""
+    return math.floor(value + 0.5)
+
+
+def latest_month_key(headers):
+    """아이템시즌별판매 헤더 중 가장 최근 'YYYYMM' 열"""
+    months = sorted(h for h in headers if isinstance(h, str) and len(h) == 6 and h.isdigit())
+    return months[-1] if months else None
+
+
+def store_summaries(item_rows, item_headers, inventory_rows, store_key='매장ID'):
+    """매장ID -> 비교 화면 요약.
+
+    {'latest_revenue': 최신 월 판매액 합계(만원), 'item_sales': {ITEM: 원}, 'season_sales': {시즌: 원},
+     'inventory': {'총재고수량', '총재고택가', '시즌별재고': {시즌: {'재고수량', '재고금액'}}}}
+    """
+    latest = latest_month_key(item_headers)
+    sales = {}
+    if latest:
+        for row in item_rows:
+            store_id = row.get(store_key)
+            if not store_id:
+                continue
+            entry = sales.get(store_id)
+            if entry is None:
+                entry = sales[store_id] = [0, {}, {}]
+            value = _number(row.get(latest))
+            entry[0] += value
+            item = row.get('ITEM') or '기타'
+            entry[1][item] = entry[1].get(item, 0) + value
+            season = row.get('시즌') or '기타'
+            entry[2][season] = entry[2].get(season, 0) + value
+
+    inventories = {}
+    for row in inventory_rows:
+        store_id = row.get(store_key)
+        if not store_id:
+            continue
+        entry = inventories.get(store_id)
+        if entry is None:
+            entry = inventories[store_id] = {'총재고수량': 0, '총재고택가': 0, '시즌별재고': {}}
+        quantity = _number(row.get('매장재고수량'))
+        amount = _number(row.get('매장재고택가'))
+        entry['총재고수량'] += quantity
+        entry['총재고택가'] += amount
+        season = entry['시즌별재고'].setdefault(row.get('시즌') or '기타', {'재고수량': 0, '재고금액': 0})
+        season['재고수량'] += quantity
+        season['재고금액'] += amount
+
+    summaries = {}
+    for store_id in sorted(set(sales) | set(inventories)):
+        total, items, seasons = sales.get(store_id, (0, {}, {}))
+        summaries[store_id] = {
+            'latest_revenue': _round_half_up(total / 10000),
+            'item_sales': items,
+            'season_sales': seasons,
+            'inventory': inventories.get(store_id, {'총재고수량': 0, '총재고택가': 0, '시즌별재고': {}}),
+        }
+    return latest, summaries
+
+
+def _revenue_neighbors(stores, current):
+    """stores: [(매장ID, 매장명)], current: 매장ID -> 올해 1~12월 매출(만원)
+    -> 매장ID -> {'month': 기준 월 인덱스, 'revenue', 'bands': {구간: [(매장ID, 매출, 차이)]}}"""
+    # 월마다 (매출, 매장 순번) 정렬 색인. 매출 0인 매장은 어떤 구간에도 들지 않으므로 뺀다
+    indexes = []
+    for month in range(12):
+        entries = sorted((current[store_id][month], i) for i, (store_id, _) in enumerate(stores)
+                         if store_id in current and current[store_id][month] > 0)
+        indexes.append(([revenue for revenue, _ in entries], [i for _, i in entries]))
+
+    result = {}
+    for i, (store_id, _) in enumerate(stores):
+        months = current.get(store_id)
+        month = next((m for m, revenue in enumerate(months) if revenue > 0), None) if months else None
+        if month is None:
+            continue
+        target = months[month]
+        revenues, order = indexes[month]
+        bands = {}
+        for band in NEIGHBOR_BANDS:
+            lo = bisect_left(revenues, target * (1 - band))
+            hi = bisect_right(revenues, target * (1 + band))
+            # 매출 차이가 작은 순, 같으면 매장명 순 (대시보드의 매장 목록 순서)
+            candidates = sorted((abs(revenues[k] - target), stores[order[k]][1], order[k], revenues[k])
+                                for k in range(lo, hi) if order[k] != i)
+            bands[f'{band:g}'] = [(stores[j][0], revenue, diff) for diff, _, j, revenue in candidates[:TOP_K]]
+        result[store_id] = {'month': month, 'revenue': target, 'bands': bands}
+    return result
+
+
+def _feature_rows(stores, stores_meta, cube_rows, summaries):
+    """매장별 특성 (월평균 매출 log, PY, 등급 순번, ITEM 구성비). 매출이 없는 매장은 None."""
+    items = sorted({item for s in summaries.values() for item in s['item_sales']})
+    rows = []
+    for store_id, _ in stores:
+        cube_row = cube_rows.get(store_id)
+        if not cube_row or cube_row['ytd'] <= 0:
+            rows.append(None)
+            continue
+        meta = stores_meta.get(store_id, {})
+        py = meta.get('PY')
+        grade = GRADE_ORDER.get(str(meta.get('등급') or '').strip().upper())
+        item_sales = summaries.get(store_id, {}).get('item_sales', {})
+        total = sum(v for v in item_sales.values() if v > 0)
+        mix = [max(item_sales.get(item, 0), 0) / total if total > 0 else 0.0 for item in items]
+        rows.append({
+            'revenue': math.log1p(cube_row['ytd'] / cube_row['active_months']),
+            'py': float(py) if isinstance(py, (int, float)) and not isinstance(py, bool) else None,
+            'grade': float(grade) if grade is not None else None,
+            'item_mix': mix,
+        })
+    return rows
+
+
+def _standardize(rows, name):
+    """수치 특성을 z-점수로. 값이 없는 매장은 평균(0)으로 본다."""
+    values = [row[name] for row in rows if row is not None and row[name] is not None]
+    if len(values) < 2:
+        return [0.0] * len(rows)
+    mean = sum(values) / len(values)
+    std = math.sqrt(sum((v - mean) ** 2 for v in values) / len(values)) or 1.0
+    return [((row[name] - mean) / std) if row is not None and row[name] is not None else 0.0 for row in rows]
+
+
+def _feature_neighbors(stores, rows):
+    """-> 매장ID -> [(매장ID, 거리)] 가까운 순 TOP_K"""
+    active = [i for i, row in enumerate(rows) if row is not None]
+    if len(active) < 2:
+        return {}
+    scalars = {name: _standardize(rows, name) for name in ('revenue', 'py', 'grade')}
+    weights = FEATURE_WEIGHTS
+
+    if np is not None:
+        # 매장 하나씩 나머지 전체와의 거리를 한 번에 계산한다 (메모리는 매장 수 × 특성 수)
+        idx = np.array(active)
+        scalar = np.stack([np.array(scalars[name])[idx] * math.sqrt(weights[name])
+                           for name in ('revenue', 'py', 'grade')], axis=1)
+        mix = np.array([rows[i]['item_mix'] for i in active], dtype=np.float64).reshape(len(active), -1)
+        distances = []
+        for a_pos in range(len(active)):
+            sq = ((scalar - scalar[a_pos]) ** 2).sum(axis=1)
+            tv = np.abs(mix - mix[a_pos]).sum(axis=1) / 2 * ITEM_MIX_SCALE
+            distances.append(np.sqrt(sq + weights['item_mix'] * tv ** 2).tolist())
+    else:
+        distances = []
+        for a in active:
+            line = []
+            for b in active:
+                sq = sum(weights[name] * (scalars[name][a] - scalars[name][b]) ** 2
+                         for name in ('revenue', 'py', 'grade'))
+                tv = sum(abs(x - y) for x, y in zip(rows[a]['item_mix'], rows[b]['item_mix'])) / 2 * ITEM_MIX_SCALE
+                line.append(math.sqrt(sq + weights['item_mix'] * tv ** 2))
+            distances.append(line)
+
+    result = {}
+    for a_pos, a in enumerate(active):
+        ranked = sorted((distances[a_pos][b_pos], stores[b][1], b) for b_pos, b in enumerate(active) if b != a)
+        result[stores[a][0]] = [(stores[b][0], round(distance, 4)) for distance, _, b in ranked[:TOP_K]]
+    return result
+
+
+def build_store_neighbors(store_rows, cube, item_rows, item_headers, inventory_rows):
+    """내보낸 표에서 이웃 테이블 dict를 만든다. 매장/실적 큐브가 없으면 None.
+
+    store_rows: store_data.json 행 (매장명, PY, 등급, 매장ID)
+    cube: performance_cube.json (performance_cube.build_performance_cube)
+    """
+    if not store_rows or not cube:
+        return None
+    stores, stores_meta = [], {}
+    for row in store_rows:
+        store_id = row.get('매장ID')
+        if store_id and store_id not in stores_meta:
+            stores.append((store_id, str(row.get('매장명') or '')))
+            stores_meta[store_id] = row
+    cube_rows = {store_id: {'current': cube['current'][i], 'ytd': cube['ytd'][i],
+                            'active_months': cube['active_months'][i]}
+                 for i, store_id in enumerate(cube['store_ids'])}
+
+    item_month, summaries = store_summaries(item_rows, item_headers, inventory_rows)
+    revenue = _revenue_neighbors(stores, {store_id: row['current'] for store_id, row in cube_rows.items()})
+    features = _feature_neighbors(stores, _feature_rows(stores, stores_meta, cube_rows, summaries))
+
+    result = {}
+    for store_id, name in stores:
+        entry = {'name': name}
+        if store_id in revenue:
+            base = revenue[store_id]
+            entry['month'] = f"{cube['current_year']}{str(base['month'] + 1).zfill(2)}"
+            entry['revenue'] = base['revenue']
+            entry['bands'] = {band: [{'id': n, 'revenue': r, 'diff': d} for n, r, d in neighbors]
+                              for band, neighbors in base['bands'].items()}
+        if store_id in features:
+            entry['features'] = [{'id': n, 'distance': d} for n, d in features[store_id]]
+        if store_id in summaries:
+            entry['summary'] = summaries[store_id]
+        result[store_id] = entry
+    return {
+        'format': 'store_neighbors',
+        'current_year': cube['current_year'],
+        'item_month': item_month,
+        'bands': [f'{band:g}' for band in NEIGHBOR_BANDS],
+        'top_k': TOP_K,
+        'stores': result,
+    }
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+매장명 표준화 레지스트리.
+
+시트마다 같은 매장이 다른 이름으로 들어온다
+('29CM(롯데본점)', '롯데영플대구close', '현대울산(동구)', 경쟁사 시트의 '더현대 서울' 등).
+내보내기 단계에서 모든 변형을 표준 매장명 -> 고정 매장ID로 한 번만 풀어 두고
+각 행에 '매장ID'를 붙여 두면, 대시보드는 정규식 스캔 대신 ID로 바로 조인할 수 있다.
+"""
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+
+STORE_ID_KEY = '매장ID'
+REGISTRY_FILENAME = 'store_registry.json'
+
+# 경쟁사 시트 백화점명 -> 표준 매장명 (utils/competitorStoreMapping.ts STORE_TO_COMPETITOR_ALIAS와 동일)
+COMPETITOR_ALIASES = {
+    '더현대서울': ['더현대서울', '더현대 서울', '현대서울', '더현대'],
+    '더현대울산': ['더현대울산', '더현대 울산', '현대울산'],
+    '갤러리아광교': ['갤러리아광교', '갤러리아 광교'],
+}
+_COMPETITOR_ALIAS_LOOKUP = {alias: store for store, aliases in COMPETITOR_ALIASES.items() for alias in aliases}
+
+_BRACKET_RE = re.compile(r'\(([^)]+)\)')
+_CLOSED_RE = re.compile(r'\s*close[d]?$', re.IGNORECASE)
+
+
+def normalize_store_name(name):
+    if not name:
+        return name
+    name_str = str(name).strip()
+
+    # Specific normalization for Ulsan stores
+    # '현대울산' is likely the main branch, '현대울산동구' is the Dong-gu branch
+    if name_str in ['현대울산(동)', '현대울산(동구)', '현대 울산 동구']:
+        return '현대울산동구'
+    if name_str == '현대울산':
+        return '현대울산'
+
+    return name_str
+
+
+@lru_cache(maxsize=None)
+def canonical_store_name(raw_name, source=None):
+    """원본 매장명 -> (표준 매장명, 폐점 여부). 매장명이 비어 있으면 (None, False)."""
+    name = normalize_store_name(raw_name)
+    if not name:
+        return None, False
+    name = str(name)
+    if source == 'competitor' and name in _COMPETITOR_ALIAS_LOOKUP:
+        return _COMPETITOR_ALIAS_LOOKUP[name], False
+
+    # '29CM(롯데본점)' -> '롯데본점' (대시보드 매칭 규칙과 같게 괄호 안 이름이 실제 매장)
+    match = _BRACKET_RE.search(name)
+    if match:
+        name = match.group(1)
+    closed = bool(_CLOSED_RE.search(name))
+    if closed:
+        name = _CLOSED_RE.sub('', name)
+    name = re.sub(r'\s+', '', name)
+    return (name or None), closed
+
+
+def store_id_for(canonical_name):
+    """표준 매장명에서 결정적으로 만든 고정 ID (실행/시트 순서와 무관)"""
+    return 'S' + hashlib.sha1(canonical_name.encode('utf-8')).hexdigest()[:8]
+
+
+class StoreRegistry:
+    """이번 실행에서 본 원본 매장명 변형을 모아 store_registry.json으로 쓴다."""
+
+    def __init__(self):
+        self.stores = {}              # 매장ID -> {'name', 'closed'}
+        self.aliases = {}             # 원본 매장명 -> 매장ID
+        self.competitor_aliases = {}  # 경쟁사 시트 백화점명 -> 매장ID ('현대울산'이 다른 매장을 가리킴)
+
+    def resolve(self, raw_name, source=None):
+        """원본 매장명의 매장ID. 매장명이 비어 있으면 None."""
+        if raw_name is None:
+            return None
+        raw = str(raw_name).strip()
+        aliases = self.competitor_aliases if source == 'competitor' else self.aliases
+        store_id = aliases.get(raw)
+        if store_id:
+            return store_id
+        canonical, closed = canonical_store_name(raw, source)
+        if not canonical:
+            return None
+        store_id = store_id_for(canonical)
+        entry = self.stores.setdefault(store_id, {'name': canonical, 'closed': closed})
+        # 같은 매장이 영업 중인 이름으로도 나오면 영업 중으로 본다
+        entry['closed'] = entry['closed'] and closed
+        aliases[raw] = store_id
+        # 폐점 표기에서 얻은 표준 매장명은 저장할 때 별칭으로 넣는다. 지금 넣으면 뒤에 나오는 영업 중인
+        # 표준 매장명이 별칭 조회로 끝나 폐점 표시가 풀리지 않는다
+        if not closed:
+            self.aliases.setdefault(canonical, store_id)
+        return store_id
+
+    def snapshot(self):
+        return {'stores': self.stores, 'aliases': self.aliases, 'competitor_aliases': self.competitor_aliases}
+
+    def merge(self, snapshot):
+        """다른 프로세스(병렬 워커)나 이전 실행에서 모은 변형을 합친다."""
+        stores = snapshot.get('stores', {})
+        for store_id, entry in stores.items():
+            current = self.stores.get(store_id)
+            if current:
+                current['closed'] = current['closed'] and entry.get('closed', False)
+            else:
+                self.stores[store_id] = dict(entry)
+        for key in ('aliases', 'competitor_aliases'):
+            target = getattr(self, key)
+            for raw, store_id in snapshot.get(key, {}).items():
+                if store_id in stores:
+                    target.setdefault(raw, store_id)
+
+    def save(self, data_dir):
+        """이전 레지스트리와 합쳐 저장한다 (캐시로 건너뛴 시트의 변형도 유지)."""
+        path = os.path.join(data_dir, REGISTRY_FILENAME)
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.merge(json.load(f))
+            except (OSError, ValueError) as e:
+                print(f"Warning: rebuilding unreadable {path}: {e}")
+        for store_id, entry in self.stores.items():
+            self.aliases.setdefault(entry['name'], store_id)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'stores': dict(sorted(self.stores.items(), key=lambda item: item[1]['name'])),
+                'aliases': dict(sorted(self.aliases.items())),
+                'competitor_aliases': dict(sorted(self.competitor_aliases.items())),
+            }, f, ensure_ascii=False, indent=2)
+        print(f"Saved {len(self.stores)} stores / {len(self.aliases)} name variants to {REGISTRY_FILENAME}")
+
+
+REGISTRY = StoreRegistry()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+매장별 베스트 스타일 순위: 매장 × 기간마다 판매액/판매수량 상위 N개 품번을 미리 뽑아 둔다.
+
+대시보드의 StoreBestItems와 비교 인사이트(getBestItems)는 매장을 고를 때마다
+store_style_sales_data 전체(또는 샤드)를 받아 품번별로 합산하고 정렬했다.
+순위 파일이 있으면 매장 하나의 목록만 읽으면 된다.
+
+추출기는 행을 읽는 대로 add()로 넘기고, 품번별 합계만 (매장, 기간, 품번) 단위로 유지한다.
+순위는 heapq.nlargest로 상위 N개만 부분 정렬한다. 동점이면 먼저 나온 품번이 앞선다
+(클라이언트의 안정 정렬과 같은 순서).
+"""
+import heapq
+
+RANKINGS_FILENAME = 'style_rankings.json'
+TOP_N = 10
+ALL_PERIODS = 'all'  # 내보낸 일자 범위 전체
+
+# 품번별 누적값 [제품명, 판매수량, 판매액, 양수 판매액, 첫 양수 행의 제품명, 첫 양수 행 순번] 의 위치
+# 비교 인사이트는 판매액이 양수인 행만 보므로 그 순위의 제품명과 동점 순서는 첫 양수 행 기준이다
+NAME, QUANTITY, SALES, GROSS_SALES, GROSS_NAME, GROSS_ORDER = range(6)
+
+
+def _number(value):
+    """클라이언트의 `value || 0`처럼 숫자가 아니면 0으로 본다."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return 0
+    return value
+
+
+class StyleRankingBuilder:
+    """(매장ID, 기간, 품번)별 판매액/판매수량 합계를 모아 상위 N개 순위를 만든다."""
+
+    def __init__(self, top_n=TOP_N):
+        self.top_n = top_n
+        self.groups = {}  # (매장ID, 기간) -> {품번: [제품명, 판매수량, 판매액, 판매액(양수 행만), ...]}
+        self.gross_counts = {}  # (매장ID, 기간) -> 양수 판매액이 나온 품번 수
+
+    def add(self, store_id, period, row):
+        """row: 내보내는 스타일판매 행 ('품번', '제품명', '판매액합계', '판매수량합계').
+        전체 기간(ALL_PERIODS)과, period가 있으면 해당 월에도 더한다."""
+        if not store_id:
+            return
+        style = row.get('품번') or '기타'
+        quantity = _number(row.get('판매수량합계'))
+        sales = _number(row.get('판매액합계'))
+        for key in ((store_id, ALL_PERIODS), (store_id, period)) if period else ((store_id, ALL_PERIODS),):
+            items = self.groups.get(key)
+            if items is None:
+                items = self.groups[key] = {}
+            item = items.get(style)
+            if item is None:
+                item = items[style] = [row.get('제품명') or style, 0, 0, 0, None, None]
+            item[QUANTITY] += quantity
+            item[SALES] += sales
+            if sales > 0:
+                item[GROSS_SALES] += sales
+                if item[GROSS_ORDER] is None:
+                    item[GROSS_NAME] = row.get('제품명') or style
+                    item[GROSS_ORDER] = self.gross_counts[key] = self.gross_counts.get(key, 0) + 1
+
+    def _top(self, items, column):
+        """column 기준 상위 top_n개 품번. heapq.nlargest는 sorted(..., reverse=True)[:n]과 같은 순서를 낸다."""
+        candidates = items.items()
+        name, amount = NAME, SALES
+        if column == GROSS_SALES:
+            # 비교 인사이트는 판매액이 양수인 행만 합산하므로 그런 행이 없는 품번은 빠지고,
+            # 품번은 첫 양수 행이 나온 순서로 놓인다 (동점 순서)
+            candidates = sorted(((style, item) for style, item in candidates if item[GROSS_SALES] > 0),
+                                key=lambda entry: entry[1][GROSS_ORDER])
+            name, amount = GROSS_NAME, GROSS_SALES
+        top = heapq.nlargest(self.top_n, candidates, key=lambda entry: entry[1][column])
+        return [{'품번': style, '제품명': item[name], '판매수량': item[QUANTITY], '판매금액': item[amount]}
+                for style, item in top]
+
+    def build(self, store_names):
+        """-> 순위 dict. 매장이 하나도 없으면 None.
+
+        store_names: 매장ID -> {'name': 표준 매장명} (store_registry.REGISTRY.stores)
+        """
+        if not self.groups:
+            return None
+        stores = {}
+        for (store_id, period), items in sorted(self.groups.items()):
+            entry = stores.get(store_id)
+            if entry is None:
+                entry = stores[store_id] = {'name': store_names.get(store_id, {}).get('name', store_id),
+                                            'periods': {}}
+            entry['periods'][period] = {
+                'sales': self._top(items, SALES),              # 판매액합계 순 (StoreBestItems)
+                'quantity': self._top(items, QUANTITY),        # 판매수량합계 순
+                'gross_sales': self._top(items, GROSS_SALES),  # 양수 판매액만 합산한 순 (비교 인사이트)
+            }
+        periods = sorted({period for _, period in self.groups if period != ALL_PERIODS})
+        return {
+            'format': 'style_rankings',
+            'top_n': self.top_n,
+            'periods': [ALL_PERIODS] + periods,
+            'stores': stores,
+        }
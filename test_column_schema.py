@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""column_schema: 열 변환 기억과 시트별 문자열 풀."""
+from datetime import datetime
+
+from column_schema import CATEGORY, DATE, STORE_NAME, TEXT, SheetSchema, memoized
+
+
+def test_memo_cap_limits_pool():
+    pool = {}
+    convert = memoized(lambda value: value.strip(), (str,), max_entries=2, pool=pool)
+    assert [convert(f' v{i} ') for i in range(5)] == [f'v{i}' for i in range(5)]
+    # 기억 상한을 넘은 값은 변환만 하고 풀에도 넣지 않는다
+    assert len(convert.cache) == 2
+    assert sorted(pool) == ['v0', 'v1']
+
+
+def test_columns_share_one_pool_per_compile():
+    schema = SheetSchema({'매장명': STORE_NAME, '비고': TEXT})
+    name_of, note_of = schema.compile(['매장명', '비고'])
+    assert name_of('롯데본점') is note_of(' 롯데본점 ')
+    # 새로 compile하면 새 풀 (이전 시트의 문자열을 붙잡아 두지 않는다)
+    other_name_of, _ = schema.compile(['매장명', '비고'])
+    assert other_name_of.cache == {}
+
+
+def test_date_kinds():
+    date_of, category_of = SheetSchema({'일자': DATE, '시즌': CATEGORY}).compile(['일자', '시즌'])
+    assert date_of(datetime(2025, 3, 1)) == '2025-03-01'
+    assert date_of(20250301) == 20250301
+    assert category_of('25S') == '25S'
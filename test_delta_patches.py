@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""delta_patches: 패치를 이전 표에 적용하면 새 표가 되는지 (diff_tables 기준 구현과 PatchWriter 스트리밍 경로)."""
+import json
+import os
+
+import pytest
+
+from delta_patches import ROW_KEYS, PatchWriter, apply_patch, diff_tables, row_keys
+
+OUTPUT = 'store_style_sales_data.json'
+KEY = ROW_KEYS[OUTPUT]  # 매장명, 품번, 일자
+HEADERS = KEY + ['판매액']
+DAY = '2026-01-05'
+
+
+def _rows(*items):
+    """(매장명, 품번, 판매액) -> 행 dict (일자는 모두 같은 날)"""
+    return [dict(zip(HEADERS, (store, code, DAY, sales))) for store, code, sales in items]
+
+
+OLD = _rows(('롯데본점', 'A1', 100), ('롯데본점', 'A2', 200), ('신세계강남', 'A1', 300),
+            ('현대무역', 'B1', 400), ('현대무역', 'B1', 500))
+
+CASES = {
+    'value change': _rows(('롯데본점', 'A1', 150), ('롯데본점', 'A2', 200), ('신세계강남', 'A1', 300),
+                          ('현대무역', 'B1', 400), ('현대무역', 'B1', 500)),
+    'insert and delete': _rows(('롯데본점', 'A1', 100), ('신세계강남', 'A1', 300), ('신세계강남', 'A9', 50),
+                               ('현대무역', 'B1', 400), ('현대무역', 'B1', 500)),
+    'moved rows': _rows(('현대무역', 'B1', 400), ('롯데본점', 'A1', 100), ('롯데본점', 'A2', 200),
+                        ('현대무역', 'B1', 500), ('신세계강남', 'A1', 300)),
+    # 중복 키의 첫 행이 지워지면 두 번째 행의 '#1' 키가 '#0'(접미사 없음)으로 밀린다
+    'duplicate key shift': _rows(('롯데본점', 'A1', 100), ('롯데본점', 'A2', 200), ('신세계강남', 'A1', 300),
+                                 ('현대무역', 'B1', 500)),
+    'duplicate key added': _rows(('롯데본점', 'A1', 100), ('롯데본점', 'A1', 100), ('롯데본점', 'A2', 200),
+                                 ('신세계강남', 'A1', 300), ('현대무역', 'B1', 400), ('현대무역', 'B1', 500)),
+    'emptied': [],
+}
+
+
+def test_row_keys_number_duplicates():
+    assert row_keys(OLD, KEY)[3:] == [f'현대무역\x1fB1\x1f{DAY}', f'현대무역\x1fB1\x1f{DAY}#1']
+
+
+@pytest.mark.parametrize('name', sorted(CASES))
+def test_diff_then_apply_round_trips(name):
+    new = CASES[name]
+    patch = diff_tables(HEADERS, OLD, HEADERS, new, KEY)
+    assert apply_patch(HEADERS, OLD, KEY, patch) == new
+
+
+def test_unchanged_table_gives_empty_patch():
+    assert diff_tables(HEADERS, OLD, HEADERS, [dict(row) for row in OLD], KEY) == {'deletes': [], 'upserts': []}
+
+
+def _export(data_dir, rows):
+    with open(os.path.join(data_dir, OUTPUT), 'w', encoding='utf-8') as f:
+        json.dump({'headers': HEADERS, 'data': rows, 'total_rows': len(rows)}, f, ensure_ascii=False, indent=2)
+
+
+@pytest.mark.parametrize('name', sorted(CASES))
+def test_patch_writer_matches_reference(tmp_path, name):
+    """스트리밍으로 쓴 패치 파일이 diff_tables와 같은 본문이고, 적용하면 새 표가 된다."""
+    data_dir, snapshot_dir = str(tmp_path / 'data'), str(tmp_path / 'snapshots')
+    os.makedirs(data_dir)
+    new = CASES[name]
+    for rows in (OLD, new):
+        _export(data_dir, rows)
+        writer = PatchWriter(data_dir, snapshot_dir)
+        written = writer.update(OUTPUT, lambda: (HEADERS, iter(rows)))
+        writer.save()
+
+    assert written is not None
+    with open(os.path.join(data_dir, 'patches', written['file']), encoding='utf-8') as f:
+        patch = json.load(f)
+    assert {'deletes': patch['deletes'], 'upserts': patch['upserts']} == diff_tables(HEADERS, OLD, HEADERS, new, KEY)
+    assert apply_patch(HEADERS, OLD, KEY, patch) == new
+    assert patch['total_rows'] == len(new)
+
+
+def test_patch_writer_skips_same_version(tmp_path):
+    data_dir, snapshot_dir = str(tmp_path / 'data'), str(tmp_path / 'snapshots')
+    os.makedirs(data_dir)
+    _export(data_dir, OLD)
+    for _ in range(2):
+        writer = PatchWriter(data_dir, snapshot_dir)
+        assert writer.update(OUTPUT, lambda: (HEADERS, iter(OLD))) is None
+        writer.save()
+    assert writer.datasets['store_style_sales_data']['patches'] == []
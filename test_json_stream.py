@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""json_stream: 스트리밍으로 쓴 표가 json.dump와 같은 바이트이고, iter_table로 다시 읽히는지."""
+import json
+
+import pytest
+
+import json_stream
+from json_stream import ShardWriter, TableWriter, iter_table
+
+HEADERS = ['매장명', '품번', '판매액', '비고']
+ROWS = [
+    {'매장명': '롯데본점', '품번': 'A1', '판매액': 1200.5, '비고': None},
+    {'매장명': '신세계강남', '품번': 'A"2', '판매액': -30, '비고': '줄\n바꿈, {괄호} [대괄호]'},
+    {'매장명': '현대무역', '품번': 'B1', '판매액': 0, '비고': ['목록', 1]},
+]
+
+
+def _dumped(rows):
+    return json.dumps({'headers': HEADERS, 'data': rows, 'total_rows': len(rows)}, ensure_ascii=False, indent=2)
+
+
+@pytest.mark.parametrize('rows', [ROWS, []])
+def test_table_writer_matches_json_dump(tmp_path, rows):
+    path = str(tmp_path / 'table.json')
+    with TableWriter(path, HEADERS) as writer:
+        for row in rows:
+            writer.write(row)
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == _dumped(rows)
+
+
+@pytest.mark.parametrize('rows', [ROWS, []])
+def test_iter_table_reads_rows_back(tmp_path, monkeypatch, rows):
+    # 조각 경계가 행 중간에 걸리도록 아주 작게 읽는다
+    monkeypatch.setattr(json_stream, 'READ_CHUNK_CHARS', 7)
+    path = tmp_path / 'table.json'
+    path.write_text(_dumped(rows), encoding='utf-8')
+    headers, rows_iter = iter_table(str(path))
+    assert headers == HEADERS
+    assert list(rows_iter) == rows
+
+
+@pytest.mark.parametrize('table', [
+    {'format': 'columnar', 'headers': HEADERS, 'columns': [], 'total_rows': 0},
+    {'headers': HEADERS, 'columns': [], 'total_rows': 0},
+])
+def test_iter_table_rejects_other_formats(tmp_path, monkeypatch, table):
+    monkeypatch.setattr(json_stream, 'READ_CHUNK_CHARS', 7)
+    path = tmp_path / 'table.json'
+    path.write_text(json.dumps(table, ensure_ascii=False), encoding='utf-8')
+    with pytest.raises(ValueError):
+        iter_table(str(path))
+
+
+def test_shard_writer_splits_by_key(tmp_path, monkeypatch):
+    monkeypatch.setattr(json_stream, 'SHARD_BATCH_ROWS', 2)  # 이어쓰기 경로도 거치게
+    writer = ShardWriter(str(tmp_path), HEADERS, lambda key: key + '.json')
+    for row in ROWS * 3:
+        writer.write(row['품번'][0], row)
+    entries = writer.close()
+
+    assert sorted(entries) == ['A', 'B']
+    assert entries['A']['rows'] == 6
+    expected = [row for row in ROWS * 3 if row['품번'].startswith('A')]
+    with open(tmp_path / 'A.json', encoding='utf-8') as f:
+        assert f.read() == _dumped(expected)
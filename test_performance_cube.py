@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""performance_cube: processPerformanceData(utils/performanceConverter.ts)로 손계산한 예제와 같은 값인지."""
+import pytest
+
+import performance_cube
+from performance_cube import build_performance_cube
+from store_registry import StoreRegistry
+
+# (판매시점, 매장명, 판매액 원)
+ROWS = [
+    ('202401', '롯데본점', 1000000),
+    ('202402', '롯데본점', 10000),
+    ('202403', '롯데본점', 500000),
+    ('202404', '롯데본점', 1000000),
+    ('202501', '롯데본점', 1200000),
+    ('202501', '29CM(롯데본점)', 300000),  # 같은 매장의 변형은 합산
+    ('202502', '롯데본점', 25000),          # 2.5만원 -> Math.round는 3
+    ('202504', '롯데본점', 4000),           # 0.4만원 -> 0, 실적 없는 월
+    ('202406', '신세계강남', 800000),       # 올해 실적이 없는 매장
+    ('199912', '롯데본점', 99999999),       # 연도 범위 밖
+    ('2025', '롯데본점', 99999999),         # 판매시점이 6자리 미만
+]
+
+# 롯데본점을 processPerformanceData로 계산한 값 (currentYear = 2025, 만원 단위)
+#   올해: 1월 150, 2월 3, 4월 0 / 전년: 1월 100, 2월 1, 3월 50, 4월 100
+#   연누계는 올해 실적이 있는 1, 2월만: 153 vs 101 -> 신장률 51.485.. -> 51.5
+LOTTE = {
+    'current': [150, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    'last_year': [100, 1, 50, 100, 0, 0, 0, 0, 0, 0, 0, 0],
+    'ytd': 153,
+    'ytd_last_year': 101,
+    'growth_rate': 51.5,
+    'active_months': 2,
+}
+SHINSEGAE = {
+    'current': [0] * 12,
+    'last_year': [0, 0, 0, 0, 0, 80, 0, 0, 0, 0, 0, 0],
+    'ytd': 0,
+    'ytd_last_year': 0,
+    'growth_rate': 0,
+    'active_months': 1,  # 실적 월이 없어도 1 (월평균 나눗셈용)
+}
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def cube(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(performance_cube, 'np', None)
+    registry = StoreRegistry()
+    rows = [{'판매시점': period, '매장명': name, '판매액': sales, '매장ID': registry.resolve(name)}
+            for period, name, sales in ROWS]
+    return build_performance_cube(rows, registry.stores)
+
+
+def _store(cube, name):
+    i = cube['store_names'].index(name)
+    return {key: cube[key][i] for key in LOTTE}
+
+
+def test_matches_process_performance_data(cube):
+    assert cube['current_year'] == 2025
+    assert cube['periods'][0] == '202401' and cube['periods'][-1] == '202512'
+    assert _store(cube, '롯데본점') == LOTTE
+    assert _store(cube, '신세계강남') == SHINSEGAE
+
+
+def test_sales_keep_won_per_month(cube):
+    i = cube['store_names'].index('롯데본점')
+    assert cube['sales'][i][12] == 1500000  # 202501, 변형 합산
+    assert sum(cube['sales'][i]) == 1000000 + 10000 + 500000 + 1000000 + 1500000 + 25000 + 4000
+
+
+def test_no_dated_rows_gives_none():
+    assert build_performance_cube([{'판매시점': None, '판매액': 1, '매장ID': 'S1'}], {}) is None
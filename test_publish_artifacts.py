@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""publish_artifacts: 내용 해시 산출물, 변하지 않은 파일 건너뛰기, 미리 압축 변형."""
+import json
+import os
+
+from publish_artifacts import ARTIFACT_MANIFEST, publish
+
+
+def _export(data_dir, name, value):
+    path = os.path.join(data_dir, *name.split('/'))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(value, f, ensure_ascii=False, indent=2)
+
+
+def _manifest(data_dir):
+    with open(os.path.join(data_dir, ARTIFACT_MANIFEST), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_hashed_copies_are_minified(tmp_path):
+    data_dir = str(tmp_path)
+    _export(data_dir, 'store_data.json', {'data': [{'매장명': '롯데본점'}]})
+    _export(data_dir, 'shards/item_season_data/S1.json', {'data': []})
+    assert publish(data_dir) == (2, 2, 0)
+
+    files = _manifest(data_dir)['files']
+    assert sorted(files) == ['shards/item_season_data/S1.json', 'store_data.json']
+    entry = files['store_data.json']
+    assert entry['file'].startswith('assets/store_data.') and 'gzip' not in entry
+    with open(os.path.join(data_dir, entry['file']), encoding='utf-8') as f:
+        assert f.read() == '{"data":[{"매장명":"롯데본점"}]}'
+
+
+def test_rewritten_but_unchanged_file_is_skipped(tmp_path):
+    data_dir = str(tmp_path)
+    _export(data_dir, 'store_data.json', {'data': [1, 2]})
+    publish(data_dir)
+    before = _manifest(data_dir)['files']['store_data.json']
+
+    _export(data_dir, 'store_data.json', {'data': [1, 2]})  # --force처럼 같은 내용을 다시 씀
+    assert publish(data_dir) == (1, 0, 0)
+    assert _manifest(data_dir)['files']['store_data.json']['file'] == before['file']
+
+    _export(data_dir, 'store_data.json', {'data': [1, 2, 3]})
+    assert publish(data_dir) == (1, 1, 0)
+    # 이전 산출물은 직전 매니페스트를 받은 클라이언트를 위해 한 번 더 남겼다가 지운다
+    assert os.path.exists(os.path.join(data_dir, before['file']))
+    assert publish(data_dir) == (1, 0, 1)
+    assert not os.path.exists(os.path.join(data_dir, before['file']))
+
+
+def test_precompress_adds_and_later_drops_variants(tmp_path):
+    data_dir = str(tmp_path)
+    _export(data_dir, 'store_data.json', {'data': list(range(100))})
+    publish(data_dir, precompress=True)
+    entry = _manifest(data_dir)['files']['store_data.json']
+    assert entry['gzip'] > 0
+    assert os.path.exists(os.path.join(data_dir, entry['file'] + '.gz'))
+
+    publish(data_dir)
+    assert 'gzip' not in _manifest(data_dir)['files']['store_data.json']
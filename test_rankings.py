@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""style_rankings / competitor_rankings: 미리 계산한 순위가 클라이언트의 집계·안정 정렬과 같은지.
+
+_client_* 함수는 StoreBestItems.tsx, comparisonInsightService.getBestItems,
+competitorStoreMapping.ts / read_competitor_final.py의 계산을 그대로 옮긴 기준 구현이다.
+"""
+import random
+
+import pytest
+
+import competitor_rankings
+from competitor_rankings import build_competitor_rankings
+from style_rankings import ALL_PERIODS, StyleRankingBuilder
+
+
+def _style_rows(seed=7, count=400):
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        style = rng.choice(['A1', 'A2', 'B1', 'B2', 'C1', 'C2', 'D1', None])
+        rows.append({
+            '매장ID': rng.choice(['S1', 'S2']),
+            '일자': rng.choice(['2025-01-03', '2025-01-20', '2025-02-11']),
+            '품번': style,
+            '제품명': f'{style} 상품' if style else None,
+            # 동점이 자주 나도록 금액을 몇 가지로만, 반품(음수)과 빈 값도 섞는다
+            '판매액합계': rng.choice([10000, 20000, 20000, -10000, 0, None]),
+            '판매수량합계': rng.choice([1, 2, 2, -1, None]),
+        })
+    return rows
+
+
+def _client_best_items(rows, gross=False, column='판매금액'):
+    """StoreBestItems(gross=False) / getBestItems(gross=True)의 품번별 합산 + column 내림차순 안정 정렬"""
+    items = {}
+    for row in rows:
+        style = row['품번'] or '기타'
+        sales = row['판매액합계'] or 0
+        if gross and not sales > 0:
+            continue
+        item = items.setdefault(style, {'품번': style, '제품명': row['제품명'] or style, '판매수량': 0, '판매금액': 0})
+        item['판매수량'] += row['판매수량합계'] or 0
+        item['판매금액'] += sales
+    return sorted(items.values(), key=lambda item: -item[column])
+
+
+@pytest.mark.parametrize('period', [ALL_PERIODS, '2025-01', '2025-02'])
+@pytest.mark.parametrize('store_id', ['S1', 'S2'])
+def test_style_rankings_match_client(store_id, period):
+    rows = _style_rows()
+    builder = StyleRankingBuilder(top_n=5)
+    for row in rows:
+        builder.add(row['매장ID'], row['일자'][:7], row)
+    ranking = builder.build({'S1': {'name': '롯데본점'}})['stores'][store_id]['periods'][period]
+
+    selected = [row for row in rows if row['매장ID'] == store_id and period in (ALL_PERIODS, row['일자'][:7])]
+    assert ranking['sales'] == _client_best_items(selected)[:5]
+    # getBestItems는 품번/제품명/판매금액만 쓴다
+    assert [(item['품번'], item['제품명'], item['판매금액']) for item in ranking['gross_sales']] == \
+        [(item['품번'], item['제품명'], item['판매금액']) for item in _client_best_items(selected, gross=True)[:5]]
+    assert [item['품번'] for item in ranking['quantity']] == \
+        [item['품번'] for item in _client_best_items(selected, column='판매수량')[:5]]
+
+
+def test_gross_sales_skips_styles_without_positive_rows():
+    builder = StyleRankingBuilder()
+    builder.add('S1', None, {'품번': 'A1', '제품명': 'a', '판매액합계': -5000, '판매수량합계': -1})
+    builder.add('S1', None, {'품번': 'B1', '제품명': 'b', '판매액합계': 3000, '판매수량합계': 1})
+    periods = builder.build({})['stores']['S1']['periods']
+    assert [item['품번'] for item in periods[ALL_PERIODS]['sales']] == ['B1', 'A1']
+    assert [item['품번'] for item in periods[ALL_PERIODS]['gross_sales']] == ['B1']
+
+
+BRANDS = ['MLB', 'DISCOVERY', 'NBA', 'KANGOL']
+STORES = [
+    {'백화점': '롯데본점', '매장ID': 'S1', '브랜드별_월평균': {'MLB': 300, 'DISCOVERY': 500, 'NBA': 300, 'KANGOL': 0}},
+    {'백화점': '신세계강남', '매장ID': 'S2', '브랜드별_월평균': {'MLB': 700, 'DISCOVERY': 200, 'KANGOL': 50}},
+    {'백화점': '현대무역', '매장ID': 'S3', '브랜드별_월평균': {'MLB': 0, 'DISCOVERY': 500, 'NBA': 100, 'KANGOL': -20}},
+]
+
+
+def _client_ranked(pairs):
+    """[(이름, 월평균)] -> 0보다 큰 것만 월평균 내림차순 안정 정렬, 순위는 1부터"""
+    ranked = sorted(((name, value) for name, value in pairs if value > 0), key=lambda pair: -pair[1])
+    return [(name, value, rank) for rank, (name, value) in enumerate(ranked, start=1)]
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def rankings(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(competitor_rankings, 'np', None)
+    return build_competitor_rankings(STORES, BRANDS)
+
+
+def test_store_rankings_match_client(rankings):
+    for store, entry in zip(STORES, rankings['store_rankings']):
+        expected = _client_ranked((brand, store['브랜드별_월평균'].get(brand, 0)) for brand in BRANDS)
+        assert [(item['브랜드'], item['월평균'], item['순위']) for item in entry['brands']] == expected
+
+
+def test_brand_rankings_match_client(rankings):
+    for brand in BRANDS:
+        expected = _client_ranked((store['백화점'], store['브랜드별_월평균'].get(brand, 0)) for store in STORES)
+        assert [(item['백화점'], item['월평균'], item['순위']) for item in rankings['brand_rankings'][brand]] == expected
+
+
+def test_mlb_share_and_rank(rankings):
+    lotte, shinsegae, hyundai = rankings['store_rankings']
+    assert (lotte['mlb_rank'], lotte['mlb_share']) == (2, round(300 / 1100, 4))  # 동점 NBA보다 앞
+    assert (shinsegae['mlb_rank'], shinsegae['mlb_share']) == (1, round(700 / 950, 4))
+    assert (hyundai['mlb_rank'], hyundai['mlb_share']) == (None, 0)
+
+
+def test_rank_delta_against_previous_export():
+    first = build_competitor_rankings(STORES, BRANDS)
+    previous = {
+        'source_sha256': first['source_sha256'],
+        'ranks': {(entry['백화점'], item['브랜드']): item['순위']
+                  for entry in first['store_rankings'] for item in entry['brands']},
+        'baseline': {},
+    }
+    # 같은 데이터로 다시 내보내면 저장해 둔 기준(여기선 없음)을 그대로 쓴다
+    again = build_competitor_rankings(STORES, BRANDS, previous)
+    assert all(item['순위변동'] is None for entry in again['store_rankings'] for item in entry['brands'])
+
+    changed = [dict(STORES[0], 브랜드별_월평균={'MLB': 900, 'DISCOVERY': 500, 'NBA': 300})] + STORES[1:]
+    lotte = build_competitor_rankings(changed, BRANDS, previous)['store_rankings'][0]
+    assert (lotte['mlb_rank'], lotte['mlb_rank_delta']) == (1, 1)
+    assert {item['브랜드']: item['순위변동'] for item in lotte['brands']} == {'MLB': 1, 'DISCOVERY': -1, 'NBA': 0}
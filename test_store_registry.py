@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""store_registry: 매장명 변형 -> 표준 매장명/매장ID."""
+import json
+
+import pytest
+
+from store_registry import StoreRegistry, canonical_store_name, store_id_for
+
+
+@pytest.mark.parametrize('raw, source, expected', [
+    ('롯데본점', None, ('롯데본점', False)),
+    (' 롯데본점 ', None, ('롯데본점', False)),
+    ('29CM(롯데본점)', None, ('롯데본점', False)),
+    ('롯데영플대구close', None, ('롯데영플대구', True)),
+    ('현대중동 Closed', None, ('현대중동', True)),
+    ('현대울산(동구)', None, ('현대울산동구', False)),  # 괄호보다 울산 동구 표기 통일이 먼저
+    ('현대 울산 동구', None, ('현대울산동구', False)),
+    ('현대울산', None, ('현대울산', False)),
+    ('현대울산', 'competitor', ('더현대울산', False)),  # 경쟁사 시트의 '현대울산'은 다른 매장
+    ('더현대 서울', 'competitor', ('더현대서울', False)),
+    ('더현대', 'competitor', ('더현대서울', False)),
+    ('갤러리아 광교', 'competitor', ('갤러리아광교', False)),
+    ('', None, (None, False)),
+    (None, None, (None, False)),
+])
+def test_canonical_store_name(raw, source, expected):
+    assert canonical_store_name(raw, source) == expected
+
+
+def test_variants_share_one_id():
+    registry = StoreRegistry()
+    store_id = registry.resolve('롯데본점')
+    assert store_id == store_id_for('롯데본점')
+    assert registry.resolve('29CM(롯데본점)') == store_id
+    assert registry.resolve('롯데본점close') == store_id
+    assert registry.stores[store_id] == {'name': '롯데본점', 'closed': False}
+    assert registry.resolve('') is None and registry.resolve(None) is None
+
+
+def test_closed_only_while_every_variant_is_closed():
+    registry = StoreRegistry()
+    store_id = registry.resolve('롯데영플대구close')
+    assert registry.stores[store_id]['closed'] is True
+    registry.resolve('롯데영플대구')
+    assert registry.stores[store_id]['closed'] is False
+
+
+def test_competitor_aliases_kept_apart():
+    registry = StoreRegistry()
+    assert registry.resolve('현대울산') != registry.resolve('현대울산', source='competitor')
+    assert registry.competitor_aliases == {'현대울산': store_id_for('더현대울산')}
+    assert registry.aliases['현대울산'] == store_id_for('현대울산')
+
+
+def test_save_merges_previous_run(tmp_path):
+    first = StoreRegistry()
+    first.resolve('29CM(롯데본점)')
+    first.save(str(tmp_path))
+
+    # 캐시로 시트를 건너뛴 다음 실행에서도 이전 실행의 변형이 남는다
+    second = StoreRegistry()
+    second.resolve('신세계강남')
+    second.save(str(tmp_path))
+    with open(tmp_path / 'store_registry.json', encoding='utf-8') as f:
+        saved = json.load(f)
+    assert saved['aliases'] == {
+        '29CM(롯데본점)': store_id_for('롯데본점'),
+        '롯데본점': store_id_for('롯데본점'),
+        '신세계강남': store_id_for('신세계강남'),
+    }
+    assert [entry['name'] for entry in saved['stores'].values()] == ['롯데본점', '신세계강남']
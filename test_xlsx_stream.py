@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""xlsx_stream.sheet_fingerprints: 한 시트만 고쳤을 때 다른 시트는 내용 파싱 없이 그대로인지."""
+from datetime import datetime
+
+import openpyxl
+import pytest
+
+import xlsx_stream
+
+
+def _write_workbook(path, extra_rows=None):
+    """매장/실적/단체 세 시트짜리 워크북. extra_rows: {시트명: [추가 행, ...]}"""
+    wb = openpyxl.Workbook()
+    sheets = {
+        '매장': [['매장명', '형태', 'PY'], ['롯데본점', '백화점', 30], ['신세계강남', '백화점', 42]],
+        '실적': [['판매시점', '매장명', '판매액'], ['202501', '롯데본점', 1200], ['202501', '신세계강남', 800]],
+        '단체': [['구분', '매장명', '일자'], ['A', '롯데본점', datetime(2025, 3, 1)]],
+    }
+    for name, rows in (extra_rows or {}).items():
+        sheets[name] = sheets[name] + rows
+    wb.remove(wb.active)
+    for name, rows in sheets.items():
+        ws = wb.create_sheet(name)
+        for row in rows:
+            ws.append(row)
+    wb.save(path)
+
+
+@pytest.fixture
+def content_parses(monkeypatch):
+    """_content_digest가 불린 시트명 목록"""
+    calls = []
+    original = xlsx_stream._content_digest
+
+    def spy(workbook, name):
+        calls.append(name)
+        return original(workbook, name)
+
+    monkeypatch.setattr(xlsx_stream, '_content_digest', spy)
+    return calls
+
+
+def test_appending_row_keeps_other_sheets_fresh(tmp_path, content_parses):
+    path = tmp_path / 'backdata.xlsx'
+    _write_workbook(path)
+    before = xlsx_stream.sheet_fingerprints(path)
+    assert sorted(content_parses) == ['단체', '매장', '실적']
+
+    # 첫 시트에 새 문자열이 든 행을 붙이면 뒤 시트들의 공유 문자열 번호가 모두 밀린다
+    _write_workbook(path, {'매장': [['현대무역', '아울렛', 25]]})
+    content_parses.clear()
+    after = xlsx_stream.sheet_fingerprints(path, known=before)
+
+    assert content_parses == ['매장']
+    assert after['매장']['content'] != before['매장']['content']
+    assert after['실적'] == before['실적']
+    assert after['단체'] == before['단체']
+
+
+def test_unchanged_workbook_needs_no_content_parse(tmp_path, content_parses):
+    path = tmp_path / 'backdata.xlsx'
+    _write_workbook(path)
+    before = xlsx_stream.sheet_fingerprints(path)
+    content_parses.clear()
+    assert xlsx_stream.sheet_fingerprints(path, known=before) == before
+    assert content_parses == []
+
+
+def test_changed_string_value_changes_fingerprint(tmp_path):
+    path = tmp_path / 'backdata.xlsx'
+    _write_workbook(path)
+    before = xlsx_stream.sheet_fingerprints(path)
+
+    wb = openpyxl.load_workbook(path)
+    wb['실적']['B3'] = '현대무역'
+    wb.save(path)
+    after = xlsx_stream.sheet_fingerprints(path, known=before)
+
+    assert after['실적']['content'] != before['실적']['content']
+    assert after['매장'] == before['매장']
@@ -2,49 +2,95 @@
 """
 백데이터 엑셀(backdata.xlsx)의 모든 시트를 JSON으로 변환하여 public/data/에 저장합니다.
 프로젝트 루트에서 실행: python update_all_data.py
+내용이 바뀌지 않은 시트는 건너뜁니다 (.cache/build_cache.json). 전체 재생성: python update_all_data.py --force
+열 단위(columnar) 포맷으로 저장: python update_all_data.py --columnar
+내용 해시 산출물(public/data/assets, artifacts.json)을 만들지 않으려면: python update_all_data.py --no-publish
+data_server.py용 gzip/brotli 변형까지 만들려면: python update_all_data.py --precompress
+
+워크북은 read-only 스트리밍 모드로 한 번만 열고, 같은 프로세스 안에서
+update_data_unified.py의 시트 추출기들을 차례로 실행합니다.
+(이전에는 read_*.py 스크립트 8개를 각각 서브프로세스로 띄워 엑셀을 8번 파싱했습니다.)
+
+출력 형식은 update_data_unified.py와 같으며 read_*.py와 다른 파일이 있습니다 (README 'Updating the data files'):
+  performance_data.json       - (판매시점, 매장명)별 판매액 합계 (원본 행이 아님)
+  store_style_sales_data.json - STYLE_SALES_DATE_RANGE 안의 행만, 판매액합계/판매수량합계 헤더
+  store_data.json             - 빈 행 제외
 """
 import os
-import subprocess
+import sys
+import time
+
+import update_data_unified
+from build_cache import BuildCache
+from run_metrics import METRICS
+from update_data_unified import DATA_DIR, SHEET_JOBS, finalize, load_workbook, plan_jobs, process_generic_sheet
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+EXCEL_FILE = 'backdata.xlsx'
 
-scripts = [
-    ('read_store.py', '매장'),
-    ('read_item_season.py', '아이템시즌별판매'),
-    ('read_store_style_sales.py', '매장별스타일판매'),
-    ('read_store_inventory.py', '매장별재고'),
-    ('read_performance.py', '실적'),
-    ('read_group_data_v2.py', '단체 매출'),
-    ('read_competitor_v2_fixed.py', '경쟁사'),
-    ('read_weekly_meeting_final.py', '주간회의'),
+# 시트 추출기 목록. 출력 파일명은 기존 read_*.py 스크립트와 같다 (형식 차이는 모듈 docstring 참고).
+PIPELINE = SHEET_JOBS + [
+    (process_generic_sheet, '주간회의', 'weekly_meeting_data.json'),
 ]
 
+
+def run_pipeline(excel_file, force=False, publish=True):
+    """워크북을 한 번 열어 PIPELINE의 추출기를 실행하고 단계별 소요 시간을 반환한다."""
+    stages = []
+
+    started = time.perf_counter()
+    cache = BuildCache()
+    pending, keys = plan_jobs(cache, excel_file, jobs=PIPELINE, force=force)
+    stages.append(('변경 확인', time.perf_counter() - started))
+
+    if pending:
+        started = time.perf_counter()
+        wb = load_workbook(excel_file, streaming=True)
+        stages.append(('워크북 열기', time.perf_counter() - started))
+        try:
+            for idx in pending:
+                extractor, sheet_name, output_filename = PIPELINE[idx]
+                print(f"\n[{sheet_name}] 업데이트 중...")
+                started = time.perf_counter()
+                with METRICS.job(sheet_name, output_filename) as job:
+                    try:
+                        job['ok'] = bool(extractor(wb, sheet_name, output_filename))
+                    except Exception as e:
+                        print(f"[{sheet_name}] 오류: {e}")
+                ok = job['ok']
+                stages.append((f"{sheet_name} -> {output_filename}", time.perf_counter() - started))
+                if ok:
+                    cache.record(os.path.join(DATA_DIR, output_filename), keys[idx])
+        finally:
+            wb.close()
+
+    # 파생 출력 (유사 매장 이웃 테이블 등), 행 변경분 패치, 캐시/레지스트리 저장, 산출물 발행
+    started = time.perf_counter()
+    finalize(cache, force=force, publish=publish)
+    stages.append(('파생 출력/패치/발행', time.perf_counter() - started))
+    return stages
+
+
 if __name__ == '__main__':
     print("=" * 50)
     print("백데이터 엑셀 -> JSON 변환 시작")
     print("=" * 50)
 
-    for script, name in scripts:
-        try:
-            print(f"\n[{name}] 업데이트 중...")
-            result = subprocess.run(
-                ['python', script],
-                cwd=SCRIPT_DIR,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace'
-            )
-            if result.returncode == 0:
-                print(f"[{name}] 완료")
-                if result.stdout:
-                    print(result.stdout[:500])
-            else:
-                print(f"[{name}] 오류 (exit {result.returncode})")
-                if result.stderr:
-                    print(result.stderr[:500])
-        except Exception as e:
-            print(f"[{name}] 오류: {e}")
+    os.chdir(SCRIPT_DIR)
+    os.makedirs(DATA_DIR, exist_ok=True)
+    if '--columnar' in sys.argv:
+        update_data_unified.OUTPUT_FORMAT = 'columnar'
+    update_data_unified.PRECOMPRESS = '--precompress' in sys.argv
+    total_started = time.perf_counter()
+    stages = run_pipeline(EXCEL_FILE, force='--force' in sys.argv, publish='--no-publish' not in sys.argv)
+    total = time.perf_counter() - total_started
+
+    print("\n단계별 소요 시간:")
+    for name, elapsed in stages:
+        print(f"  {elapsed:8.2f}s  {name}")
+    print(f"  {total:8.2f}s  전체")
+    METRICS.print_report()
+    print(f"단계별 계측: {METRICS.write_run_file(mode='pipeline', format=update_data_unified.OUTPUT_FORMAT, excel_file=EXCEL_FILE)}")
 
     print("\n" + "=" * 50)
     print("모든 데이터 업데이트 완료!")
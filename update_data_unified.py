@@ -1,32 +1,401 @@
 # -*- coding: utf-8 -*-
 import openpyxl
+import cProfile
+import hashlib
+import pstats
 import json
 import os
-from datetime import datetime
+import shutil
+import time
+import tracemalloc
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime
+from functools import partial
+
+import aggregate
+import column_schema
+import competitor_rankings
+import delta_patches
+import inventory_store
+import item_season_analytics
+import json_stream
+import performance_cube
+import publish_artifacts
+import store_neighbors
+import store_registry
+import style_rankings
+import workbook_cache
+import xlsx_stream
+from aggregate import group_sum
+from build_cache import BuildCache, file_digest
+from column_schema import CATEGORY, DATE, DAY, NUMBER, STORE_NAME, TEXT, SheetSchema, converter
+from competitor_rankings import build_competitor_rankings
+from delta_patches import PATCH_DIR, ROW_KEYS, PatchWriter
+from inventory_store import INVENTORY_STORE_FILENAME, write_inventory_store
+from item_season_analytics import ANALYTICS_FILENAME, build_item_season_analytics
+from json_stream import ShardWriter, TableWriter, iter_table
+from performance_cube import CUBE_FILENAME, build_performance_cube
+from publish_artifacts import ASSET_DIR
+from run_metrics import METRICS, RUNS_DIR
+from store_neighbors import NEIGHBORS_FILENAME, build_store_neighbors
+from store_registry import REGISTRY, STORE_ID_KEY
+from style_rankings import RANKINGS_FILENAME, StyleRankingBuilder
 
 EXCEL_FILE = 'backdata.xlsx'
 DATA_DIR = 'public/data'
-if not os.path.exists(DATA_DIR):
-    os.makedirs(DATA_DIR)
-
-def format_date(value):
-    if isinstance(value, datetime):
-        return value.strftime('%Y-%m-%d')
-    return value
-
-def normalize_store_name(name):
-    if not name:
-        return name
-    name_str = str(name).strip()
-    
-    # Specific normalization for Ulsan stores
-    # '현대울산' is likely the main branch, '현대울산동구' is the Dong-gu branch
-    if name_str in ['현대울산(동)', '현대울산(동구)', '현대 울산 동구']:
-        return '현대울산동구'
-    if name_str == '현대울산':
-        return '현대울산'
-    
-    return name_str
+
+# 워크북 파싱 캐시(workbook_cache): 'auto' = 캐시가 있으면 사용, 'build' = 없으면 만들어서 사용, 'off' = 항상 xlsx를 파싱
+PARSE_CACHE = 'auto'
+
+# 스트리밍 모드 xlsx 리더: 'native' = xlsx_stream.open_workbook (시트 XML을 직접 스캔, 값은 openpyxl과 같다),
+# 'openpyxl' = openpyxl read-only 모드
+XLSX_READER = 'native'
+
+# 표 형식 출력 포맷: 'rows' (행마다 dict, 기존 형식) 또는 'columnar' (열 단위 + 사전 인코딩)
+OUTPUT_FORMAT = 'rows'
+
+# 내용 해시 산출물과 함께 gzip/brotli 변형도 미리 만들지 (data_server.py용, 정적 호스팅은 직접 압축한다)
+PRECOMPRESS = False
+
+# 전체 파일과 함께 매장별 샤드(public/data/shards/<dataset>/)도 쓰는 출력
+# 대시보드는 선택 매장과 비교 매장의 샤드만 받아간다 (dataService.getStoreShards)
+SHARDED_OUTPUTS = {'item_season_data.json', 'store_inventory_data.json', 'store_style_sales_data.json'}
+SHARD_DIR = 'shards'
+
+# 전체 파일과 함께 일자 기준 월별 파티션(public/data/partitions/<dataset>/<YYYY-MM>.json)도 쓰는 출력
+# 대시보드는 필요한 달의 파티션만 받아간다 (dataService.getDatePartitions)
+PARTITIONED_OUTPUTS = {'store_style_sales_data.json'}
+PARTITION_DIR = 'partitions'
+
+# 매장별스타일판매에서 내보낼 일자 범위 [시작, 끝)
+STYLE_SALES_DATE_RANGE = (date(2026, 1, 1), date(2027, 1, 1))
+
+# 추출 결과에 영향을 주는 소스 파일. 하나라도 바뀌면 빌드 캐시가 무효화된다
+EXTRACTOR_SOURCES = [__file__, store_registry.__file__, column_schema.__file__, performance_cube.__file__, aggregate.__file__,
+                     json_stream.__file__, style_rankings.__file__, competitor_rankings.__file__, xlsx_stream.__file__]
+
+def load_workbook(file_path, streaming=True):
+    """backdata.xlsx 로드. streaming=True면 read-only 모드로 열어 시트를 행 단위로 스트리밍한다.
+
+    read-only 모드는 셀 객체 그래프를 메모리에 만들지 않으므로 시트 크기와 무관하게
+    메모리 사용량이 일정하다. 대신 각 시트는 앞에서부터 한 번만 순회하는 것을 전제로 한다.
+    스트리밍 모드에서 같은 워크북의 파싱 캐시가 있으면(PARSE_CACHE) 캐시를 mmap해서 읽고,
+    없으면 XLSX_READER로 연다 (native: 칸 객체를 만들지 않는 xlsx_stream 리더).
+    """
+    if streaming and PARSE_CACHE != 'off':
+        if PARSE_CACHE == 'build':
+            return workbook_cache.load_workbook(file_path, data_only=True)
+        cached = workbook_cache.open_cached(file_path, data_only=True)
+        if cached is not None:
+            return cached
+    if streaming and XLSX_READER == 'native':
+        return xlsx_stream.open_workbook(file_path)
+    return openpyxl.load_workbook(file_path, read_only=streaming, data_only=True)
+
+def pad_row(row, width):
+    """read-only 모드에서는 뒤쪽 빈 셀이 잘린 짧은 행이 올 수 있으므로
+    None으로 채워 전체 로드 모드와 같은 길이로 맞춘다."""
+    if len(row) < width:
+        return tuple(row) + (None,) * (width - len(row))
+    return row
+
+def to_columnar(headers, data):
+    """행(dict) 목록을 열 단위 포맷으로 변환한다.
+
+    헤더는 한 번만 쓰고 열마다 값 배열 하나를 둔다. 반복이 많은 문자열 열
+    (시즌, 매장코드, 매장명 등)은 {'dict': 고유값 목록, 'codes': 인덱스 배열}로 사전 인코딩한다.
+    dataService.ts의 decodeColumnar와 짝을 이룬다.
+    """
+    columns = []
+    for header in headers:
+        values = [row.get(header) for row in data]
+        non_null = [v for v in values if v is not None]
+        if non_null and all(isinstance(v, str) for v in non_null):
+            dictionary = list(dict.fromkeys(non_null))
+            if len(dictionary) <= len(non_null) // 2:
+                index = {v: i for i, v in enumerate(dictionary)}
+                columns.append({
+                    'dict': dictionary,
+                    'codes': [index[v] if v is not None else None for v in values]
+                })
+                continue
+        columns.append(values)
+    return {
+        'format': 'columnar',
+        'headers': headers,
+        'columns': columns,
+        'total_rows': len(data)
+    }
+
+def read_table(output_filename, data_dir=None):
+    """DATA_DIR(또는 data_dir)에 저장한 표를 (headers, 행 dict 목록)으로 읽는다. columnar 포맷이면 풀어서 돌려준다.
+    파일이 없으면 ([], [])."""
+    path = os.path.join(data_dir or DATA_DIR, output_filename)
+    if not os.path.exists(path):
+        return [], []
+    with open(path, 'r', encoding='utf-8') as f:
+        table = json.load(f)
+    if table.get('format') != 'columnar':
+        return table.get('headers', []), table.get('data', [])
+    headers = table['headers']
+    columns = [column if isinstance(column, list)
+               else [column['dict'][code] if code is not None else None for code in column['codes']]
+               for column in table['columns']]
+    return headers, [dict(zip(headers, values)) for values in zip(*columns)]
+
+def read_table_rows(output_filename):
+    """read_table과 같지만 행을 iterator로 돌려준다. 행 형식 표는 한 행씩 읽고 (json_stream.iter_table),
+    columnar 표는 풀어서 돌려준다."""
+    try:
+        return iter_table(os.path.join(DATA_DIR, output_filename))
+    except ValueError:
+        headers, rows = read_table(output_filename)
+        return headers, iter(rows)
+
+def write_json(output_filename, obj, compact=False):
+    """obj를 DATA_DIR/output_filename에 JSON으로 저장하고 경로를 반환한다 (쓴 바이트 수는 계측에 기록)."""
+    output_path = os.path.join(DATA_DIR, output_filename)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with METRICS.stage('serialize'):
+        with open(output_path, 'w', encoding='utf-8') as f:
+            if compact:
+                json.dump(obj, f, ensure_ascii=False, separators=(',', ':'))
+            else:
+                json.dump(obj, f, ensure_ascii=False, indent=2)
+    METRICS.count(bytes_written=os.path.getsize(output_path))
+    return output_path
+
+def write_table(output_filename, headers, data, count_rows=True):
+    """headers/data/total_rows 표를 OUTPUT_FORMAT에 맞춰 DATA_DIR에 저장하고 경로를 반환한다."""
+    if count_rows:
+        METRICS.count(rows=len(data))
+    if OUTPUT_FORMAT == 'columnar':
+        with METRICS.stage('serialize'):
+            return write_json(output_filename, to_columnar(headers, data), compact=True)
+    return write_json(output_filename, {
+        'headers': headers,
+        'data': data,
+        'total_rows': len(data)
+    })
+
+class TableOutput:
+    """추출기가 행을 하나씩 넘기는 표 출력. close()에서 저장한 행 수를 반환한다.
+
+    rows 포맷은 전체 파일과 (SHARDED_OUTPUTS면) 매장별 샤드, (PARTITIONED_OUTPUTS면) 월별 파티션을
+    json_stream으로 바로 써서 시트 크기와 무관하게 메모리 사용량이 일정하다. columnar 포맷은 사전 인코딩에
+    열 전체가 필요하므로 행을 모았다가 write_table / write_store_shards / write_date_partitions로 쓴다.
+    partition_info는 파티션 manifest.json에 함께 기록할 값 (파티션 기준 열, 일자 범위 등)이다.
+    """
+
+    def __init__(self, output_filename, headers, name_key='매장명', partition_info=None):
+        self.output_filename = output_filename
+        self.headers = headers
+        self.name_key = name_key
+        self.dataset = os.path.splitext(output_filename)[0]
+        self.sharded = output_filename in SHARDED_OUTPUTS
+        self.partitioned = output_filename in PARTITIONED_OUTPUTS
+        self.partition_info = partition_info or {}
+        self.rows = self.partition_rows = None
+        self.writer = self.shards = self.partitions = None
+        self._serialize = METRICS.row_stage('serialize')
+        self._shard_stage = METRICS.row_stage('shards')
+        self._partition_stage = METRICS.row_stage('partitions')
+        if OUTPUT_FORMAT == 'columnar':
+            self.rows = []
+            if self.partitioned:
+                self.partition_rows = {}
+            return
+        self.writer = TableWriter(os.path.join(DATA_DIR, output_filename), headers)
+        if self.sharded:
+            self.shards = ShardWriter(os.path.join(DATA_DIR, SHARD_DIR, self.dataset), headers, shard_filename)
+        if self.partitioned:
+            self.partitions = ShardWriter(partition_staging_dir(self.dataset), headers, partition_filename)
+
+    def append(self, row, partition=None):
+        """partition: 이 행이 들어갈 월 파티션 키 ('YYYY-MM'). None이면 전체 파일에만 쓴다."""
+        if self.rows is not None:
+            self.rows.append(row)
+            if partition and self.partition_rows is not None:
+                self.partition_rows.setdefault(partition, []).append(row)
+            return
+        with self._serialize:
+            self.writer.write(row)
+        if self.shards is not None:
+            with self._shard_stage:
+                key = store_shard_key(row, self.name_key)
+                if key:
+                    self.shards.write(key, row)
+        if partition and self.partitions is not None:
+            with self._partition_stage:
+                self.partitions.write(partition, row)
+
+    def close(self):
+        if self.rows is not None:
+            write_table(self.output_filename, self.headers, self.rows)
+            if self.sharded:
+                write_store_shards(self.output_filename, self.headers, self.rows, self.name_key)
+            if self.partitioned:
+                write_date_partitions(self.dataset, self.headers, self.partition_rows, self.partition_info)
+            return len(self.rows)
+        with METRICS.stage('serialize'):
+            self.writer.close()
+        total_rows = self.writer.total_rows
+        METRICS.count(rows=total_rows, bytes_written=os.path.getsize(self.writer.path))
+        if self.shards is not None:
+            with METRICS.stage('shards'):
+                stores = self.shards.close()
+                METRICS.count(bytes_written=sum(entry['bytes'] for entry in stores.values()))
+                finish_store_shards(self.dataset, self.headers, stores)
+        if self.partitions is not None:
+            with METRICS.stage('partitions'):
+                partitions = self.partitions.close()
+                rewritten = finish_date_partitions(self.dataset, self.headers, partitions, self.partition_info)
+                METRICS.count(bytes_written=sum(partitions[key]['bytes'] for key in rewritten))
+        return total_rows
+
+def store_shard_key(row, name_key='매장명'):
+    """샤드 키 = 매장ID (store_registry). 행에 매장ID 열이 없으면 매장명을 레지스트리로 풀어 쓴다.
+    같은 매장의 표기 변형('29CM(롯데본점)', '...close')은 한 샤드로 모인다."""
+    return row.get(STORE_ID_KEY) or REGISTRY.resolve(row.get(name_key))
+
+def write_store_shards(output_filename, headers, data, name_key='매장명'):
+    """표를 매장별 샤드 파일로 나눠 쓰고 크기/해시가 담긴 manifest.json을 만든다.
+
+    shards/<dataset>/manifest.json:
+      {'dataset', 'headers', 'total_rows', 'stores': {매장ID: {'name', 'file', 'rows', 'bytes', 'sha256'}}}
+    """
+    with METRICS.stage('shards'):
+        _write_store_shards(output_filename, headers, data, name_key)
+
+def shard_filename(store_id):
+    return store_id + '.json'
+
+def _write_store_shards(output_filename, headers, data, name_key):
+    dataset = os.path.splitext(output_filename)[0]
+
+    groups = {}
+    for row in data:
+        key = store_shard_key(row, name_key)
+        if key:
+            groups.setdefault(key, []).append(row)
+
+    stores = {}
+    for key, rows in sorted(groups.items()):
+        filename = shard_filename(key)
+        path = write_table(os.path.join(SHARD_DIR, dataset, filename), headers, rows, count_rows=False)
+        with open(path, 'rb') as f:
+            content = f.read()
+        stores[key] = {
+            'file': filename,
+            'rows': len(rows),
+            'bytes': len(content),
+            'sha256': hashlib.sha256(content).hexdigest()
+        }
+    finish_store_shards(dataset, headers, stores)
+
+def finish_store_shards(dataset, headers, stores):
+    """샤드 manifest.json을 쓰고 이번 실행에서 만들지 않은 샤드 파일을 지운다."""
+    for store_id, entry in stores.items():
+        entry['name'] = REGISTRY.stores.get(store_id, {}).get('name')
+    shard_dir = os.path.join(DATA_DIR, SHARD_DIR, dataset)
+    # 이번 실행에서 만들지 않은 (사라진 매장의) 샤드 정리
+    current = {entry['file'] for entry in stores.values()}
+    for filename in os.listdir(shard_dir) if os.path.isdir(shard_dir) else []:
+        if filename.endswith('.json') and filename != 'manifest.json' and filename not in current:
+            os.remove(os.path.join(shard_dir, filename))
+
+    write_json(os.path.join(SHARD_DIR, dataset, 'manifest.json'), {
+        'dataset': dataset,
+        'headers': headers,
+        'total_rows': sum(entry['rows'] for entry in stores.values()),
+        'stores': stores
+    })
+    print(f"Saved {len(stores)} store shards to {SHARD_DIR}/{dataset}/")
+
+def month_partition_key(day):
+    """date -> 월 파티션 키 'YYYY-MM'"""
+    return f'{day.year:04d}-{day.month:02d}'
+
+def partition_filename(key):
+    return key + '.json'
+
+def partition_staging_dir(dataset):
+    """파티션을 먼저 쓰는 임시 디렉터리. 바뀐 파티션만 finish_date_partitions에서 제자리로 옮긴다."""
+    return os.path.join(DATA_DIR, PARTITION_DIR, dataset, '.staging')
+
+def write_date_partitions(dataset, headers, groups, info=None):
+    """columnar 포맷용: 월 파티션 키별로 모은 행을 스테이징 디렉터리에 쓰고 finish_date_partitions로 넘긴다."""
+    with METRICS.stage('partitions'):
+        staging_dir = partition_staging_dir(dataset)
+        partitions = {}
+        for key, rows in sorted(groups.items()):
+            filename = partition_filename(key)
+            path = write_table(os.path.relpath(os.path.join(staging_dir, filename), DATA_DIR),
+                               headers, rows, count_rows=False)
+            partitions[key] = {
+                'file': filename,
+                'rows': len(rows),
+                'bytes': os.path.getsize(path),
+                'sha256': file_digest(path)
+            }
+        finish_date_partitions(dataset, headers, partitions, info)
+
+def finish_date_partitions(dataset, headers, partitions, info=None):
+    """스테이징에 쓴 월별 파티션 중 내용이 바뀐 것만 제자리로 옮기고 manifest.json을 쓴다.
+
+    partitions/<dataset>/manifest.json:
+      {'dataset', 'headers', **info, 'total_rows', 'partitions': {'YYYY-MM': {'file', 'rows', 'bytes', 'sha256'}}}
+
+    내용(sha256)이 이전 파일과 같은 파티션은 기존 파일을 그대로 두므로 수정 시각도 유지된다
+    (지난달 파티션은 재추출해도 다시 쓰지 않는다). Returns: 다시 쓴 파티션 키 목록
+    """
+    partition_dir = os.path.join(DATA_DIR, PARTITION_DIR, dataset)
+    staging_dir = partition_staging_dir(dataset)
+    os.makedirs(partition_dir, exist_ok=True)
+    rewritten = []
+    for key, entry in sorted(partitions.items()):
+        staged = os.path.join(staging_dir, entry['file'])
+        target = os.path.join(partition_dir, entry['file'])
+        if os.path.exists(target) and file_digest(target) == entry['sha256']:
+            os.remove(staged)
+        else:
+            os.replace(staged, target)
+            rewritten.append(key)
+    if os.path.isdir(staging_dir):
+        shutil.rmtree(staging_dir)
+
+    # 이번 실행에 없는 (범위를 벗어난) 달의 파티션 정리
+    current = {entry['file'] for entry in partitions.values()}
+    for filename in os.listdir(partition_dir):
+        if filename.endswith('.json') and filename != 'manifest.json' and filename not in current:
+            os.remove(os.path.join(partition_dir, filename))
+
+    write_json(os.path.join(PARTITION_DIR, dataset, 'manifest.json'), {
+        'dataset': dataset,
+        'headers': headers,
+        **(info or {}),
+        'total_rows': sum(entry['rows'] for entry in partitions.values()),
+        'partitions': dict(sorted(partitions.items()))
+    })
+    print(f"Saved {len(partitions)} monthly partitions to {PARTITION_DIR}/{dataset}/ ({len(rewritten)} rewritten)")
+    return rewritten
+
+# 시트별 열 변환 스키마 (column_schema.py). 여기 없는 시트는 GENERIC_SCHEMA (모든 열 DATE)
+GENERIC_SCHEMA = SheetSchema(default=DATE)
+SHEET_SCHEMAS = {
+    '매장': SheetSchema({'매장명': CATEGORY, '형태': CATEGORY, '등급': CATEGORY}, default=DATE),
+    '아이템시즌별판매': SheetSchema({'매장코드': CATEGORY, '매장명': CATEGORY, 'ITEM': CATEGORY, '시즌': CATEGORY},
+                             default=DATE),
+    '매장별재고': SheetSchema({'시즌': CATEGORY, '매장코드': CATEGORY, '매장명': CATEGORY}, default=DATE),
+    '매장별스타일판매': SheetSchema({'매장명': STORE_NAME, '품번': CATEGORY, '제품명': CATEGORY, '시즌': CATEGORY,
+                              '일자': DATE}, default=DATE),
+    '실적': SheetSchema({'판매시점': TEXT, '매장명': STORE_NAME}),
+    # 단체: 열 위치 기준 (B열 매장명, C열 'YYYYMM')
+    '단체': SheetSchema({1: TEXT, 2: lambda value: str(value) if value else ''}),
+    # 경쟁사: A열 백화점, 나머지는 브랜드별 월평균 금액
+    '경쟁사': SheetSchema({0: TEXT}, default=NUMBER),
+}
 
 def process_performance_sheet(workbook, sheet_name, output_filename):
     if sheet_name not in workbook.sheetnames:
@@ -35,9 +404,10 @@ def process_performance_sheet(workbook, sheet_name, output_filename):
     
     print(f"Processing performance sheet (with aggregation): {sheet_name}...")
     sheet = workbook[sheet_name]
+    rows = sheet.iter_rows(values_only=True)
     
     # Read headers
-    headers = [str(cell.value).strip() if cell.value else '' for cell in sheet[1]]
+    headers = [str(value).strip() if value else '' for value in next(rows, ())]
     
     # Index of key columns
     try:
@@ -48,48 +418,48 @@ def process_performance_sheet(workbook, sheet_name, output_filename):
         print(f"Error: Missing required header in {sheet_name}: {e}")
         return False
 
-    # Aggregate data by (period, normalized_name)
-    aggregated_data = {}
+    # 필요한 열만 모은 뒤 (period, normalized_name)으로 한 번에 집계 (aggregate.group_sum)
+    periods, names, sales_values = [], [], []
+    width = max(period_idx, name_idx, sales_idx) + 1
+    schema = SHEET_SCHEMAS[sheet_name]
+    period_of, name_of = schema.column('판매시점'), schema.column('매장명')
+    convert = METRICS.row_stage('convert')
     
-    for row in sheet.iter_rows(min_row=2, values_only=True):
-        if row[period_idx] is None:
-            continue
-            
-        period = str(row[period_idx]).strip()
-        raw_name = row[name_idx]
-        normalized_name = normalize_store_name(raw_name)
-        
-        try:
-            sales = float(row[sales_idx]) if row[sales_idx] is not None else 0
-        except:
-            sales = 0
-            
-        key = (period, normalized_name)
-        if key not in aggregated_data:
-            aggregated_data[key] = 0
-        aggregated_data[key] += sales
+    with METRICS.stage('iterate'):
+        for row in rows:
+            row = pad_row(row, width)
+            if row[period_idx] is None:
+                continue
+            with convert:
+                periods.append(period_of(row[period_idx]))
+                names.append(name_of(row[name_idx]))
+                sales_values.append(row[sales_idx])
         
     # Convert back to list format for JSON
     data_list = []
-    for (period, name), sales in aggregated_data.items():
-        data_list.append({
-            '판매시점': period,
-            '매장명': name,
-            '판매액': sales
-        })
+    with METRICS.stage('aggregate'):
+        for (period, name), sales in group_sum([periods, names], sales_values):
+            data_list.append({
+                '판매시점': period,
+                '매장명': name,
+                '판매액': sales,
+                STORE_ID_KEY: REGISTRY.resolve(name)
+            })
     
     # Sort for predictability
-    data_list.sort(key=lambda x: (x['판매시점'], x['매장명']))
+    with METRICS.stage('sort'):
+        data_list.sort(key=lambda x: (x['판매시점'], x['매장명']))
     
-    output_path = os.path.join(DATA_DIR, output_filename)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump({
-            'headers': ['판매시점', '매장명', '판매액'],
-            'data': data_list,
-            'total_rows': len(data_list)
-        }, f, ensure_ascii=False, indent=2)
+    write_table(output_filename, ['판매시점', '매장명', '판매액', STORE_ID_KEY], data_list)
     
     print(f"Saved {len(data_list)} aggregated rows to {output_filename}")
+
+    # 매장 × 월 실적 큐브 (연누계/전년 동기/신장률 포함, dataService.getPerformanceCube)
+    with METRICS.stage('aggregate'):
+        cube = build_performance_cube(data_list, REGISTRY.stores)
+    if cube:
+        write_json(CUBE_FILENAME, cube, compact=True)
+        print(f"Saved {len(cube['store_ids'])} stores x {len(cube['periods'])} months to {CUBE_FILENAME}")
     return True
 
 def process_generic_sheet(workbook, sheet_name, output_filename):
@@ -99,33 +469,37 @@ def process_generic_sheet(workbook, sheet_name, output_filename):
     
     print(f"Processing generic sheet: {sheet_name}...")
     sheet = workbook[sheet_name]
+    rows = sheet.iter_rows(values_only=True)
     
     # Read headers
-    headers = [cell.value for cell in sheet[1]]
-    data = []
+    headers = list(next(rows, ()))
+    width = len(headers)
+    # 매장명 열이 있는 시트는 표준 매장ID 열을 덧붙인다 (store_registry.py)
+    has_store = '매장명' in headers and STORE_ID_KEY not in headers
+    table = TableOutput(output_filename, headers + [STORE_ID_KEY] if has_store else headers)
+    converters = SHEET_SCHEMAS.get(sheet_name, GENERIC_SCHEMA).compile(headers)
+    convert = METRICS.row_stage('convert')
     
     # Read data starting from row 2
-    for row in sheet.iter_rows(min_row=2, values_only=True):
-        row_data = {}
-        has_data = False
-        for header, value in zip(headers, row):
-            val = format_date(value)
-            row_data[header] = val
-            if val is not None and val != '':
-                has_data = True
-        
-        if has_data:
-            data.append(row_data)
-    
-    output_path = os.path.join(DATA_DIR, output_filename)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump({
-            'headers': headers,
-            'data': data,
-            'total_rows': len(data)
-        }, f, ensure_ascii=False, indent=2)
+    with METRICS.stage('iterate'):
+        for row in rows:
+            with convert:
+                row = pad_row(row, width)
+                row_data = {}
+                has_data = False
+                for header, convert_value, value in zip(headers, converters, row):
+                    val = convert_value(value) if convert_value else value
+                    row_data[header] = val
+                    if val is not None and val != '':
+                        has_data = True
+                
+                if has_data:
+                    if has_store:
+                        row_data[STORE_ID_KEY] = REGISTRY.resolve(row_data['매장명'])
+                    table.append(row_data)
     
-    print(f"Saved {len(data)} rows to {output_filename}")
+    total_rows = table.close()
+    print(f"Saved {total_rows} rows to {output_filename}")
     return True
 
 def process_group_sales(workbook, sheet_name, output_filename):
@@ -135,42 +509,46 @@ def process_group_sales(workbook, sheet_name, output_filename):
     
     print(f"Processing group sales (special): {sheet_name}...")
     sheet = workbook[sheet_name]
-    store_map = {}
-    months_2025 = [f'2025{str(m).zfill(2)}' for m in range(1, 12)]
+    rows = sheet.iter_rows(min_row=2, values_only=True)
+    store_names, sales_values = [], []
+    months_2025 = {f'2025{str(m).zfill(2)}' for m in range(1, 12)}
+    schema = SHEET_SCHEMAS[sheet_name]
+    name_of, month_of = schema.column(1), schema.column(2)
+    convert = METRICS.row_stage('convert')
     
-    for row in sheet.iter_rows(min_row=2, values_only=True):
-        # Column 2: Store Name, Column 3: Date, Column 20: Sales (T column)
-        store_name = row[1]
-        date_val = row[2]
-        sales_val = row[19] # 0-indexed, so T is 19
-        
-        if not store_name:
-            continue
-            
-        store_name = str(store_name).strip()
-        date_str = str(date_val) if date_val else ''
-        
-        if date_str not in months_2025:
-            continue
-            
-        try:
-            sales = float(sales_val) if sales_val is not None else 0
-        except:
-            sales = 0
-            
-        if store_name not in store_map:
-            store_map[store_name] = {'매장명': store_name, '소량단체판매액': 0}
+    with METRICS.stage('iterate'):
+        for row in rows:
+            with convert:
+                row = pad_row(row, 20)
+                # Column 2: Store Name, Column 3: Date, Column 20: Sales (T column)
+                store_name = row[1]
+                date_val = row[2]
+                sales_val = row[19] # 0-indexed, so T is 19
+                
+                if not store_name:
+                    continue
+                    
+                store_name = name_of(store_name)
+                date_str = month_of(date_val)
+                
+                if date_str not in months_2025:
+                    continue
+                store_names.append(store_name)
+                sales_values.append(sales_val)
         
-        store_map[store_name]['소량단체판매액'] += sales
+    # 매장이 처음 나온 순서대로 합계 (aggregate.group_sum)
+    store_map = {}
+    with METRICS.stage('aggregate'):
+        for (store_name,), sales in group_sum([store_names], sales_values, first_seen=True):
+            store_map[store_name] = {'매장명': store_name, '소량단체판매액': sales, STORE_ID_KEY: REGISTRY.resolve(store_name)}
         
     result = {
         'stores': list(store_map.values()),
         'total_stores': len(store_map)
     }
     
-    output_path = os.path.join(DATA_DIR, output_filename)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+    METRICS.count(rows=len(store_map))
+    write_json(output_filename, result)
     
     print(f"Saved {len(store_map)} stores to {output_filename}")
     return True
@@ -182,9 +560,13 @@ def process_competitor(workbook, sheet_name, output_filename):
         
     print(f"Processing competitor (special): {sheet_name}...")
     sheet = workbook[sheet_name]
+    rows = sheet.iter_rows(values_only=True)
     # Row 1 and 2 are headers
-    row1 = [cell.value for cell in sheet[1]]
-    row2 = [cell.value for cell in sheet[2]]
+    row1 = list(next(rows, ()))
+    row2 = list(next(rows, ()))
+    width = max(len(row1), len(row2))
+    row1 += [None] * (width - len(row1))
+    row2 += [None] * (width - len(row2))
     
     # Identifiy品牌的范围
     avg_col_indices = []
@@ -207,7 +589,7 @@ def process_competitor(workbook, sheet_name, output_filename):
     # Let's hardcode the range if necessary, or detect it:
     start_col = avg_col_indices[0]
     # Find brands in row 2 for these columns
-    for col_idx in range(start_col, start_col + 15): # Assume max 15 brands in first avg section
+    for col_idx in range(start_col, min(start_col + 15, width)): # Assume max 15 brands in first avg section
         brand_name = str(row2[col_idx]).strip() if row2[col_idx] else None
         if brand_name and brand_name != 'None' and brand_name != 'MLB' and col_idx not in [b['col_idx'] for b in brands]:
              # If MLB was already added or not
@@ -246,32 +628,35 @@ def process_competitor(workbook, sheet_name, output_filename):
     stores_data = []
     # [간소화된 시트] A열(백화점), B~=월평균 브랜드 데이터. Row 3부터 데이터
     STORE_COL_IDX = 0  # A열 = 백화점
-    for row in sheet.iter_rows(min_row=3, values_only=True):
-        store_name = row[STORE_COL_IDX] if len(row) > STORE_COL_IDX else None
-        
-        # Skip empty rows or rows that are just headers
-        if not store_name or str(store_name).strip() == '' or str(store_name).strip() == '백화점':
-            continue
-        store_name = str(store_name).strip()
-        if store_name.isdigit():  # 숫자만 있는 행(인덱스 등) 제외
-            continue
-            
-        brand_data = {}
-        total_brand_sales = 0
-        for brand in brands:
-            val = row[brand['col_idx']]
-            try:
-                val_float = float(val) if val is not None else 0
-                brand_data[brand['name']] = val_float
-                total_brand_sales += val_float
-            except:
-                brand_data[brand['name']] = 0
+    converters = SHEET_SCHEMAS[sheet_name].compile(row2)
+    convert = METRICS.row_stage('convert')
+    with METRICS.stage('iterate'):
+        for row in rows:
+            with convert:
+                row = pad_row(row, width)
+                store_name = row[STORE_COL_IDX] if len(row) > STORE_COL_IDX else None
                 
-        stores_data.append({
-            '백화점': store_name,
-            '브랜드별_월평균': brand_data,
-            '총매출': total_brand_sales # Use the sum of brands as the store total
-        })
+                # Skip empty rows or rows that are just headers
+                if not store_name:
+                    continue
+                store_name = converters[STORE_COL_IDX](store_name)
+                if store_name in ('', '백화점') or store_name.isdigit():  # 숫자만 있는 행(인덱스 등) 제외
+                    continue
+                    
+                brand_data = {}
+                total_brand_sales = 0
+                for brand in brands:
+                    col_idx = brand['col_idx']
+                    val = converters[col_idx](row[col_idx])  # 숫자가 아니면 0
+                    brand_data[brand['name']] = val
+                    total_brand_sales += val
+                        
+                stores_data.append({
+                    '백화점': store_name,
+                    '브랜드별_월평균': brand_data,
+                    '총매출': total_brand_sales, # Use the sum of brands as the store total
+                    STORE_ID_KEY: REGISTRY.resolve(store_name, source='competitor')
+                })
         
     result = {
         'brands': [b['name'] for b in brands],
@@ -280,96 +665,416 @@ def process_competitor(workbook, sheet_name, output_filename):
         'has_total_sales': total_sales_col >= 0
     }
     
-    output_path = os.path.join(DATA_DIR, output_filename)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+    METRICS.count(rows=len(stores_data))
+    write_json(output_filename, result)
         
     print(f"Saved {len(stores_data)} stores to {output_filename}")
+
+    # 점포별/브랜드별 순위, MLB 점유율, 이전 내보내기 대비 순위 변동 (dataService.getCompetitorData가 합쳐 준다)
+    with METRICS.stage('aggregate'):
+        rankings = build_competitor_rankings(stores_data, result['brands'],
+                                             competitor_rankings.load_previous(DATA_DIR))
+    if rankings:
+        write_json(competitor_rankings.RANKINGS_FILENAME, rankings, compact=True)
+        print(f"Saved brand rankings for {len(rankings['store_rankings'])} stores to "
+              f"{competitor_rankings.RANKINGS_FILENAME}")
+    return True
+
+def process_style_sales(workbook, sheet_name, output_filename):
+    if sheet_name not in workbook.sheetnames:
+        print(f"Skipping: '{sheet_name}' sheet not found.")
+        return False
+
+    # Optimize '매장별스타일판매' to reduce file size (it was 180MB+)
+    print(f"Processing optimized sheet: {sheet_name}...")
+    style_sheet = workbook[sheet_name]
+    rows = style_sheet.iter_rows(values_only=True)
+    style_headers = list(next(rows, ()))
+    
+    # Define mapping from possible Excel headers to JSON keys
+    header_mapping = {
+        '매장명': '매장명',
+        '품번': '품번',
+        '제품명': '제품명',
+        '판매액': '판매액합계',
+        '판매액합계': '판매액합계',
+        '판매수량': '판매수량합계',
+        '판매수량합계': '판매수량합계',
+        '일자': '일자',
+        '시즌': '시즌'
+    }
+    
+    # Build col_indices based on available headers
+    col_indices = {}
+    for excel_h, json_h in header_mapping.items():
+        if excel_h in style_headers:
+            col_indices[json_h] = style_headers.index(excel_h)
+    
+    date_idx = style_headers.index('일자') if '일자' in style_headers else -1
+    print(f"DEBUG: col_indices={col_indices}, date_idx={date_idx}")
+    date_from, date_to = STYLE_SALES_DATE_RANGE
+    
+    output_headers = list(col_indices.keys())
+    if '매장명' in col_indices:
+        output_headers.append(STORE_ID_KEY)
+    # '일자'가 있으면 월별 파티션도 쓴다 (없으면 전체 파일만)
+    partition_info = {'partition_key': '일자', 'date_from': date_from.isoformat(), 'date_to': date_to.isoformat()}
+    table = TableOutput(output_filename, output_headers, partition_info=partition_info if date_idx >= 0 else None)
+    # 매장 × 기간별 베스트 스타일 순위 (StoreBestItems, dataService.getStyleRankings)
+    rankings = StyleRankingBuilder()
+    converters = SHEET_SCHEMAS[sheet_name].compile(style_headers)
+    columns = [(json_h, idx, converters[idx]) for json_h, idx in col_indices.items()]
+    day_of = converter(DAY)
+    convert = METRICS.row_stage('convert')
+    aggregate_stage = METRICS.row_stage('aggregate')
+    with METRICS.stage('iterate'):
+        for row in rows:
+            with convert:
+                row = pad_row(row, len(style_headers))
+                # If '일자' exists, keep rows within STYLE_SALES_DATE_RANGE. Otherwise include all (per user request)
+                partition = None
+                if date_idx >= 0:
+                    day = day_of(row[date_idx])
+                    if day is None or not date_from <= day < date_to:
+                        continue
+                    partition = month_partition_key(day)
+                    
+                row_data = {}
+                for json_h, idx, convert_value in columns:
+                    row_data[json_h] = convert_value(row[idx])
+                if '매장명' in col_indices:
+                    row_data[STORE_ID_KEY] = REGISTRY.resolve(row_data['매장명'])
+                    with aggregate_stage:
+                        rankings.add(row_data[STORE_ID_KEY], partition, row_data)
+                table.append(row_data, partition)
+        
+    total_rows = table.close()
+    print(f"Saved {total_rows} optimized rows to {output_filename}")
+
+    with METRICS.stage('sort'):
+        ranking = rankings.build(REGISTRY.stores)
+    if ranking:
+        write_json(RANKINGS_FILENAME, ranking, compact=True)
+        print(f"Saved top-{ranking['top_n']} style rankings for {len(ranking['stores'])} stores to {RANKINGS_FILENAME}")
+    return True
+
+# 시트별 추출 작업 목록: (추출 함수, 시트명, 출력 파일명)
+# 시트 간 의존성이 없으므로 순차 실행과 병렬 실행 모두 이 목록을 그대로 사용한다.
+SHEET_JOBS = [
+    (process_generic_sheet, '매장', 'store_data.json'),
+    (process_generic_sheet, '아이템시즌별판매', 'item_season_data.json'),
+    (process_style_sales, '매장별스타일판매', 'store_style_sales_data.json'),
+    (process_generic_sheet, '매장별재고', 'store_inventory_data.json'),
+    (process_performance_sheet, '실적', 'performance_data.json'),
+    # (process_generic_sheet, '주간회의', 'weekly_meeting_data.json'), # Removed as it's missing in current file
+    # Specialized sheets
+    (process_group_sales, '단체', 'group_sales_data.json'),
+    (process_competitor, '경쟁사', 'competitor_data_v2.json'),
+]
+
+def build_neighbor_table(output_filename):
+    """매장/실적 큐브/아이템시즌/재고 출력으로 유사 매장 이웃 테이블을 만든다 (store_neighbors.py)."""
+    print("Building similar-store neighbor table...")
+    _, store_rows = read_table('store_data.json')
+    cube_path = os.path.join(DATA_DIR, CUBE_FILENAME)
+    if not store_rows or not os.path.exists(cube_path):
+        print(f"Skipping: store_data.json / {CUBE_FILENAME} not found.")
+        return False
+    with open(cube_path, 'r', encoding='utf-8') as f:
+        cube = json.load(f)
+    item_headers, item_rows = read_table('item_season_data.json')
+    _, inventory_rows = read_table('store_inventory_data.json')
+    METRICS.count(rows=len(item_rows) + len(inventory_rows))
+
+    with METRICS.stage('aggregate'):
+        table = build_store_neighbors(store_rows, cube, item_rows, item_headers, inventory_rows)
+    if not table:
+        return False
+    write_json(output_filename, table, compact=True)
+    print(f"Saved neighbors for {len(table['stores'])} stores to {output_filename}")
+    return True
+
+def build_inventory_store(output_filename):
+    """매장별재고 출력을 매장코드 순 고정폭 바이너리로도 쓴다 (inventory_store.py)."""
+    _, inventory_rows = read_table('store_inventory_data.json')
+    if not inventory_rows:
+        print("Skipping: store_inventory_data.json not found.")
+        return False
+    METRICS.count(rows=len(inventory_rows))
+    output_path = os.path.join(DATA_DIR, output_filename)
+    with METRICS.stage('serialize'):
+        try:
+            rows, codes = write_inventory_store(output_path, inventory_rows)
+        except ValueError as e:
+            print(f"Warning: could not write {output_filename}: {e}")
+            return False
+    METRICS.count(bytes_written=os.path.getsize(output_path))
+    print(f"Saved {rows} inventory rows for {codes} store codes to {output_filename}")
+    return True
+
+def build_item_season_bundle(output_filename):
+    """아이템시즌별판매 출력으로 매장별 시즌/ITEM/반품/월별 분석 번들을 만든다 (item_season_analytics.py)."""
+    _, item_rows = read_table('item_season_data.json')
+    if not item_rows:
+        print("Skipping: item_season_data.json not found.")
+        return False
+    METRICS.count(rows=len(item_rows))
+    with METRICS.stage('aggregate'):
+        bundle = build_item_season_analytics(item_rows, STORE_ID_KEY)
+    if not bundle:
+        print(f"Skipping: item_season_data.json has no {STORE_ID_KEY} column.")
+        return False
+    write_json(output_filename, bundle, compact=True)
+    print(f"Saved item/season analytics for {len(bundle['stores'])} stores to {output_filename}")
     return True
 
+# 시트 추출이 끝난 뒤 내보낸 파일들로 만드는 파생 출력: (생성 함수, 출력 파일명, 입력 파일명 목록)
+# 입력 파일 내용과 생성 코드가 그대로면 빌드 캐시로 건너뛴다
+DERIVED_JOBS = [
+    (build_neighbor_table, NEIGHBORS_FILENAME,
+     ['store_data.json', CUBE_FILENAME, 'item_season_data.json', 'store_inventory_data.json']),
+    (build_inventory_store, INVENTORY_STORE_FILENAME, ['store_inventory_data.json']),
+    (build_item_season_bundle, ANALYTICS_FILENAME, ['item_season_data.json']),
+]
+DERIVED_SOURCES = [__file__, store_neighbors.__file__, inventory_store.__file__, item_season_analytics.__file__]
+
+def run_derived_jobs(cache, force=False):
+    """DERIVED_JOBS 중 입력이 바뀐 것만 다시 만든다. 성공한 출력 파일명 목록을 반환한다."""
+    version = [file_digest(os.path.abspath(path)) for path in DERIVED_SOURCES]
+    done = []
+    for builder, output_filename, inputs in DERIVED_JOBS:
+        output_path = os.path.join(DATA_DIR, output_filename)
+        with METRICS.stage('plan'):
+            digests = [file_digest(path) if os.path.exists(path) else None
+                       for path in (os.path.join(DATA_DIR, name) for name in inputs)]
+            key = cache.make_key(digests, version, builder.__name__)
+        if not force and cache.is_fresh(output_path, key):
+            print(f"Unchanged: inputs of {output_filename} -> keeping it")
+            continue
+        with METRICS.job(os.path.splitext(output_filename)[0], output_filename) as job:
+            job['ok'] = bool(builder(output_filename))
+        if job['ok']:
+            cache.record(output_path, key)
+            done.append(output_filename)
+    return done
+
+def write_delta_patches():
+    """표 출력마다 이전 내보내기 대비 행 변경분(upsert/delete)을 patches/에 쓴다 (delta_patches.py).
+    출력 파일이 지난번 그대로면 읽지 않고 넘어간다. 행 형식 표는 스트리밍으로 읽는다 (iter_table)."""
+    writer = PatchWriter(DATA_DIR)
+    with METRICS.job('delta_patches', PATCH_DIR):
+        for output_filename in ROW_KEYS:
+            output_path = os.path.join(DATA_DIR, output_filename)
+            if not os.path.exists(output_path):
+                continue
+            with METRICS.stage('plan'):
+                digest = file_digest(output_path)
+            if writer.unchanged(output_filename, digest):
+                continue
+            with METRICS.stage('diff'):
+                patch = writer.update(output_filename, partial(read_table_rows, output_filename), digest)
+            METRICS.count(rows=writer.datasets[os.path.splitext(output_filename)[0]]['total_rows'])
+            if patch:
+                METRICS.count(bytes_written=patch['bytes'])
+                print(f"Saved patch {patch['file']}: {patch['upserts']} upserts, {patch['deletes']} deletes "
+                      f"({patch['bytes']} bytes)")
+        writer.save()
+
+def publish_data_artifacts():
+    """DATA_DIR 전체를 공백 없는 내용 해시 이름 파일로 한 벌 더 쓰고 artifacts.json을 갱신한다
+    (publish_artifacts.py, PRECOMPRESS면 gzip/brotli 변형도). 다른 출력을 모두 쓴 뒤 마지막에 호출한다."""
+    with METRICS.job('publish_artifacts', ASSET_DIR):
+        with METRICS.stage('publish'):
+            count, created, removed = publish_artifacts.publish(DATA_DIR, precompress=PRECOMPRESS)
+    print(f"Published {count} data files to {ASSET_DIR}/ ({created} new artifacts, {removed} removed)")
+
+def finalize(cache, force=False, publish=True):
+    """시트 추출 뒤 공통 마무리: 파생 출력, 행 변경분 패치, 빌드 캐시와 매장 레지스트리 저장,
+    내용 해시 산출물 발행 (publish=False면 건너뜀). update_data_unified.py와 update_all_data.py가 같이 쓴다."""
+    run_derived_jobs(cache, force=force)
+    write_delta_patches()
+    cache.save()
+    REGISTRY.save(DATA_DIR)
+    if publish:
+        publish_data_artifacts()
+
+def init_worker(output_format, parse_cache, xlsx_reader):
+    """워커 프로세스는 (spawn 방식에서) 메인의 전역 설정을 물려받지 않으므로 다시 설정한다."""
+    global OUTPUT_FORMAT, PARSE_CACHE, XLSX_READER
+    OUTPUT_FORMAT = output_format
+    PARSE_CACHE = parse_cache
+    XLSX_READER = xlsx_reader
+
+def run_extractor(workbook, extractor, sheet_name, output_filename):
+    """추출기 하나를 계측 범위(METRICS.job) 안에서 실행하고 성공 여부를 반환한다."""
+    with METRICS.job(sheet_name, output_filename) as job:
+        job['ok'] = bool(extractor(workbook, sheet_name, output_filename))
+    return job['ok']
+
+def run_sheet_job(excel_file, job_index):
+    """병렬 모드 워커 진입점. 워커마다 워크북을 스트리밍 모드로 따로 열고 시트 하나만 처리한다.
+
+    Returns: (시트명, 성공 여부, 소요 시간(초), 워커 PID, 워커에서 모은 매장 레지스트리, 단계별 계측)
+    """
+    extractor, sheet_name, output_filename = SHEET_JOBS[job_index]
+    with METRICS.job(sheet_name, output_filename) as job:
+        with METRICS.stage('load'):
+            wb = load_workbook(excel_file, streaming=True)
+        try:
+            job['ok'] = bool(extractor(wb, sheet_name, output_filename))
+        finally:
+            wb.close()
+    return sheet_name, job['ok'], job['wall_s'], os.getpid(), REGISTRY.snapshot(), METRICS.take_jobs()
+
+def run_parallel(excel_file, job_indices, max_workers=None):
+    """SHEET_JOBS 중 job_indices를 프로세스 풀에서 시트별로 동시에 실행하고 워커별 소요 시간을 출력한다.
+    전체 소요 시간은 가장 느린 시트에 맞춰진다."""
+    max_workers = max_workers or len(job_indices)
+    if PARSE_CACHE == 'build':
+        # 워커마다 따로 파싱하지 않도록 캐시를 먼저 만들어 둔다
+        with METRICS.stage('load'):
+            workbook_cache.load_workbook(excel_file, data_only=True).close()
+    print(f"Running {len(job_indices)} sheet extractors in parallel ({max_workers} workers)...")
+    timings = []
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker, initargs=(OUTPUT_FORMAT, PARSE_CACHE, XLSX_READER)) as pool:
+        futures = {pool.submit(run_sheet_job, excel_file, idx): idx for idx in job_indices}
+        for future in as_completed(futures):
+            sheet_name = SHEET_JOBS[futures[future]][1]
+            try:
+                result = future.result()
+                REGISTRY.merge(result[4])
+                METRICS.add_jobs(result[5])
+                timings.append((futures[future],) + result[:4])
+            except Exception as e:
+                print(f"ERROR in worker for '{sheet_name}': {e}")
+                timings.append((futures[future], sheet_name, False, None, None))
+
+    print("\nWorker timings:")
+    for _, sheet_name, ok, elapsed, pid in sorted(timings, key=lambda t: -(t[3] or 0)):
+        status = 'ok' if ok else 'skipped/failed'
+        elapsed_str = f"{elapsed:.2f}s" if elapsed is not None else '-'
+        print(f"  {sheet_name:<12} {elapsed_str:>9}  pid={pid}  {status}")
+    return [idx for idx, _, ok, _, _ in timings if ok]
+
+def plan_jobs(cache, excel_file, jobs=SHEET_JOBS, force=False):
+    """시트 내용 지문과 추출기 버전으로 다시 만들어야 하는 작업만 고른다.
+
+    Returns: (실행할 작업 인덱스 목록, {작업 인덱스: 캐시 키})
+    """
+    fingerprints = cache.sheet_fingerprints(excel_file)
+    version = [file_digest(os.path.abspath(path)) for path in EXTRACTOR_SOURCES]
+    pending, keys = [], {}
+    for idx, (extractor, sheet_name, output_filename) in enumerate(jobs):
+        output_path = os.path.join(DATA_DIR, output_filename)
+        key = cache.make_key(fingerprints.get(sheet_name), version, extractor.__name__, OUTPUT_FORMAT)
+        keys[idx] = key
+        if sheet_name not in fingerprints:
+            print(f"Skipping: '{sheet_name}' sheet not found.")
+            continue
+        if not force and cache.is_fresh(output_path, key):
+            print(f"Unchanged: '{sheet_name}' -> keeping {output_filename}")
+            continue
+        pending.append(idx)
+    return pending, keys
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='backdata.xlsx -> public/data/*.json')
+    parser.add_argument('--full-load', action='store_true',
+                        help='read-only 스트리밍 대신 전체 워크북을 메모리에 로드 (이전 방식)')
+    parser.add_argument('--parallel', action='store_true',
+                        help='시트별로 워커 프로세스를 띄워 병렬 처리')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='병렬 모드 워커 수 (기본: 시트 수)')
+    parser.add_argument('--force', action='store_true',
+                        help='빌드 캐시를 무시하고 모든 시트를 다시 추출')
+    parser.add_argument('--format', choices=['rows', 'columnar'], default=OUTPUT_FORMAT,
+                        help='표 형식 출력 포맷 (columnar: 열 단위 + 문자열 사전 인코딩, 용량이 몇 배 작음)')
+    parser.add_argument('--parse-cache', choices=['auto', 'build', 'off'], default=PARSE_CACHE,
+                        help='워크북 파싱 캐시 (auto: 있으면 사용, build: 없으면 만들어서 사용, off: 항상 xlsx를 파싱)')
+    parser.add_argument('--reader', choices=['native', 'openpyxl'], default=XLSX_READER,
+                        help='스트리밍 모드 xlsx 리더 (native: 시트 XML 직접 스캔, openpyxl: read-only 모드)')
+    parser.add_argument('--no-publish', action='store_true',
+                        help='내용 해시 이름의 산출물(public/data/assets, artifacts.json)을 만들지 않음')
+    parser.add_argument('--precompress', action='store_true',
+                        help='산출물의 gzip/brotli 변형(.gz/.br)도 미리 만든다 (data_server.py로 서빙할 때)')
+    parser.add_argument('--metrics-out', default=None,
+                        help='단계별 계측 JSON 경로 (기본: .cache/runs/run-<시각>.json)')
+    parser.add_argument('--profile', action='store_true',
+                        help='cProfile로 전체 실행을 프로파일링해 .cache/runs/에 .prof 저장하고 행 단위 단계(convert 등)도 계측 (순차 모드)')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='tracemalloc으로 추출기별 최대 할당량과 상위 할당 위치 기록 (순차 모드)')
+    args = parser.parse_args()
+    OUTPUT_FORMAT = args.format
+    PARSE_CACHE = args.parse_cache
+    XLSX_READER = args.reader
+    PRECOMPRESS = args.precompress
+    if args.parallel and args.full_load:
+        parser.error('--parallel은 스트리밍 모드에서만 사용할 수 있습니다 (--full-load와 함께 사용 불가)')
+    if args.parallel and (args.profile or args.trace_memory):
+        parser.error('--profile/--trace-memory는 순차 모드에서만 사용할 수 있습니다 (워커 프로세스는 계측되지 않음)')
+
     print("=" * 50)
     print("Starting Optimized Dashboard Data Update")
     print("=" * 50)
     
     start_time = datetime.now()
+    METRICS.reset()
+    METRICS.row_stages = args.profile
+    profiler = cProfile.Profile() if args.profile else None
+    if args.trace_memory:
+        tracemalloc.start()
+    if profiler:
+        profiler.enable()
     
     try:
-        print(f"Loading {EXCEL_FILE} (this may take a minute color 64MB)...")
-        # data_only=True to get calculated values
-        wb = openpyxl.load_workbook(EXCEL_FILE, data_only=True)
-        print(f"File loaded in {datetime.now() - start_time}")
-        
-        # Standard sheets
-        process_generic_sheet(wb, '매장', 'store_data.json')
-        process_generic_sheet(wb, '아이템시즌별판매', 'item_season_data.json')
-        
-        # Optimize '매장별스타일판매' to reduce file size (it was 180MB+)
-        print("Processing optimized sheet: 매장별스타일판매...")
-        style_sheet = wb['매장별스타일판매']
-        style_headers = [cell.value for cell in style_sheet[1]]
-        
-        # Define mapping from possible Excel headers to JSON keys
-        header_mapping = {
-            '매장명': '매장명',
-            '품번': '품번',
-            '제품명': '제품명',
-            '판매액': '판매액합계',
-            '판매액합계': '판매액합계',
-            '판매수량': '판매수량합계',
-            '판매수량합계': '판매수량합계',
-            '일자': '일자',
-            '시즌': '시즌'
-        }
-        
-        # Build col_indices based on available headers
-        col_indices = {}
-        for excel_h, json_h in header_mapping.items():
-            if excel_h in style_headers:
-                col_indices[json_h] = style_headers.index(excel_h)
-        
-        date_idx = style_headers.index('일자') if '일자' in style_headers else -1
-        print(f"DEBUG: col_indices={col_indices}, date_idx={date_idx}")
-        
-        style_data = []
-        for i, row in enumerate(style_sheet.iter_rows(min_row=2, values_only=True)):
-            # If '일자' exists, filter for 2026. Otherwise include all (per user request)
-            include_row = True
-            if date_idx >= 0:
-                val = row[date_idx]
-                try:
-                    v_str = str(val)
-                    if '2026' not in v_str:
-                        include_row = False
-                except:
-                    pass
-            
-            if not include_row:
-                continue
-                
-            row_data = {}
-            for json_h, idx in col_indices.items():
-                val = row[idx]
-                if json_h == '매장명':
-                    val = normalize_store_name(val)
-                row_data[json_h] = format_date(val)
-            style_data.append(row_data)
+        os.makedirs(DATA_DIR, exist_ok=True)
+        cache = BuildCache()
+        with METRICS.stage('plan'):
+            pending, keys = plan_jobs(cache, EXCEL_FILE, force=args.force)
+        print(f"{len(pending)}/{len(SHEET_JOBS)} sheets need rebuilding ({datetime.now() - start_time})")
+
+        if not pending:
+            done = []
+        elif args.parallel:
+            done = run_parallel(EXCEL_FILE, pending, args.workers)
+        else:
+            mode = 'full load' if args.full_load else 'streaming'
+            print(f"Opening {EXCEL_FILE} ({mode})...")
+            # data_only=True to get calculated values
+            with METRICS.stage('load'):
+                wb = load_workbook(EXCEL_FILE, streaming=not args.full_load)
+            print(f"File opened in {datetime.now() - start_time}")
             
-        with open(os.path.join(DATA_DIR, 'store_style_sales_data.json'), 'w', encoding='utf-8') as f:
-            json.dump({
-                'headers': list(col_indices.keys()),
-                'data': style_data,
-                'total_rows': len(style_data)
-            }, f, ensure_ascii=False, indent=2)
-        print(f"Saved {len(style_data)} optimized rows to store_style_sales_data.json")
-
-        process_generic_sheet(wb, '매장별재고', 'store_inventory_data.json')
-        process_performance_sheet(wb, '실적', 'performance_data.json')
-        # process_generic_sheet(wb, '주간회의', 'weekly_meeting_data.json') # Removed as it's missing in current file
-        
-        # Specialized sheets
-        process_group_sales(wb, '단체', 'group_sales_data.json')
-        process_competitor(wb, '경쟁사', 'competitor_data_v2.json')
+            done = []
+            try:
+                for idx in pending:
+                    if run_extractor(wb, *SHEET_JOBS[idx]):
+                        done.append(idx)
+            finally:
+                # read-only 모드는 파일 핸들을 열어 두므로 명시적으로 닫는다
+                wb.close()
+
+        for idx in done:
+            cache.record(os.path.join(DATA_DIR, SHEET_JOBS[idx][2]), keys[idx])
+        finalize(cache, force=args.force, publish=not args.no_publish)
+
+        run_info = {'mode': 'parallel' if args.parallel else ('full load' if args.full_load else 'streaming'),
+                    'format': OUTPUT_FORMAT, 'parse_cache': PARSE_CACHE, 'reader': XLSX_READER, 'excel_file': EXCEL_FILE}
+        if profiler:
+            profiler.disable()
+            profile_path = os.path.join(RUNS_DIR, f"run-{METRICS.started_at.strftime('%Y%m%d-%H%M%S')}.prof")
+            os.makedirs(RUNS_DIR, exist_ok=True)
+            profiler.dump_stats(profile_path)
+            run_info['profile'] = profile_path
+            print(f"\ncProfile (top 20 by cumulative time, full stats: {profile_path}):")
+            pstats.Stats(profiler).sort_stats('cumulative').print_stats(20)
+        if tracemalloc.is_tracing():
+            top = tracemalloc.take_snapshot().statistics('lineno')[:10]
+            run_info['top_allocations'] = [{'where': str(stat.traceback), 'bytes': stat.size, 'count': stat.count}
+                                           for stat in top]
+            tracemalloc.stop()
+        METRICS.print_report()
+        print(f"Run metrics: {METRICS.write_run_file(args.metrics_out, **run_info)}")
         
         print("\n" + "=" * 50)
         print(f"All data updated successfully in {datetime.now() - start_time}")
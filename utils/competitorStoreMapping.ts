@@ -1,6 +1,7 @@
 /**
  * 매장명 ↔ 경쟁사(백화점) 시트명 매핑
  * 매장 데이터와 경쟁사 시트의 명칭이 다를 경우 여기서 매칭
+ * (store_registry.py COMPETITOR_ALIASES와 같은 목록을 유지할 것: 내보내기 시 경쟁사 행의 매장ID 계산에 사용)
  *
  * ※ 더현대서울: backdata 경쟁사 시트에 해당 행이 없으면 경쟁사 데이터가 표시되지 않습니다.
  *   경쟁사 시트 A열(백화점)에 "더현대서울" 또는 "더현대 서울"로 추가 후 read_competitor_v2_fixed.py 또는 update_data_unified.py 실행 필요.
@@ -18,3 +19,49 @@ export const getCompetitorSearchNames = (storeName: string): string[] => {
   const aliases = STORE_TO_COMPETITOR_ALIAS[storeName];
   return aliases ? [storeName, ...aliases] : [storeName];
 };
+
+export interface CompetitorBrandRank {
+  브랜드: string;
+  월평균: number;
+  순위: number;
+  순위변동?: number | null; // 이전 내보내기 대비 (오르면 양수)
+}
+
+// competitor_rankings.json의 점포 항목 (competitor_rankings.py)
+export interface CompetitorStoreRanking {
+  백화점: string;
+  매장ID: string | null;
+  brands: CompetitorBrandRank[];
+  mlb_rank: number | null;
+  mlb_share: number;
+  mlb_rank_delta: number | null;
+}
+
+// 경쟁사 데이터별 백화점명 -> 미리 계산된 점포 순위
+const rankingIndexes = new WeakMap<object, Map<string, CompetitorStoreRanking>>();
+
+/**
+ * 점포 안 브랜드 순위 (월평균 0보다 큰 브랜드, 내림차순).
+ * dataService.getCompetitorData가 합쳐 둔 store_rankings가 있으면 그대로 쓰고, 없으면 여기서 정렬한다.
+ */
+export const getStoreBrandRanking = (
+  competitorData: any,
+  store: { 백화점: string; 브랜드별_월평균: { [brand: string]: number } }
+): CompetitorBrandRank[] => {
+  const rankings: CompetitorStoreRanking[] | undefined = competitorData?.store_rankings;
+  if (rankings) {
+    let index = rankingIndexes.get(competitorData);
+    if (!index) {
+      index = new Map(rankings.map(entry => [entry.백화점, entry]));
+      rankingIndexes.set(competitorData, index);
+    }
+    const entry = index.get(store.백화점);
+    if (entry) return entry.brands;
+  }
+
+  return Object.entries(store.브랜드별_월평균 || {})
+    .filter(([_, value]) => Number(value) > 0)
+    .map(([brandName, monthlyAvg]) => ({ 브랜드: brandName, 월평균: Number(monthlyAvg), 순위: 0 }))
+    .sort((a, b) => b.월평균 - a.월평균)
+    .map((item, idx) => ({ ...item, 순위: idx + 1 }));
+};
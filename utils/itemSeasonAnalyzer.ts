@@ -1,4 +1,5 @@
 import { StoreData } from '../types';
+import { resolveStoreId, selectStoreRows } from './storeRegistry';
 // JSON import removed
 
 interface ItemSeasonData {
@@ -18,58 +19,51 @@ interface ItemSeasonData {
   [key: string]: any;
 }
 
-/**
- * 선택한 매장의 아이템시즌별판매 데이터를 분석하여 AI 분석에 포함할 정보를 추출
- */
-export const analyzeItemSeasonData = (storeName: string, itemSeasonData: any): {
-  시즌별요약: string;
-  ITEM별요약: string;
-  반품분석: string;
-  월별패턴: string;
-  전체신장률?: number;
-  시즌성장근거?: string;
-  ITEM성장근거?: string;
-  시즌성장분석?: string;
-  시즌감소분석?: string;
-  ITEM성장분석?: string;
-  ITEM감소분석?: string;
-  최근3개월추이?: string;
-} => {
-  const data = itemSeasonData;
+// 매장 하나의 아이템시즌 집계 (item_season_analytics.py와 같은 모양, 금액은 만원 단위로 반올림한 값)
+export interface ItemSeasonStoreAnalytics {
+  rows: number;
+  seasons: Array<{ 시즌: string; 판매액: number; 판매수량: number }>;
+  items: Array<{ ITEM: string; 판매액: number; 판매수량: number }>;
+  normal_sales: number; // 정상 판매액 합계 (원)
+  return_sales: number; // 반품 판매액 합계의 절댓값 (원)
+  monthly: { current: number[]; previous: number[] }; // 올해/전년 1~11월 판매액 (원)
+  peak_month: { month: number; 판매액: number } | null;
+  season_growth: Array<{ 시즌: string; 올해: number; 작년: number; growthRate: number }>;
+  item_growth: Array<{ ITEM: string; 올해: number; 작년: number; growthRate: number }>;
+  growth: number; // 전체 신장률 (%, 소수 첫째 자리)
+}
 
+// update_data_unified.py가 만든 매장별 아이템시즌 분석 번들 (item_season_analytics.py)
+export interface ItemSeasonAnalytics {
+  format: 'item_season_analytics';
+  current_year: number;
+  previous_year: number;
+  months: number[];
+  top_n: number;
+  stores: { [storeId: string]: ItemSeasonStoreAnalytics };
+}
 
-  // 매장명 매칭 (정확한 매칭)
-  const storeItems = data.data.filter((item: ItemSeasonData) => {
-    const itemStoreName = item.매장명 || '';
+const MONTHS = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]; // 12월 제외
+const monthKey = (year: number, month: number) => `${year}${String(month).padStart(2, '0')}`;
 
-    // 괄호 안의 이름 추출 (예: "29CM(롯데본점)" -> "롯데본점")
-    const match = itemStoreName.match(/\(([^)]+)\)/);
-    if (match) {
-      const nameInBracket = match[1];
-      // 괄호 안의 이름과 정확히 일치하거나 포함 관계 확인
-      return nameInBracket === storeName || storeName === nameInBracket;
-    }
-    // 괄호가 없으면 직접 매칭 (예: "갤러리아진주" == "갤러리아진주")
-    return itemStoreName === storeName;
-  });
+let analyticsBundle: ItemSeasonAnalytics | null = null;
 
-  // 디버깅: 매칭된 데이터 확인
-  if (storeItems.length === 0) {
-    console.warn(`[itemSeasonAnalyzer] 매장 "${storeName}"에 대한 데이터를 찾을 수 없습니다.`);
-    // 매칭 실패 시 빈 데이터 반환
-  } else {
-    console.log(`[itemSeasonAnalyzer] 매장 "${storeName}"에 대한 ${storeItems.length}개 데이터 발견`);
-  }
+// 번들이 없는 이전 배포에서는 null (매번 아이템시즌 행을 받아 매장별로 다시 집계한다)
+export const setItemSeasonAnalytics = (value: ItemSeasonAnalytics | null) => {
+  analyticsBundle = value && value.format === 'item_season_analytics' ? value : null;
+};
 
-  if (storeItems.length === 0) {
-    return {
-      시즌별요약: '해당 매장의 시즌별 데이터가 없습니다.',
-      ITEM별요약: '해당 매장의 ITEM별 데이터가 없습니다.',
-      반품분석: '반품 데이터가 없습니다.',
-      월별패턴: '월별 데이터가 없습니다.'
-    };
-  }
+// 번들에서 매장 집계를 찾는다. 번들로 판단할 수 없으면 undefined, 번들에 행이 없는 매장이면 null
+const getBundleEntry = (storeName: string): ItemSeasonStoreAnalytics | null | undefined => {
+  const storeId = analyticsBundle ? resolveStoreId(storeName) : null;
+  return storeId ? analyticsBundle!.stores[storeId] || null : undefined;
+};
 
+// 번들이 있으면 매장 선택 후 아이템시즌 샤드를 받지 않아도 된다
+export const hasItemSeasonAnalytics = (storeName: string): boolean => getBundleEntry(storeName) !== undefined;
+
+// 번들이 없을 때: 행에서 같은 집계를 직접 계산한다
+const computeStoreAnalytics = (storeItems: ItemSeasonData[]): ItemSeasonStoreAnalytics => {
   // 시즌별 집계
   const seasonMap: { [key: string]: { 판매액: number; 판매수량: number } } = {};
   storeItems.forEach((item: ItemSeasonData) => {
@@ -113,84 +107,126 @@ export const analyzeItemSeasonData = (storeName: string, itemSeasonData: any): {
   // 반품 분석
   const total정상판매액 = storeItems.reduce((sum: number, item: ItemSeasonData) => sum + (item.정상_판매액 || 0), 0);
   const total반품판매액 = Math.abs(storeItems.reduce((sum: number, item: ItemSeasonData) => sum + (item.반품_판매액 || 0), 0));
-  const 반품률 = total정상판매액 > 0 ? (total반품판매액 / total정상판매액) * 100 : 0;
 
-  // 월별 패턴 분석 (2025년 데이터, 12월 제외)
-  const monthlySales: { [key: string]: number } = {};
-  for (let month = 1; month <= 11; month++) { // 12월 제외
-    const monthKey = `2025${String(month).padStart(2, '0')}`;
-    monthlySales[`${month}월`] = storeItems.reduce((sum: number, item: ItemSeasonData) => sum + (item[monthKey] || 0), 0);
-  }
+  // 월별 판매액 (25년/24년 1~11월)
+  const current = MONTHS.map(month =>
+    storeItems.reduce((sum: number, item: ItemSeasonData) => sum + (item[monthKey(2025, month)] || 0), 0));
+  const previous = MONTHS.map(month =>
+    storeItems.reduce((sum: number, item: ItemSeasonData) => sum + (item[monthKey(2024, month)] || 0), 0));
 
-  const peakMonth = Object.entries(monthlySales)
-    .filter(([_, value]) => value > 0) // 0인 월 제외
-    .sort((a, b) => b[1] - a[1])[0];
+  const peak = MONTHS
+    .map((month, i) => ({ month, 판매액: current[i] }))
+    .filter(m => m.판매액 > 0) // 0인 월 제외
+    .sort((a, b) => b.판매액 - a.판매액)[0];
 
-  // 시즌별 전년 대비 분석 (25년 1~11월 vs 24년 1~11월)
-  const seasonGrowth: { [key: string]: { 올해: number; 작년: number } } = {};
-  storeItems.forEach((item: ItemSeasonData) => {
-    const season = item.시즌 || '기타';
-    if (!seasonGrowth[season]) {
-      seasonGrowth[season] = { 올해: 0, 작년: 0 };
-    }
-    // 올해 데이터: 25년 1~11월 월별 데이터 합계
-    for (let month = 1; month <= 11; month++) {
-      const currentYearKey = `2025${String(month).padStart(2, '0')}`;
-      seasonGrowth[season].올해 += item[currentYearKey] || 0;
-    }
-    // 작년 데이터: 24년 1~11월 월별 데이터 합계
-    for (let month = 1; month <= 11; month++) {
-      const lastYearKey = `2024${String(month).padStart(2, '0')}`;
-      seasonGrowth[season].작년 += item[lastYearKey] || 0;
+  // 시즌/ITEM별 전년 대비 분석 (25년 1~11월 vs 24년 1~11월)
+  const growthOf = (keyOf: (item: ItemSeasonData) => string) => {
+    const growth: { [key: string]: { 올해: number; 작년: number } } = {};
+    storeItems.forEach((item: ItemSeasonData) => {
+      const key = keyOf(item);
+      if (!growth[key]) {
+        growth[key] = { 올해: 0, 작년: 0 };
+      }
+      MONTHS.forEach(month => { growth[key].올해 += item[monthKey(2025, month)] || 0; });
+      MONTHS.forEach(month => { growth[key].작년 += item[monthKey(2024, month)] || 0; });
+    });
+    return Object.entries(growth)
+      .map(([key, values]) => {
+        const growthRate = values.작년 > 0 ? ((values.올해 - values.작년) / values.작년) * 100 : 0;
+        return { key, 올해: Math.round(values.올해 / 10000), 작년: Math.round(values.작년 / 10000), growthRate };
+      })
+      .sort((a, b) => b.올해 - a.올해)
+      .slice(0, 5);
+  };
+  const seasonGrowth = growthOf(item => item.시즌 || '기타')
+    .map(({ key, ...rest }) => ({ 시즌: key, ...rest }));
+  const itemGrowth = growthOf(item => item.ITEM || '기타')
+    .map(({ key, ...rest }) => ({ ITEM: key, ...rest }));
+
+  // 전체 신장률 계산 (25년 1~11월 vs 24년 1~11월)
+  const total올해 = current.reduce((sum, value) => sum + value, 0);
+  const total작년 = previous.reduce((sum, value) => sum + value, 0);
+  const 전체신장률 = total작년 > 0 ? ((total올해 - total작년) / total작년) * 100 : 0;
+
+  return {
+    rows: storeItems.length,
+    seasons: topSeasons,
+    items: topItems,
+    normal_sales: total정상판매액,
+    return_sales: total반품판매액,
+    monthly: { current, previous },
+    peak_month: peak || null,
+    season_growth: seasonGrowth,
+    item_growth: itemGrowth,
+    growth: Math.round(전체신장률 * 10) / 10
+  };
+};
+
+const selectStoreItems = (storeName: string, itemSeasonData: any): ItemSeasonData[] =>
+  selectStoreRows((itemSeasonData && itemSeasonData.data) || [], storeName, (item: ItemSeasonData) => {
+    const itemStoreName = item.매장명 || '';
+
+    // 괄호 안의 이름 추출 (예: "29CM(롯데본점)" -> "롯데본점")
+    const match = itemStoreName.match(/\(([^)]+)\)/);
+    if (match) {
+      const nameInBracket = match[1];
+      // 괄호 안의 이름과 정확히 일치하거나 포함 관계 확인
+      return nameInBracket === storeName || storeName === nameInBracket;
     }
+    // 괄호가 없으면 직접 매칭 (예: "갤러리아진주" == "갤러리아진주")
+    return itemStoreName === storeName;
   });
 
-  const seasonGrowthDetails = Object.entries(seasonGrowth)
-    .map(([시즌, values]) => {
-      const growthRate = values.작년 > 0 ? ((values.올해 - values.작년) / values.작년) * 100 : 0;
-      return { 시즌, 올해: Math.round(values.올해 / 10000), 작년: Math.round(values.작년 / 10000), growthRate };
-    })
-    .sort((a, b) => b.올해 - a.올해)
-    .slice(0, 5);
+/**
+ * 선택한 매장의 아이템시즌별판매 데이터를 분석하여 AI 분석에 포함할 정보를 추출
+ * (분석 번들이 있으면 미리 계산된 집계를 문장으로만 만들고, itemSeasonData는 번들이 없을 때만 쓴다)
+ */
+export const analyzeItemSeasonData = (storeName: string, itemSeasonData: any): {
+  시즌별요약: string;
+  ITEM별요약: string;
+  반품분석: string;
+  월별패턴: string;
+  전체신장률?: number;
+  시즌성장근거?: string;
+  ITEM성장근거?: string;
+  시즌성장분석?: string;
+  시즌감소분석?: string;
+  ITEM성장분석?: string;
+  ITEM감소분석?: string;
+  최근3개월추이?: string;
+} => {
+  let analytics = getBundleEntry(storeName);
+  if (analytics === undefined) {
+    const storeItems = selectStoreItems(storeName, itemSeasonData);
+    analytics = storeItems.length > 0 ? computeStoreAnalytics(storeItems) : null;
+  }
+
+  // 디버깅: 매칭된 데이터 확인
+  if (!analytics) {
+    console.warn(`[itemSeasonAnalyzer] 매장 "${storeName}"에 대한 데이터를 찾을 수 없습니다.`);
+    // 매칭 실패 시 빈 데이터 반환
+    return {
+      시즌별요약: '해당 매장의 시즌별 데이터가 없습니다.',
+      ITEM별요약: '해당 매장의 ITEM별 데이터가 없습니다.',
+      반품분석: '반품 데이터가 없습니다.',
+      월별패턴: '월별 데이터가 없습니다.'
+    };
+  }
+  console.log(`[itemSeasonAnalyzer] 매장 "${storeName}"에 대한 ${analytics.rows}개 데이터 발견`);
+
+  const { seasons, items, season_growth, item_growth, monthly } = analytics;
+  const 반품률 = analytics.normal_sales > 0 ? (analytics.return_sales / analytics.normal_sales) * 100 : 0;
 
-  const growingSeasons = seasonGrowthDetails.filter(s => s.growthRate > 0);
-  const decliningSeasons = seasonGrowthDetails.filter(s => s.growthRate < 0);
+  const growingSeasons = season_growth.filter(s => s.growthRate > 0);
+  const decliningSeasons = season_growth.filter(s => s.growthRate < 0);
+  const growingItems = item_growth.filter(i => i.growthRate > 0);
+  const decliningItems = item_growth.filter(i => i.growthRate < 0);
 
   // 시즌별 성장률 계산 근거
   const 시즌성장근거 = growingSeasons.length > 0
     ? growingSeasons.map(s => `${s.시즌}: 25년 ${s.올해}만원 vs 24년 ${s.작년}만원 = ${s.growthRate >= 0 ? '+' : ''}${s.growthRate.toFixed(1)}%`).join(' | ')
     : '성장하는 시즌 없음';
 
-  // ITEM별 전년 대비 분석 (25년 1~11월 vs 24년 1~11월)
-  const itemGrowth: { [key: string]: { 올해: number; 작년: number } } = {};
-  storeItems.forEach((item: ItemSeasonData) => {
-    const itemCode = item.ITEM || '기타';
-    if (!itemGrowth[itemCode]) {
-      itemGrowth[itemCode] = { 올해: 0, 작년: 0 };
-    }
-    // 올해 데이터: 25년 1~11월 월별 데이터 합계
-    for (let month = 1; month <= 11; month++) {
-      const currentYearKey = `2025${String(month).padStart(2, '0')}`;
-      itemGrowth[itemCode].올해 += item[currentYearKey] || 0;
-    }
-    // 작년 데이터: 24년 1~11월 월별 데이터 합계
-    for (let month = 1; month <= 11; month++) {
-      const lastYearKey = `2024${String(month).padStart(2, '0')}`;
-      itemGrowth[itemCode].작년 += item[lastYearKey] || 0;
-    }
-  });
-
-  const itemGrowthDetails = Object.entries(itemGrowth)
-    .map(([ITEM, values]) => {
-      const growthRate = values.작년 > 0 ? ((values.올해 - values.작년) / values.작년) * 100 : 0;
-      return { ITEM, 올해: Math.round(values.올해 / 10000), 작년: Math.round(values.작년 / 10000), growthRate };
-    })
-    .sort((a, b) => b.올해 - a.올해)
-    .slice(0, 5);
-
-  const growingItems = itemGrowthDetails.filter(i => i.growthRate > 0);
-  const decliningItems = itemGrowthDetails.filter(i => i.growthRate < 0);
-
   // ITEM별 성장률 계산 근거
   const ITEM성장근거 = growingItems.length > 0
     ? growingItems.map(i => `${i.ITEM}: 25년 ${i.올해}만원 vs 24년 ${i.작년}만원 = ${i.growthRate >= 0 ? '+' : ''}${i.growthRate.toFixed(1)}%`).join(' | ')
@@ -202,31 +238,19 @@ export const analyzeItemSeasonData = (storeName: string, itemSeasonData: any): {
   for (let i = 2; i >= 0; i--) {
     const month = currentMonth - i;
     if (month > 0 && month <= 11) { // 12월 제외
-      const monthKey = `2025${String(month).padStart(2, '0')}`;
-      const lastYearKey = `2024${String(month).padStart(2, '0')}`;
-      const current = storeItems.reduce((sum: number, item: ItemSeasonData) => sum + (item[monthKey] || 0), 0);
-      const lastYear = storeItems.reduce((sum: number, item: ItemSeasonData) => sum + (item[lastYearKey] || 0), 0);
+      const current = monthly.current[month - 1];
+      const lastYear = monthly.previous[month - 1];
       const growth = lastYear > 0 ? ((current - lastYear) / lastYear) * 100 : 0;
       recentMonths.push({ month: `${month}월`, current: Math.round(current / 10000), lastYear: Math.round(lastYear / 10000), growth });
     }
   }
 
-  // 전체 신장률 계산 (25년 1~11월 vs 24년 1~11월)
-  let total올해 = 0;
-  let total작년 = 0;
-  for (let month = 1; month <= 11; month++) {
-    const currentYearKey = `2025${String(month).padStart(2, '0')}`;
-    const lastYearKey = `2024${String(month).padStart(2, '0')}`;
-    total올해 += storeItems.reduce((sum: number, item: ItemSeasonData) => sum + (item[currentYearKey] || 0), 0);
-    total작년 += storeItems.reduce((sum: number, item: ItemSeasonData) => sum + (item[lastYearKey] || 0), 0);
-  }
-  const 전체신장률 = total작년 > 0 ? ((total올해 - total작년) / total작년) * 100 : 0;
-
+  const peak = analytics.peak_month;
   return {
-    시즌별요약: `주요 시즌: ${topSeasons.map(s => `${s.시즌}(${s.판매액}만원)`).join(', ')}`,
-    ITEM별요약: `주요 ITEM: ${topItems.map(i => `${i.ITEM}(${i.판매액}만원, ${i.판매수량}건)`).join(', ')}`,
-    반품분석: `반품률: ${반품률.toFixed(1)}% (정상판매 ${Math.round(total정상판매액 / 10000)}만원, 반품 ${Math.round(total반품판매액 / 10000)}만원)`,
-    월별패턴: peakMonth ? `2025년 최고 판매월: ${peakMonth[0]} (${Math.round(peakMonth[1] / 10000)}만원)` : '월별 데이터 없음',
+    시즌별요약: `주요 시즌: ${seasons.map(s => `${s.시즌}(${s.판매액}만원)`).join(', ')}`,
+    ITEM별요약: `주요 ITEM: ${items.map(i => `${i.ITEM}(${i.판매액}만원, ${i.판매수량}건)`).join(', ')}`,
+    반품분석: `반품률: ${반품률.toFixed(1)}% (정상판매 ${Math.round(analytics.normal_sales / 10000)}만원, 반품 ${Math.round(analytics.return_sales / 10000)}만원)`,
+    월별패턴: peak ? `2025년 최고 판매월: ${peak.month}월 (${Math.round(peak.판매액 / 10000)}만원)` : '월별 데이터 없음',
     시즌성장분석: growingSeasons.length > 0
       ? `성장 시즌: ${growingSeasons.map(s => `${s.시즌}(+${s.growthRate.toFixed(1)}%)`).join(', ')}`
       : '성장하는 시즌 없음',
@@ -240,9 +264,8 @@ export const analyzeItemSeasonData = (storeName: string, itemSeasonData: any): {
       ? `감소 ITEM: ${decliningItems.map(i => `${i.ITEM}(${i.growthRate.toFixed(1)}%)`).join(', ')}`
       : '감소하는 ITEM 없음',
     최근3개월추이: recentMonths.map(m => `${m.month}: ${m.current}만원 (전년 ${m.lastYear}만원, ${m.growth >= 0 ? '+' : ''}${m.growth.toFixed(1)}%)`).join(' | '),
-    전체신장률: Math.round(전체신장률 * 10) / 10,
+    전체신장률: analytics.growth,
     시즌성장근거: 시즌성장근거,
     ITEM성장근거: ITEM성장근거
   };
 };
-
@@ -1,4 +1,4 @@
-import { StoreData } from '../types';
+import { ItemPerformance, StoreData } from '../types';
 import { analyzeItemSeasonData } from './itemSeasonAnalyzer';
 
 /**
@@ -36,7 +36,8 @@ export const generateLocalInsight = (storeData: StoreData, itemSeasonData?: any)
   }, monthlyPerformance[0]);
 
   // 아이템 성과 분석
-  const topItem = itemPerformance.sort((a, b) => b.sales - a.sales)[0];
+  // itemPerformance가 비어 있으면 topItem은 undefined (아래 분기에서 건너뛴다)
+  const topItem: ItemPerformance | undefined = [...itemPerformance].sort((a, b) => b.sales - a.sales)[0];
   const growingItems = itemPerformance.filter(i => i.growth > 0);
   const decliningItems = itemPerformance.filter(i => i.growth < 0);
 
@@ -1,4 +1,5 @@
 import { MonthlyPerformance } from '../types';
+import { resolveStoreId, selectStoreRows } from './storeRegistry';
 
 interface PerformanceData {
   매장코드: string;
@@ -13,6 +14,37 @@ interface PerformanceDataJson {
   total_rows: number;
 }
 
+// update_data_unified.py가 만든 매장 × 월 실적 큐브 (performance_cube.py)
+export interface PerformanceCube {
+  format: 'performance_cube';
+  current_year: number;
+  periods: string[]; // YYYYMM
+  store_ids: string[];
+  store_names: string[];
+  sales: number[][]; // 원, 매장 × periods
+  current: number[][]; // 만원, current_year 1~12월
+  last_year: number[][]; // 만원, 전년 1~12월
+  ytd: number[];
+  ytd_last_year: number[];
+  growth_rate: number[];
+  active_months: number[];
+}
+
+// 큐브별 매장ID/표준 매장명 -> 행 번호
+const cubeIndexes = new WeakMap<PerformanceCube, Map<string, number>>();
+
+const findCubeRow = (cube: PerformanceCube, storeName: string): number => {
+  let index = cubeIndexes.get(cube);
+  if (!index) {
+    index = new Map();
+    cube.store_names.forEach((name, row) => index!.set(name, row));
+    cube.store_ids.forEach((storeId, row) => index!.set(storeId, row));
+    cubeIndexes.set(cube, index);
+  }
+  const row = index.get(resolveStoreId(storeName) || storeName);
+  return row === undefined ? -1 : row;
+};
+
 // 매장명 매칭 함수 (매장정보의 매장명과 실적 데이터의 매장명 매칭)
 const matchStoreName = (storeName: string, performanceStoreName: string): boolean => {
   // 1. Exact match
@@ -45,7 +77,8 @@ const formatMonth = (salesPoint: string): string => {
 // 실적 데이터를 매장별로 그룹화하고 전년 대비 계산
 export const processPerformanceData = (
   performanceDataJson: PerformanceDataJson,
-  storeName: string
+  storeName: string,
+  performanceCube?: PerformanceCube | null
 ): {
   monthlyPerformance: MonthlyPerformance[];
   yearToDateRevenue: number; // 연누계 (실적이 있는 월 합계)
@@ -54,6 +87,26 @@ export const processPerformanceData = (
   currentYear: number; // 데이터 상의 최신 연도
   activeMonths: number; // 실적이 있는 개월 수 (올해 기준)
 } => {
+  // 큐브가 있으면 미리 계산된 매장 행 하나만 읽는다 (큐브에 없는 매장은 아래 전체 스캔으로)
+  const cubeRow = performanceCube ? findCubeRow(performanceCube, storeName) : -1;
+  if (performanceCube && cubeRow >= 0) {
+    const current = performanceCube.current[cubeRow];
+    const lastYear = performanceCube.last_year[cubeRow];
+    return {
+      monthlyPerformance: current.map((revenue, i) => ({
+        month: formatMonth(`${performanceCube.current_year}${String(i + 1).padStart(2, '0')}`),
+        revenue,
+        target: lastYear[i], // target을 전년 매출로 사용
+        growthRate: lastYear[i] > 0 ? ((revenue - lastYear[i]) / lastYear[i]) * 100 : 0
+      })),
+      yearToDateRevenue: performanceCube.ytd[cubeRow],
+      yearToDateLastYear: performanceCube.ytd_last_year[cubeRow],
+      growthRate: performanceCube.growth_rate[cubeRow],
+      currentYear: performanceCube.current_year,
+      activeMonths: performanceCube.active_months[cubeRow]
+    };
+  }
+
   // performance_data.json에서 실제 데이터 연도 추출 (가장 최신 연도 찾기)
   let currentYear = new Date().getFullYear();
   if (performanceDataJson.data && performanceDataJson.data.length > 0) {
@@ -71,7 +124,7 @@ export const processPerformanceData = (
   const currentMonth = new Date().getMonth() + 1; // 1~12
 
   // 해당 매장의 데이터만 필터링
-  const storeData = performanceDataJson.data.filter(item =>
+  const storeData = selectStoreRows(performanceDataJson.data, storeName, item =>
     matchStoreName(storeName, item.매장명)
   );
 
@@ -1,4 +1,5 @@
 import { StoreData } from '../types';
+import { resolveStoreId, selectStoreRows } from './storeRegistry';
 // Imports removed
 
 interface ItemSeasonData {
@@ -19,7 +20,62 @@ interface StoreInventoryData {
   시즌?: string;
 }
 
+type StoreInventorySummary = {
+  총재고수량: number;
+  총재고택가: number;
+  시즌별재고: { [season: string]: { 재고수량: number; 재고금액: number } };
+};
+
+// update_data_unified.py가 만든 유사 매장 이웃 테이블 (store_neighbors.py)
+export interface StoreNeighborTable {
+  format: 'store_neighbors';
+  current_year: number;
+  item_month: string | null;
+  bands: string[]; // 매출 구간 (예: '0.1', '0.2', '0.3')
+  top_k: number;
+  stores: {
+    [storeId: string]: {
+      name: string;
+      month?: string; // 기준 월 (YYYYMM, 올해 첫 실적 월)
+      revenue?: number; // 기준 월 매출 (만원)
+      bands?: { [band: string]: Array<{ id: string; revenue: number; diff: number }> };
+      features?: Array<{ id: string; distance: number }>;
+      summary?: {
+        latest_revenue: number;
+        item_sales: { [item: string]: number };
+        season_sales: { [season: string]: number };
+        inventory: StoreInventorySummary;
+      };
+    };
+  };
+}
+
+let neighborTable: StoreNeighborTable | null = null;
+
+// 이웃 테이블이 없는 이전 배포에서는 null (매번 전체 매장/행을 훑는다)
+export const setStoreNeighbors = (value: StoreNeighborTable | null) => {
+  neighborTable = value && value.format === 'store_neighbors' ? value : null;
+};
+
+const getNeighborEntry = (storeName: string) => {
+  const storeId = neighborTable ? resolveStoreId(storeName) : null;
+  return storeId ? neighborTable!.stores[storeId] || null : null;
+};
+
+// 이웃 테이블의 매장ID 목록 -> allStores의 StoreData (레지스트리로 매장명 -> 매장ID)
+const mapNeighborIds = (ids: string[], targetStore: StoreData, allStores: StoreData[]): StoreData[] => {
+  const byId = new Map<string, StoreData>();
+  allStores.forEach(store => {
+    const storeId = resolveStoreId(store.store.name);
+    if (storeId && !byId.has(storeId) && store.store.id !== targetStore.store.id) byId.set(storeId, store);
+  });
+  return ids.map(id => byId.get(id)).filter((store): store is StoreData => !!store);
+};
+
 const getLatestMonthRevenue = (storeName: string, itemSeasonData: any): number => {
+  const summary = getNeighborEntry(storeName)?.summary;
+  if (summary) return summary.latest_revenue;
+
   const data = itemSeasonData;
   if (!data || !data.data || data.data.length === 0) return 0;
 
@@ -30,7 +86,7 @@ const getLatestMonthRevenue = (storeName: string, itemSeasonData: any): number =
 
   if (!latestMonth) return 0;
 
-  const storeItems = data.data.filter((item: ItemSeasonData) => {
+  const storeItems = selectStoreRows(data.data, storeName, (item: ItemSeasonData) => {
     const itemStoreName = item.매장명 || '';
     const match = itemStoreName.match(/\(([^)]+)\)/);
     if (match) {
@@ -57,6 +113,13 @@ export const findSimilarStores = (
   itemSeasonData: any, // Kept for interface compatibility but use monthlyPerformance if available
   threshold: number = 0.2 // 20%
 ): StoreData[] => {
+  // 이웃 테이블에 같은 구간이 미리 계산되어 있으면 그대로 사용
+  const bands = getNeighborEntry(targetStore.store.name)?.bands;
+  const band = bands && bands[String(threshold)];
+  if (band) {
+    return mapNeighborIds(band.map(n => n.id), targetStore, allStores);
+  }
+
   // Use pre-calculated monthly performance instead of re-parsing itemSeasonData
   // because itemSeasonData might be missing the latest month (e.g. 202601)
   const latestMonthPerf = targetStore.monthlyPerformance.find(p => p.revenue > 0);
@@ -97,7 +160,18 @@ export const findSimilarStores = (
     .map(item => item.store);
 };
 
+/**
+ * 매출, PY, 등급, ITEM 구성비를 함께 본 거리로 가까운 매장 (이웃 테이블이 있을 때만, 없으면 빈 배열)
+ */
+export const findFeatureNeighbors = (targetStore: StoreData, allStores: StoreData[]): StoreData[] => {
+  const features = getNeighborEntry(targetStore.store.name)?.features;
+  return features ? mapNeighborIds(features.map(n => n.id), targetStore, allStores) : [];
+};
+
 export const getStoreItemSales = (storeName: string, itemSeasonData: any): { [item: string]: number } => {
+  const summary = getNeighborEntry(storeName)?.summary;
+  if (summary) return { ...summary.item_sales };
+
   const data = itemSeasonData;
   if (!data || !data.data || data.data.length === 0) return {};
 
@@ -107,7 +181,7 @@ export const getStoreItemSales = (storeName: string, itemSeasonData: any): { [it
 
   if (!latestMonth) return {};
 
-  const storeItems = data.data.filter((item: ItemSeasonData) => {
+  const storeItems = selectStoreRows(data.data, storeName, (item: ItemSeasonData) => {
     const itemStoreName = item.매장명 || '';
     const match = itemStoreName.match(/\(([^)]+)\)/);
     if (match) {
@@ -132,6 +206,9 @@ export const getStoreItemSales = (storeName: string, itemSeasonData: any): { [it
 };
 
 export const getStoreSeasonSales = (storeName: string, itemSeasonData: any): { [season: string]: number } => {
+  const summary = getNeighborEntry(storeName)?.summary;
+  if (summary) return { ...summary.season_sales };
+
   const data = itemSeasonData;
   if (!data || !data.data || data.data.length === 0) return {};
 
@@ -141,7 +218,7 @@ export const getStoreSeasonSales = (storeName: string, itemSeasonData: any): { [
 
   if (!latestMonth) return {};
 
-  const storeItems = data.data.filter((item: ItemSeasonData) => {
+  const storeItems = selectStoreRows(data.data, storeName, (item: ItemSeasonData) => {
     const itemStoreName = item.매장명 || '';
     const match = itemStoreName.match(/\(([^)]+)\)/);
     if (match) {
@@ -181,17 +258,21 @@ export const getTop3SeasonsBySales = (storeName: string, itemSeasonData: any): s
 /**
  * 매장의 재고 데이터 추출
  */
-export const getStoreInventory = (storeName: string, inventoryData: any): {
-  총재고수량: number;
-  총재고택가: number;
-  시즌별재고: { [season: string]: { 재고수량: number; 재고금액: number } };
-} => {
+export const getStoreInventory = (storeName: string, inventoryData: any): StoreInventorySummary => {
+  const summary = getNeighborEntry(storeName)?.summary;
+  if (summary) {
+    const { 총재고수량, 총재고택가, 시즌별재고 } = summary.inventory;
+    const seasons: StoreInventorySummary['시즌별재고'] = {};
+    Object.entries(시즌별재고).forEach(([season, value]) => { seasons[season] = { ...value }; });
+    return { 총재고수량, 총재고택가, 시즌별재고: seasons };
+  }
+
   const data = inventoryData;
   if (!data || !data.data) {
     return { 총재고수량: 0, 총재고택가: 0, 시즌별재고: {} };
   }
 
-  const storeInventories = data.data.filter((item: StoreInventoryData) => {
+  const storeInventories = selectStoreRows(data.data, storeName, (item: StoreInventoryData) => {
     const itemStoreName = item.매장명 || '';
     const match = itemStoreName.match(/\(([^)]+)\)/);
     if (match) {
@@ -1,5 +1,6 @@
 import { StoreData, Store, Manager, MonthlyPerformance, ItemPerformance } from '../types';
-import { processPerformanceData } from './performanceConverter';
+import { PerformanceCube, processPerformanceData } from './performanceConverter';
+import { selectStoreRows } from './storeRegistry';
 // Import removed
 
 // JSON 파일을 동적으로 import하기 위한 타입
@@ -30,7 +31,8 @@ const koreanSort = (a: string, b: string): number => {
 export const convertExcelDataToStoreData = (
   storeDataJson: StoreDataJson,
   performanceDataJson?: any,
-  itemSeasonDataJson?: any // Added
+  itemSeasonDataJson?: any, // Added
+  performanceCube?: PerformanceCube | null
 ): StoreData[] => {
   const excelData = storeDataJson.data;
 
@@ -85,7 +87,7 @@ export const convertExcelDataToStoreData = (
     let performance: any = null;
 
     if (performanceDataJson) {
-      performance = processPerformanceData(performanceDataJson, item.매장명);
+      performance = processPerformanceData(performanceDataJson, item.매장명, performanceCube);
       monthlyPerformance = performance.monthlyPerformance;
       yearToDateRevenue = performance.yearToDateRevenue;
       yearToDateLastYear = performance.yearToDateLastYear;
@@ -112,7 +114,7 @@ export const convertExcelDataToStoreData = (
 
       const currentStoreName = item.매장명; // 현재 처리 중인 매장명 (예: "롯데본점")
 
-      const storeItems = seasonData.data.filter((seasonItem: any) => {
+      const storeItems = selectStoreRows(seasonData.data, currentStoreName, (seasonItem: any) => {
         const itemStoreName = seasonItem.매장명 || '';
 
         // 1. Exact match
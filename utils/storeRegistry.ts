@@ -0,0 +1,58 @@
+/**
+ * 매장 레지스트리 (public/data/store_registry.json, store_registry.py에서 생성)
+ *
+ * 내보낸 행에는 표준 매장ID('매장ID')가 붙어 있으므로, 매장명 -> 매장ID를 한 번 찾고
+ * 매장ID 색인으로 바로 조인한다. 레지스트리나 매장ID 열이 없는 이전 데이터는
+ * 기존 매장명 매칭 함수로 전체 행을 훑는다.
+ */
+
+export interface StoreRegistry {
+  stores: { [storeId: string]: { name: string; closed: boolean } };
+  aliases: { [rawName: string]: string };
+  competitor_aliases: { [rawName: string]: string };
+}
+
+export const STORE_ID_KEY = '매장ID';
+
+let registry: StoreRegistry | null = null;
+
+// 데이터셋(행 배열)별 매장ID -> 행 목록 색인. 배열이 바뀌면(새로 로드되면) 다시 만든다
+const storeIndexes = new WeakMap<object[], Map<string, any[]>>();
+
+export const setStoreRegistry = (value: StoreRegistry | null) => {
+  registry = value && value.aliases ? value : null;
+};
+
+export const resolveStoreId = (storeName: string): string | null =>
+  (registry && storeName && registry.aliases[storeName.trim()]) || null;
+
+const getStoreIndex = (rows: any[]): Map<string, any[]> => {
+  let index = storeIndexes.get(rows);
+  if (!index) {
+    index = new Map();
+    for (const row of rows) {
+      const storeId = row[STORE_ID_KEY];
+      if (!storeId) continue;
+      const bucket = index.get(storeId);
+      if (bucket) {
+        bucket.push(row);
+      } else {
+        index.set(storeId, [row]);
+      }
+    }
+    storeIndexes.set(rows, index);
+  }
+  return index;
+};
+
+/**
+ * storeName 매장의 행만 반환.
+ * 레지스트리에 있는 매장이고 행에 매장ID가 있으면 색인 조회, 아니면 legacyMatch로 필터링한다.
+ */
+export const selectStoreRows = <T,>(rows: T[], storeName: string, legacyMatch: (row: T) => boolean): T[] => {
+  const storeId = resolveStoreId(storeName);
+  if (storeId && rows.length > 0 && (rows[0] as any)[STORE_ID_KEY] !== undefined) {
+    return (getStoreIndex(rows).get(storeId) || []) as T[];
+  }
+  return rows.filter(legacyMatch);
+};
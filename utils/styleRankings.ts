@@ -0,0 +1,54 @@
+import { resolveStoreId } from './storeRegistry';
+
+/**
+ * 매장별 베스트 스타일 순위 (public/data/style_rankings.json, style_rankings.py에서 생성)
+ *
+ * 매장 × 기간('all' = 내보낸 일자 범위 전체, 'YYYY-MM' = 월)마다 상위 N개 품번이 들어 있다.
+ * 순위가 없는 이전 배포에서는 null이므로 호출 측이 스타일판매 행을 직접 집계한다.
+ */
+
+export interface StyleRankingItem {
+  품번: string;
+  제품명: string;
+  판매수량: number;
+  판매금액: number;
+}
+
+export interface StyleRankingLists {
+  sales: StyleRankingItem[]; // 판매액합계 순
+  quantity: StyleRankingItem[]; // 판매수량합계 순
+  gross_sales: StyleRankingItem[]; // 판매액이 양수인 행만 합산한 순
+}
+
+export interface StyleRankings {
+  format: 'style_rankings';
+  top_n: number;
+  periods: string[];
+  stores: { [storeId: string]: { name: string; periods: { [period: string]: StyleRankingLists } } };
+}
+
+// 순위 파일별 표준 매장명 -> 매장ID
+const nameIndexes = new WeakMap<StyleRankings, Map<string, string>>();
+
+/** storeName 매장의 period 순위. 순위 파일이 없거나 매장을 찾지 못하면 null */
+export const findStyleRanking = (
+  rankings: StyleRankings | null,
+  storeName: string,
+  period: string = 'all'
+): StyleRankingLists | null => {
+  if (!rankings || !storeName) return null;
+  let storeId = resolveStoreId(storeName);
+  if (!storeId || !rankings.stores[storeId]) {
+    let index = nameIndexes.get(rankings);
+    if (!index) {
+      index = new Map();
+      for (const [id, entry] of Object.entries(rankings.stores)) {
+        index.set(entry.name, id);
+      }
+      nameIndexes.set(rankings, index);
+    }
+    storeId = index.get(storeName) || null;
+  }
+  const entry = storeId ? rankings.stores[storeId] : undefined;
+  return (entry && entry.periods[period]) || null;
+};
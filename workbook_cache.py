@@ -0,0 +1,460 @@
+# -*- coding: utf-8 -*-
+"""
+워크북 파싱 캐시: backdata.xlsx의 시트를 한 번만 파싱해 열 단위 바이너리 파일로 저장하고,
+같은 워크북을 다시 열 때는 파일을 mmap해서 바로 읽는다.
+
+check_*/debug_*/read_* 스크립트는 실행할 때마다 openpyxl로 워크북 전체를 다시 파싱했다.
+이 모듈의 load_workbook()은 openpyxl.load_workbook() 자리에 그대로 쓸 수 있고
+(sheetnames, wb[시트명], sheet.cell(), sheet[행], iter_rows(), max_row/max_column),
+두 번째 실행부터는 파싱 없이 필요한 칸만 읽는다.
+
+캐시 위치: .cache/workbook/<워크북 sha256 앞 16자리>-<values|formulas>/
+- manifest.json: 원본 정보와 시트 목록 (마지막에 쓰므로 있으면 캐시가 완성된 것)
+- <순번>.wbc: 시트 하나. [헤더 JSON][열 우선 타입 태그 uint8][열 우선 값 8바이트][문자열 오프셋][UTF-8 문자열]
+  값 8바이트는 태그에 따라 int64(정수/일시/문자열 번호) 또는 float64로 읽는다.
+- index.json: 워크북 경로 -> (크기, 수정시각, sha256). 크기/수정시각이 같으면 해시를 다시 계산하지 않는다.
+
+numpy 없이 표준 라이브러리(mmap, memoryview)만 쓴다.
+"""
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+from array import array
+from datetime import date, datetime, time, timedelta
+
+CACHE_DIR = os.path.join('.cache', 'workbook')
+INDEX_FILENAME = 'index.json'
+MANIFEST_FILENAME = 'manifest.json'
+MAGIC = b'WBCACHE1'
+FORMAT_VERSION = 1
+
+# 칸 타입 태그
+NONE, INT, FLOAT, STR, BOOL, DATETIME, DATE, TIME, TIMEDELTA, BIGINT, OTHER = range(11)
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+def _mode(data_only):
+    return 'values' if data_only else 'formulas'
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class _Index:
+    """워크북 경로 -> {'size', 'mtime_ns', 'sha256'}"""
+
+    def __init__(self, cache_dir):
+        self.path = os.path.join(cache_dir, INDEX_FILENAME)
+        self.entries = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def digest(self, file_path):
+        """워크북 내용 해시. 크기/수정시각이 지난번과 같으면 기록된 값을 쓴다."""
+        st = os.stat(file_path)
+        key = os.path.abspath(file_path)
+        entry = self.entries.get(key)
+        if entry and entry.get('size') == st.st_size and entry.get('mtime_ns') == st.st_mtime_ns:
+            return entry['sha256']
+        sha256 = file_sha256(file_path)
+        self.entries[key] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'sha256': sha256}
+        self.save()
+        return sha256
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+# ---------------------------------------------------------------- 쓰기
+
+class _SheetEncoder:
+    """openpyxl 행을 받아 열마다 태그/값 배열에 쌓는다. 문자열은 시트 안에서 중복 없이 번호를 매긴다."""
+
+    def __init__(self):
+        self.rows = 0
+        self.tags = []      # 열마다 array('B')
+        self.payloads = []  # 열마다 array('q')
+        self.strings = {}
+
+    def _string(self, text):
+        index = self.strings.get(text)
+        if index is None:
+            index = self.strings[text] = len(self.strings)
+        return index
+
+    def _encode(self, value):
+        if value is None:
+            return NONE, 0
+        if isinstance(value, bool):
+            return BOOL, int(value)
+        if isinstance(value, int):
+            if INT64_MIN <= value <= INT64_MAX:
+                return INT, value
+            return BIGINT, self._string(str(value))
+        if isinstance(value, float):
+            return FLOAT, struct.unpack('<q', struct.pack('<d', value))[0]
+        if isinstance(value, str):
+            return STR, self._string(value)
+        if isinstance(value, datetime) and value.tzinfo is None:
+            return DATETIME, (value - EPOCH) // MICROSECOND
+        if isinstance(value, date) and not isinstance(value, datetime):
+            return DATE, value.toordinal()
+        if isinstance(value, time) and value.tzinfo is None:
+            return TIME, ((value.hour * 60 + value.minute) * 60 + value.second) * 1000000 + value.microsecond
+        if isinstance(value, timedelta):
+            return TIMEDELTA, value // MICROSECOND
+        # 수식 객체 등은 문자열로 남긴다
+        return OTHER, self._string(str(value))
+
+    def add_row(self, row):
+        width = len(row)
+        while len(self.tags) < width:
+            # 뒤늦게 나타난 열은 앞선 행을 빈 칸으로 채운다
+            self.tags.append(array('B', bytes(self.rows)))
+            self.payloads.append(array('q', bytes(8 * self.rows)))
+        for col in range(len(self.tags)):
+            tag, payload = self._encode(row[col]) if col < width else (NONE, 0)
+            self.tags[col].append(tag)
+            self.payloads[col].append(payload)
+        self.rows += 1
+
+    def write(self, path, title):
+        rows, cols = self.rows, len(self.tags)
+        strings = [s.encode('utf-8', 'surrogatepass') for s in self.strings]
+        offsets = array('q', [0])
+        for encoded in strings:
+            offsets.append(offsets[-1] + len(encoded))
+        if sys.byteorder != 'little':
+            for column in self.payloads:
+                column.byteswap()
+            offsets.byteswap()
+
+        header = {'version': FORMAT_VERSION, 'title': title, 'rows': rows, 'cols': cols, 'strings': len(strings)}
+        header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+        body_start = _align(len(MAGIC) + 8 + len(header_bytes))
+        with open(path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<q', len(header_bytes)))
+            f.write(header_bytes)
+            f.write(b'\0' * (body_start - f.tell()))
+            for column in self.tags:
+                f.write(column.tobytes())
+            f.write(b'\0' * (_align(f.tell()) - f.tell()))
+            for column in self.payloads:
+                f.write(column.tobytes())
+            f.write(offsets.tobytes())
+            f.write(b''.join(strings))
+        return rows, cols
+
+
+def build_cache(file_path, data_only=True, cache_dir=CACHE_DIR, sha256=None):
+    """워크북 전체를 openpyxl(read-only)로 한 번 파싱해 캐시 디렉터리를 만든다. -> 캐시 디렉터리 경로"""
+    import openpyxl
+
+    sha256 = sha256 or _Index(cache_dir).digest(file_path)
+    target = os.path.join(cache_dir, f'{sha256[:16]}-{_mode(data_only)}')
+    staging = f'{target}.{os.getpid()}.tmp'
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+
+    sheets = []
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=data_only)
+    try:
+        for number, name in enumerate(wb.sheetnames):
+            encoder = _SheetEncoder()
+            for row in wb[name].iter_rows(values_only=True):
+                encoder.add_row(row)
+            filename = f'{number}.wbc'
+            rows, cols = encoder.write(os.path.join(staging, filename), name)
+            sheets.append({'name': name, 'file': filename, 'rows': rows, 'cols': cols})
+    finally:
+        wb.close()
+
+    st = os.stat(file_path)
+    manifest = {'format': 'workbook_cache', 'version': FORMAT_VERSION, 'data_only': data_only,
+                'source': {'path': os.path.abspath(file_path), 'size': st.st_size, 'mtime_ns': st.st_mtime_ns,
+                           'sha256': sha256},
+                'sheets': sheets}
+    with open(os.path.join(staging, MANIFEST_FILENAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    if os.path.exists(target):
+        # 다른 프로세스가 먼저 만들었다
+        shutil.rmtree(staging, ignore_errors=True)
+    else:
+        try:
+            os.replace(staging, target)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+    _prune(cache_dir, os.path.abspath(file_path), sha256)
+    return target
+
+
+def _prune(cache_dir, source_path, sha256):
+    """같은 경로의 이전 버전 워크북 캐시를 지운다."""
+    for entry in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, entry)
+        manifest_path = os.path.join(path, MANIFEST_FILENAME)
+        if entry.startswith(sha256[:16]) or not os.path.isfile(manifest_path):
+            continue
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                source = json.load(f).get('source', {})
+        except (OSError, ValueError):
+            continue
+        if source.get('path') == source_path:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+# ---------------------------------------------------------------- 읽기
+
+class CachedCell:
+    __slots__ = ('row', 'column', 'value')
+
+    def __init__(self, row, column, value):
+        self.row = row
+        self.column = column
+        self.value = value
+
+    def __repr__(self):
+        return f'<CachedCell {self.row},{self.column} {self.value!r}>'
+
+
+class CachedSheet:
+    """openpyxl Worksheet 중 읽기 API만 흉내 낸다. 행/열 번호는 1부터."""
+
+    def __init__(self, path, title, rows, cols):
+        self.title = title
+        self.max_row = rows
+        self.max_column = cols
+        self.min_row = self.min_column = 1
+        self._path = path
+        self._view = None
+
+    def _open(self):
+        with open(self._path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        header_length = struct.unpack_from('<q', view, len(MAGIC))[0]
+        header = json.loads(bytes(view[len(MAGIC) + 8:len(MAGIC) + 8 + header_length]).decode('utf-8'))
+        cells = header['rows'] * header['cols']
+        tags_start = _align(len(MAGIC) + 8 + header_length)
+        payload_start = _align(tags_start + cells)
+        offsets_start = payload_start + 8 * cells
+        self._blob_start = offsets_start + 8 * (header['strings'] + 1)
+        self._tags = view[tags_start:tags_start + cells]
+        payload = view[payload_start:offsets_start]
+        self._ints = payload.cast('q')
+        self._floats = payload.cast('d')
+        self._offsets = view[offsets_start:self._blob_start].cast('q')
+        self._blob = view
+        self._strings = [None] * header['strings']
+        self._view = view
+
+    def _string(self, index):
+        text = self._strings[index]
+        if text is None:
+            start = self._blob_start + self._offsets[index]
+            end = self._blob_start + self._offsets[index + 1]
+            text = self._strings[index] = bytes(self._blob[start:end]).decode('utf-8', 'surrogatepass')
+        return text
+
+    def _value(self, row, col):
+        """0부터 시작하는 행/열 번호의 값"""
+        index = col * self.max_row + row
+        tag = self._tags[index]
+        if tag == NONE:
+            return None
+        if tag == STR:
+            return self._string(self._ints[index])
+        if tag == INT:
+            return self._ints[index]
+        if tag == FLOAT:
+            return self._floats[index]
+        if tag == DATETIME:
+            return EPOCH + self._ints[index] * MICROSECOND
+        if tag == BOOL:
+            return bool(self._ints[index])
+        if tag == DATE:
+            return date.fromordinal(self._ints[index])
+        if tag == TIME:
+            micros = self._ints[index]
+            seconds, micros = divmod(micros, 1000000)
+            minutes, seconds = divmod(seconds, 60)
+            hours, minutes = divmod(minutes, 60)
+            return time(hours, minutes, seconds, micros)
+        if tag == TIMEDELTA:
+            return self._ints[index] * MICROSECOND
+        if tag == BIGINT:
+            return int(self._string(self._ints[index]))
+        return self._string(self._ints[index])
+
+    def cell(self, row, column):
+        if self._view is None:
+            self._open()
+        value = None
+        if 1 <= row <= self.max_row and 1 <= column <= self.max_column:
+            value = self._value(row - 1, column - 1)
+        return CachedCell(row, column, value)
+
+    def iter_rows(self, min_row=None, max_row=None, min_col=None, max_col=None, values_only=False):
+        if self._view is None:
+            self._open()
+        min_row = min_row or 1
+        max_row = min(max_row or self.max_row, self.max_row)
+        min_col = min_col or 1
+        max_col = max_col or self.max_column
+        columns = range(min_col - 1, max_col)
+        in_range = self.max_column
+        for r in range(min_row - 1, max_row):
+            values = tuple(self._value(r, c) if c < in_range else None for c in columns)
+            if values_only:
+                yield values
+            else:
+                yield tuple(CachedCell(r + 1, c + 1, value) for c, value in zip(columns, values))
+
+    @property
+    def rows(self):
+        return self.iter_rows()
+
+    @property
+    def values(self):
+        return self.iter_rows(values_only=True)
+
+    def __getitem__(self, row):
+        """sheet[행번호] -> 그 행의 칸 튜플 (열 문자 좌표는 지원하지 않는다)"""
+        if not isinstance(row, int):
+            raise TypeError('CachedSheet only supports integer row access, e.g. sheet[1]')
+        return next(self.iter_rows(min_row=row, max_row=row), ())
+
+    def __iter__(self):
+        return self.iter_rows()
+
+    def close(self):
+        if self._view is not None:
+            for view in (self._tags, self._ints, self._floats, self._offsets, self._blob):
+                view.release()
+            self._view = None
+            self._mmap.close()
+
+    def __repr__(self):
+        return f'<CachedSheet "{self.title}">'
+
+
+class CachedWorkbook:
+    """openpyxl Workbook 중 읽기 API만 흉내 낸다. 시트 파일은 처음 접근할 때 mmap한다."""
+
+    def __init__(self, cache_path, manifest):
+        self.path = cache_path
+        self.source = manifest['source']
+        self._sheets = {entry['name']: CachedSheet(os.path.join(cache_path, entry['file']), entry['name'],
+                                                   entry['rows'], entry['cols'])
+                        for entry in manifest['sheets']}
+
+    @property
+    def sheetnames(self):
+        return list(self._sheets)
+
+    @property
+    def worksheets(self):
+        return list(self._sheets.values())
+
+    @property
+    def active(self):
+        return next(iter(self._sheets.values()), None)
+
+    def __getitem__(self, name):
+        if name not in self._sheets:
+            raise KeyError(f'Worksheet {name} does not exist.')
+        return self._sheets[name]
+
+    def __contains__(self, name):
+        return name in self._sheets
+
+    def __iter__(self):
+        return iter(self._sheets.values())
+
+    def close(self):
+        for sheet in self._sheets.values():
+            sheet.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _read_manifest(cache_path):
+    try:
+        with open(os.path.join(cache_path, MANIFEST_FILENAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('format') != 'workbook_cache' or manifest.get('version') != FORMAT_VERSION:
+        return None
+    return manifest
+
+
+def open_cached(file_path, data_only=True, cache_dir=CACHE_DIR):
+    """캐시가 있으면 CachedWorkbook, 없으면 None (파싱하지 않는다)"""
+    sha256 = _Index(cache_dir).digest(file_path)
+    cache_path = os.path.join(cache_dir, f'{sha256[:16]}-{_mode(data_only)}')
+    manifest = _read_manifest(cache_path)
+    if manifest is None or manifest['source'].get('sha256') != sha256:
+        return None
+    return CachedWorkbook(cache_path, manifest)
+
+
+def load_workbook(filename, data_only=False, cache_dir=CACHE_DIR, **kwargs):
+    """openpyxl.load_workbook 대신 쓰는 읽기 전용 로더. 캐시가 없으면 한 번 파싱해서 만든다.
+
+    read_only, keep_vba 등 openpyxl 옵션은 무시한다 (결과는 항상 읽기 전용).
+    data_only 기본값은 openpyxl과 같이 False(수식 문자열)다.
+    """
+    cached = open_cached(filename, data_only, cache_dir)
+    if cached is None:
+        build_cache(filename, data_only, cache_dir)
+        cached = open_cached(filename, data_only, cache_dir)
+    return cached
+
+
+if __name__ == '__main__':
+    import argparse
+    from time import perf_counter
+
+    parser = argparse.ArgumentParser(description='워크북 파싱 캐시를 미리 만든다')
+    parser.add_argument('excel_file', nargs='?', default='backdata.xlsx')
+    parser.add_argument('--formulas', action='store_true', help='계산값 대신 수식 문자열 캐시 (data_only=False)')
+    args = parser.parse_args()
+
+    started = perf_counter()
+    wb = load_workbook(args.excel_file, data_only=not args.formulas)
+    print(f'{args.excel_file} -> {wb.path} ({perf_counter() - started:.2f}s)')
+    for sheet in wb.worksheets:
+        print(f'  {sheet.title}: {sheet.max_row} rows x {sheet.max_column} cols')
+    wb.close()
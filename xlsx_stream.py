@@ -0,0 +1,673 @@
+# -*- coding: utf-8 -*-
+"""
+xlsx(zip) 파일을 openpyxl 없이 직접 읽는 저수준 헬퍼.
+시트 XML / sharedStrings / styles 를 zip 안에서 바로 스트리밍 파싱한다.
+
+open_workbook()은 openpyxl read-only + data_only 워크북 대신 쓸 수 있는 값 전용 리더다
+(sheetnames, wb[시트명], iter_rows(values_only=True), max_row/max_column).
+openpyxl은 read-only 모드에서도 칸마다 dict와 좌표 파싱을 거치지만, 여기서는 <row> 요소가 끝날 때마다
+칸 값만 꺼내 튜플로 돌려준다. 값 해석은 openpyxl과 같다:
+  - t="s" 공유 문자열, t="inlineStr" 인라인 문자열, t="b" bool, t="str"/"e" 문자열 그대로
+  - 숫자는 '.', 'e', 'E'가 있으면 float, 아니면 int. 날짜/시간 서식 칸은 Excel 일련번호 -> datetime/time/timedelta
+    (1904 날짜 체계 워크북 포함)
+  - 행 너비는 <dimension> 기준, 중간에 빠진 행은 빈 행으로 채운다
+수식 문자열(data_only=False)과 칸 객체(values_only=False)는 지원하지 않는다.
+"""
+import codecs
+import hashlib
+import html
+import posixpath
+import re
+import warnings
+import zipfile
+import xml.etree.ElementTree as ET
+from datetime import date, datetime, time, timedelta
+
+CHUNK_SIZE = 1 << 20
+
+SHEET_MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_ROW_TAG = f'{{{SHEET_MAIN_NS}}}row'
+_CELL_VALUE_TAG = f'{{{SHEET_MAIN_NS}}}v'
+_INLINE_STRING_TAG = f'{{{SHEET_MAIN_NS}}}is'
+_DIMENSION_TAG = f'{{{SHEET_MAIN_NS}}}dimension'
+_SHEET_DATA_TAG = f'{{{SHEET_MAIN_NS}}}sheetData'
+
+WINDOWS_EPOCH = datetime(1899, 12, 30)
+MAC_EPOCH = datetime(1904, 1, 1)
+SECONDS_PER_DAY = 86400
+
+# openpyxl이 아는 기본 서식 중 날짜/시간 서식 (numFmtId -> 서식 코드). 나머지 기본 서식은 숫자다
+BUILTIN_DATE_FORMATS = {
+    14: 'mm-dd-yy', 15: 'd-mmm-yy', 16: 'd-mmm', 17: 'mmm-yy', 18: 'h:mm AM/PM', 19: 'h:mm:ss AM/PM',
+    20: 'h:mm', 21: 'h:mm:ss', 22: 'm/d/yy h:mm', 45: 'mm:ss', 46: '[h]:mm:ss', 47: 'mmss.0',
+}
+# 서식 코드 판별 (openpyxl.styles.numbers와 같은 규칙): 따옴표 리터럴과 [색/로캘]을 뺀 첫 구간에 d/m/h/y/s가 있으면 날짜
+_FORMAT_STRIP_RE = re.compile(r'".*?"|\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]')
+_DATE_FORMAT_RE = re.compile(r'(?<![_\\])[dmhysDMHYS]')
+_TIMEDELTA_FORMAT_RE = re.compile(r'\[hh?\](:mm(:ss(\.0*)?)?)?|\[mm?\](:ss(\.0*)?)?|\[ss?\](\.0*)?', re.I)
+
+# sheetData 토큰 (빠른 경로). 한 번의 findall로 행 시작 / Excel이 쓰는 모양의 칸 / 그 밖의 칸을 차례로 꺼낸다.
+#   행:        ('<row', r 속성, 나머지 속성, '/' 또는 '', ...)
+#   표준 칸:   (.., 열 문자, 행 번호, s, t, v 본문, ..)   <c r="A1" s="1" t="s"><f>..</f><v>..</v></c> 또는 <c r="A1" s="1"/>
+#   일반 칸:   (.., '<c', 속성, 본문)                     속성 순서/따옴표가 다르거나 인라인 문자열 등
+_SHEET_TOKEN_RE = re.compile(
+    r'(<row)(?=[\s/>])(?: r="(\d+)")?([^>]*?)(/?)>'
+    r'|<c r="([A-Z]{1,3})(\d+)"(?: s="(\d+)")?(?: t="([a-zA-Z]+)")?'
+    r'(?:/>|>(?:<f>[^<]*</f>|<f\s[^>]*?/>|<f\s[^>]*>[^<]*</f>)?(?:<v>([^<]*)</v>)?</c>)'
+    r'|(<c)\b([^>]*?)(?:/>|>(.*?)</c>)',
+    re.S)
+_ATTR_RE = re.compile(r'([\w:]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+_VALUE_RE = re.compile(r'<v\b[^>]*?(?:/>|>(.*?)</v>)', re.S)
+_INLINE_RE = re.compile(r'<is\b.*?</is>|<is\b[^>]*/>', re.S)
+_SHEET_DATA_START_RE = re.compile(r'<(\w+:)?sheetData\b[^>]*?(/?)>')
+_XML_ENCODING_RE = re.compile(r'^<\?xml[^>]*encoding=["\']([^"\']+)')
+# 빠른 경로가 해석하지 않는 구성 (나오면 ElementTree 경로로 넘긴다)
+_UNSUPPORTED_MARKUP = ('<!--', '<![CDATA[', '<?')
+
+
+def _local(tag):
+    """'{namespace}c' -> 'c' (transitional/strict 네임스페이스 모두 처리)"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _attr(elem, name):
+    """네임스페이스가 붙은 속성(r:id 등)도 로컬 이름으로 찾는다."""
+    value = elem.get(name)
+    if value is not None:
+        return value
+    for key, value in elem.attrib.items():
+        if _local(key) == name:
+            return value
+    return None
+
+
+def sheet_paths(zf):
+    """시트명 -> zip 내부 시트 XML 경로 (워크북에 정의된 순서대로)"""
+    rels = {}
+    with zf.open('xl/_rels/workbook.xml.rels') as f:
+        for rel in ET.parse(f).getroot():
+            target = rel.get('Target', '')
+            if target.startswith('/'):
+                path = target.lstrip('/')
+            else:
+                path = posixpath.normpath(posixpath.join('xl', target))
+            rels[rel.get('Id')] = path
+
+    paths = {}
+    with zf.open('xl/workbook.xml') as f:
+        for elem in ET.parse(f).getroot().iter():
+            if _local(elem.tag) == 'sheet':
+                rel_path = rels.get(_attr(elem, 'id'))
+                if rel_path:
+                    paths[elem.get('name')] = rel_path
+    return paths
+
+
+def read_shared_strings(zf):
+    """sharedStrings.xml -> 문자열 리스트. 서식(run)이 섞인 문자열은 이어 붙이고 발음(rPh)은 제외."""
+    if 'xl/sharedStrings.xml' not in zf.namelist():
+        return []
+    strings = []
+    with zf.open('xl/sharedStrings.xml') as f:
+        for _, elem in ET.iterparse(f, events=('end',)):
+            if _local(elem.tag) != 'si':
+                continue
+            parts = []
+            for child in elem:
+                tag = _local(child.tag)
+                if tag == 't':
+                    parts.append(child.text or '')
+                elif tag == 'r':
+                    for t in child:
+                        if _local(t.tag) == 't':
+                            parts.append(t.text or '')
+            strings.append(''.join(parts))
+            elem.clear()
+    return strings
+
+
+def read_cell_formats(zf):
+    """styles.xml cellXfs 인덱스 -> (numFmtId, 서식 코드 또는 None)"""
+    if 'xl/styles.xml' not in zf.namelist():
+        return []
+    with zf.open('xl/styles.xml') as f:
+        root = ET.parse(f).getroot()
+    custom = {}
+    formats = []
+    for section in root:
+        tag = _local(section.tag)
+        if tag == 'numFmts':
+            for fmt in section:
+                custom[int(fmt.get('numFmtId'))] = fmt.get('formatCode')
+        elif tag == 'cellXfs':
+            for xf in section:
+                fmt_id = int(xf.get('numFmtId', 0))
+                formats.append((fmt_id, custom.get(fmt_id)))
+    return formats
+
+
+# 지문용 바이트 패턴 (리터럴로 시작해야 빠르다). Excel이 쓰는 모양의 공유 문자열 칸 값, 스타일 번호, <si> 항목
+_SHARED_REF_RE = re.compile(rb't="s"><v>(\d+)</v>')
+_STYLE_REF_RE = re.compile(rb' s="(\d+)"')
+_SHARED_ENTRY_RE = re.compile(rb'<si\b[^>]*?(?:/>|>(.*?)</si>)', re.S)
+
+
+def _read_member(zf, name):
+    if name not in zf.namelist():
+        return b''
+    with zf.open(name) as f:
+        return f.read()
+
+
+def _raw_digest(zf, path, entries, cell_formats, shared_digest):
+    """시트 XML 바이트 해시. 공유 문자열 번호 대신 그 번호가 가리키는 <si> 항목을, 칸 스타일은 그 서식을 넣는다.
+    다른 시트에 문자열이 추가되어 번호가 밀리거나 sharedStrings/styles가 바뀌어도 이 시트가 쓰는 값이 같으면
+    같은 해시가 나온다. 번호를 다 해석하지 못하면(특이한 마크업) sharedStrings 전체 해시를 대신 넣는다."""
+    h = hashlib.sha256()
+    styles = set()  # 칸 스타일 번호 (행 스타일도 섞이지만 더 보수적일 뿐이다)
+    complete = True
+    tail = b''
+    with zf.open(path) as f:
+        while True:
+            block = f.read(CHUNK_SIZE)
+            buffer = tail + block
+            if block:
+                cut = buffer.rfind(b'</row>')
+                if cut < 0:
+                    tail = buffer
+                    continue
+                cut += len(b'</row>')
+                text, tail = buffer[:cut], buffer[cut:]
+            else:
+                text, tail = buffer, b''
+            # [칸 사이 XML, 번호, 칸 사이 XML, 번호, ...] -> 번호 자리에 <si> 항목을 넣어 해시
+            parts = _SHARED_REF_RE.split(text)
+            refs = parts[1::2]
+            if len(refs) != text.count(b't="s"'):
+                complete = False  # 속성 순서 등이 다른 공유 문자열 칸
+            try:
+                resolved = {index: b'\x1f' + entries[int(index)] + b'\x1f' for index in set(refs)}
+            except IndexError:
+                complete, resolved = False, {index: b'\x1f' + index + b'\x1f' for index in set(refs)}
+            parts[1::2] = map(resolved.__getitem__, refs)
+            h.update(b''.join(parts))
+            styles.update(_STYLE_REF_RE.findall(text))
+            if not block:
+                break
+    h.update(b'\x1e')
+    for style in sorted(int(style) for style in styles):
+        fmt = cell_formats[style] if style < len(cell_formats) else None
+        h.update(f'{style}\x1f{fmt}\x1e'.encode('utf-8'))
+    if not complete:
+        h.update(shared_digest)
+    return h.hexdigest()
+
+
+def _content_digest(workbook, name):
+    """셀 값을 실제 문자열/날짜로 풀어서 해시한다 (빠른 스트리밍 리더로 읽는다).
+    추출기가 보는 값 그대로이므로 XML 표현만 달라진 경우에는 같은 값이 나온다."""
+    h = hashlib.sha256()
+    for row in workbook[name].iter_rows(values_only=True):
+        h.update(repr(row).encode('utf-8'))
+        h.update(b'\x1e')
+    return h.hexdigest()
+
+
+def sheet_fingerprints(file_path, known=None):
+    """시트별 내용 지문을 계산한다.
+
+    Returns: {시트명: {'raw': 원본 XML 해시, 'content': 셀 내용 해시}}
+
+    'raw'는 시트 XML 바이트와 그 시트가 참조하는 공유 문자열/서식만으로 만든 해시라 (_raw_digest)
+    다른 시트를 고쳐도 바뀌지 않는다. known에 같은 'raw'를 가진 이전 결과가 있으면 그 'content'를 재사용하고,
+    다를 때만 시트를 읽어 'content'를 다시 계산한다.
+    """
+    known = known or {}
+    result = {}
+    with zipfile.ZipFile(file_path) as zf:
+        shared = _read_member(zf, 'xl/sharedStrings.xml')
+        entries = _SHARED_ENTRY_RE.findall(shared)
+        shared_digest = hashlib.sha256(shared).digest()
+        del shared
+        cell_formats = read_cell_formats(zf)
+        members = set(zf.namelist())
+        workbook = None
+        try:
+            for name, path in sheet_paths(zf).items():
+                if path not in members:
+                    continue
+                raw = _raw_digest(zf, path, entries, cell_formats, shared_digest)
+                previous = known.get(name)
+                if previous and previous.get('raw') == raw:
+                    result[name] = previous
+                    continue
+                if workbook is None:
+                    workbook = open_workbook(file_path)
+                result[name] = {'raw': raw, 'content': _content_digest(workbook, name)}
+        finally:
+            if workbook is not None:
+                workbook.close()
+    return result
+
+
+# ---------------------------------------------------------------- 값 전용 시트 리더
+
+def is_date_format(fmt):
+    if fmt is None:
+        return False
+    return _DATE_FORMAT_RE.search(_FORMAT_STRIP_RE.sub('', fmt.split(';')[0])) is not None
+
+
+def is_timedelta_format(fmt):
+    if fmt is None:
+        return False
+    return _TIMEDELTA_FORMAT_RE.search(fmt.split(';')[0]) is not None
+
+
+def from_excel(value, epoch=WINDOWS_EPOCH, as_timedelta=False):
+    """Excel 일련번호 -> datetime (1 미만은 time, 시간 서식이면 timedelta). 1900-02-29 버그 보정 포함."""
+    if as_timedelta:
+        td = timedelta(days=value)
+        if td.microseconds:
+            td = timedelta(seconds=td.total_seconds() // 1, microseconds=round(td.microseconds, -3))
+        return td
+    day, fraction = divmod(value, 1)
+    diff = timedelta(milliseconds=round(fraction * SECONDS_PER_DAY * 1000))
+    if 0 <= value < 1 and diff.days == 0:
+        minutes, seconds = divmod(diff.seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return time(hours, minutes, seconds, diff.microseconds)
+    if 0 < value < 60 and epoch == WINDOWS_EPOCH:
+        day += 1
+    return epoch + timedelta(days=day) + diff
+
+
+def _from_iso(text):
+    """t="d" 칸 (ISO 8601 문자열)"""
+    text = text.rstrip('Z')
+    if 'T' in text:
+        return datetime.fromisoformat(text)
+    if ':' in text:
+        return time.fromisoformat(text)
+    return date.fromisoformat(text)
+
+
+def _xml_text(raw):
+    """빠른 경로에서 꺼낸 텍스트를 XML 파서가 돌려주는 값으로 (줄바꿈 정규화, 엔티티 해제)"""
+    if '\r' in raw:
+        raw = raw.replace('\r\n', '\n').replace('\r', '\n')
+    if '&' in raw:
+        raw = html.unescape(raw)
+    return raw
+
+
+def _inline_text(elem):
+    """<is> 요소의 문자열: <t>와 서식 run의 <t>를 이어 붙인다 (발음 rPh 제외)"""
+    parts = []
+    for child in elem:
+        tag = _local(child.tag)
+        if tag == 't':
+            parts.append(child.text or '')
+        elif tag == 'r':
+            parts.extend(t.text or '' for t in child if _local(t.tag) == 't')
+    return ''.join(parts)
+
+
+_COLUMN_INDEX = {}
+
+
+class _FirstColumns(dict):
+    """n -> [1, 2, ..., n] (행이 A열부터 빈틈없이 찼는지 비교용)"""
+
+    def __missing__(self, n):
+        self[n] = list(range(1, n + 1))
+        return self[n]
+
+
+_FIRST_COLUMNS = _FirstColumns()
+
+
+def _column_of(ref):
+    """'AB12' -> 28"""
+    letters = ref.rstrip('0123456789')
+    index = _COLUMN_INDEX.get(letters)
+    if index is None:
+        index = 0
+        for letter in letters.lstrip('$').rstrip('$').upper():
+            index = index * 26 + ord(letter) - 64
+        _COLUMN_INDEX[letters] = index
+    return index
+
+
+def _boundaries(ref):
+    """'A1:T100' -> (최소 열, 최소 행, 최대 열, 최대 행). 'A1'처럼 칸 하나도 받는다."""
+    corners = []
+    for coordinate in ref.replace('$', '').split(':'):
+        letters = coordinate.rstrip('0123456789')
+        corners.append((_column_of(letters), int(coordinate[len(letters):])))
+    (min_col, min_row), (max_col, max_row) = corners[0], corners[-1]
+    return min_col, min_row, max_col, max_row
+
+
+def _date_styles(zf):
+    """날짜 서식 칸 스타일 번호 집합, 그중 시간 간격([h]:mm 등) 서식 집합"""
+    dates, timedeltas = set(), set()
+    for style, (fmt_id, custom) in enumerate(read_cell_formats(zf)):
+        fmt = custom if custom is not None else BUILTIN_DATE_FORMATS.get(fmt_id)
+        if is_date_format(fmt):
+            dates.add(style)
+        if is_timedelta_format(fmt):
+            timedeltas.add(style)
+    return dates, timedeltas
+
+
+def _epoch(zf):
+    with zf.open('xl/workbook.xml') as f:
+        for elem in ET.parse(f).getroot():
+            if _local(elem.tag) == 'workbookPr' and elem.get('date1904', '').lower() in ('1', 'true'):
+                return MAC_EPOCH
+    return WINDOWS_EPOCH
+
+
+class _FallBack(Exception):
+    """빠른 경로가 해석하지 않는 시트 XML (ElementTree 경로로 다시 읽는다)"""
+
+
+class StreamSheet:
+    """시트 하나. iter_rows(values_only=True)만 지원한다 (행/열 번호는 1부터)."""
+
+    def __init__(self, workbook, title, path):
+        self.parent = workbook
+        self.title = title
+        self._path = path
+        self.min_column = self.min_row = 1
+        self.max_column = self.max_row = None
+        with workbook._zf.open(path) as f:
+            for _, elem in ET.iterparse(f, events=('start',)):
+                if elem.tag == _DIMENSION_TAG:
+                    self.min_column, self.min_row, self.max_column, self.max_row = _boundaries(elem.get('ref'))
+                    break
+                if elem.tag == _SHEET_DATA_TAG:
+                    break  # <dimension>이 없다: 행 너비는 행마다 마지막 칸까지
+
+    def _rows(self):
+        """(행 번호, [(열 번호, 값), ...]) 를 시트 순서대로. 빠른 경로가 도중에 포기하면 이미 돌려준 행 다음부터
+        ElementTree 경로로 이어 읽는다."""
+        yielded = 0
+        try:
+            for row in self._scan_rows():
+                yield row
+                yielded += 1
+        except _FallBack:
+            for index, row in enumerate(self._tree_rows()):
+                if index >= yielded:
+                    yield row
+
+    def _scan_rows(self):
+        """빠른 경로: sheetData를 CHUNK_SIZE씩 읽어 마지막 </row>까지 잘라 정규식 토큰으로 행을 만든다.
+        요소 객체를 만들지 않으므로 ElementTree보다 몇 배 빠르다."""
+        strings, (date_styles, timedelta_styles), epoch = self.parent._context()
+        style_kinds = {}  # s 속성 문자열 -> None(숫자) / False(날짜) / True(시간 간격)
+        serials = {}      # (일련번호, 시간 간격 여부) -> 변환 결과 (같은 날짜가 행마다 반복된다)
+
+        def convert(ref, cell_type, value, style):
+            if not value:
+                return None
+            if not cell_type or cell_type == 'n':
+                value = float(value) if '.' in value or 'e' in value or 'E' in value else int(value)
+                if style and date_styles:
+                    kind = style_kinds.get(style, 0)
+                    if kind == 0:
+                        number = int(style)
+                        kind = style_kinds[style] = (number in timedelta_styles) if number in date_styles else None
+                    if kind is not None:
+                        key = (value, kind)
+                        if key not in serials:
+                            try:
+                                serials[key] = from_excel(value, epoch, kind)
+                            except (OverflowError, ValueError):
+                                warnings.warn(f'Cell {ref} is marked as a date but the serial value {value} is '
+                                              f'outside the limits for dates. The cell will be treated as an error.')
+                                return '#VALUE!'
+                        value = serials[key]
+                return value
+            if cell_type == 's':
+                return strings[int(value)]
+            if cell_type == 'b':
+                return bool(int(value))
+            if cell_type == 'inlineStr':
+                return None
+            value = _xml_text(value)
+            return _from_iso(value) if cell_type == 'd' else value
+
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        buffer = ''
+        started = done = False
+        row_number = column = 0
+        columns = values = None
+        with self.parent._zf.open(self._path) as f:
+            while not done:
+                block = f.read(CHUNK_SIZE)
+                buffer += decoder.decode(block, final=not block)
+                if not started:
+                    declared = _XML_ENCODING_RE.match(buffer)
+                    if declared and declared.group(1).lower().replace('-', '') != 'utf8':
+                        raise _FallBack()
+                    match = _SHEET_DATA_START_RE.search(buffer)
+                    if match is None:
+                        if not block:
+                            return
+                        continue
+                    if match.group(1):
+                        raise _FallBack()  # 접두사가 붙은 태그 (<x:row> 등)
+                    if match.group(2):
+                        return  # <sheetData/>
+                    buffer = buffer[match.end():]
+                    started = True
+
+                end = buffer.find('</sheetData')
+                if end >= 0 or not block:
+                    text, buffer, done = buffer[:end] if end >= 0 else buffer, '', True
+                else:
+                    cut = buffer.rfind('</row>')
+                    if cut < 0:
+                        continue
+                    cut += len('</row>')
+                    text, buffer = buffer[:cut], buffer[cut:]
+                if any(markup in text for markup in _UNSUPPORTED_MARKUP):
+                    raise _FallBack()
+
+                for (row_tag, row_r, row_attrs, row_closed, letters, digits, style, cell_type, value,
+                     cell_tag, cell_attrs, cell_body) in _SHEET_TOKEN_RE.findall(text):
+                    if letters:
+                        column = _COLUMN_INDEX.get(letters) or _column_of(letters)
+                        if not value:
+                            value = None
+                        elif cell_type == 's':
+                            value = strings[int(value)]
+                        elif cell_type or style:
+                            value = convert(letters + digits, cell_type, value, style)
+                        else:
+                            value = float(value) if '.' in value or 'e' in value or 'E' in value else int(value)
+                    elif row_tag:
+                        if columns is not None:
+                            yield row_number, columns, values
+                        if not row_r:
+                            for name, double, single in _ATTR_RE.findall(row_attrs):
+                                if name == 'r':
+                                    row_r = double or single
+                        row_number = int(float(row_r)) if row_r else row_number + 1
+                        column = 0
+                        columns, values = [], []
+                        if row_closed:
+                            yield row_number, columns, values
+                            columns = values = None
+                        continue
+                    else:
+                        attrs = {name: double or single for name, double, single in _ATTR_RE.findall(cell_attrs)}
+                        ref = attrs.get('r')
+                        column = _column_of(ref) if ref else column + 1
+                        cell_type = attrs.get('t')
+                        if cell_type == 'inlineStr':
+                            match = _INLINE_RE.search(cell_body)
+                            value = None
+                            if match:
+                                wrapped = f'<c xmlns="{SHEET_MAIN_NS}">{match.group(0)}</c>'
+                                value = _inline_text(ET.fromstring(wrapped)[0])
+                        else:
+                            match = _VALUE_RE.search(cell_body)
+                            value = convert(ref, cell_type, match.group(1) if match else None, attrs.get('s'))
+                    if columns is None:
+                        raise _FallBack()  # <row> 밖의 칸
+                    columns.append(column)
+                    values.append(value)
+        if columns is not None:
+            yield row_number, columns, values
+
+    def _tree_rows(self):
+        """ElementTree 경로 (빠른 경로가 해석하지 않는 시트용)"""
+        strings, (date_styles, timedelta_styles), epoch = self.parent._context()
+        row_number = 0
+        with self.parent._zf.open(self._path) as f:
+            for _, elem in ET.iterparse(f):
+                if elem.tag != _ROW_TAG:
+                    continue
+                r = elem.get('r')
+                row_number = int(float(r)) if r else row_number + 1
+                column = 0
+                columns, values = [], []
+                for cell in elem:
+                    ref = cell.get('r')
+                    column = _column_of(ref) if ref else column + 1
+                    cell_type = cell.get('t')
+                    value = None
+                    if cell_type == 'inlineStr':
+                        for child in cell:
+                            if child.tag == _INLINE_STRING_TAG:
+                                value = _inline_text(child)
+                                break
+                    else:
+                        for child in cell:
+                            if child.tag == _CELL_VALUE_TAG:
+                                value = child.text or None
+                                break
+                    if value is not None and cell_type != 'inlineStr':
+                        if cell_type is None or cell_type == 'n':
+                            value = float(value) if '.' in value or 'e' in value or 'E' in value else int(value)
+                            style = cell.get('s')
+                            if style and int(style) in date_styles:
+                                try:
+                                    value = from_excel(value, epoch, int(style) in timedelta_styles)
+                                except (OverflowError, ValueError):
+                                    warnings.warn(f'Cell {ref} is marked as a date but the serial value {value} '
+                                                  f'is outside the limits for dates. The cell will be treated as an error.')
+                                    value = '#VALUE!'
+                        elif cell_type == 's':
+                            value = strings[int(value)]
+                        elif cell_type == 'b':
+                            value = bool(int(value))
+                        elif cell_type == 'd':
+                            value = _from_iso(value)
+                    columns.append(column)
+                    values.append(value)
+                elem.clear()
+                yield row_number, columns, values
+
+    @staticmethod
+    def _values(columns, values, min_col, max_col):
+        """칸 (열 번호, 값) -> min_col~max_col 너비의 값 튜플 (max_col이 없으면 마지막 칸까지)"""
+        if not columns and not max_col:
+            return ()
+        max_col = max_col or columns[-1]
+        if min_col == 1 and len(columns) == max_col and columns == _FIRST_COLUMNS[max_col]:
+            return tuple(values)  # A열부터 빈틈없이 찬 행 (대부분)
+        row = [None] * (max_col + 1 - min_col)
+        for column, value in zip(columns, values):
+            if min_col <= column <= max_col:
+                row[column - min_col] = value
+        return tuple(row)
+
+    def iter_rows(self, min_row=None, max_row=None, min_col=None, max_col=None, values_only=False):
+        """openpyxl ReadOnlyWorksheet.iter_rows(values_only=True)와 같은 행 튜플"""
+        if not values_only:
+            raise NotImplementedError('StreamSheet yields values only; use iter_rows(values_only=True)')
+        min_col = min_col or 1
+        min_row = min_row or 1
+        max_col = max_col or self.max_column
+        max_row = max_row or self.max_row
+        empty_row = (None,) * (max_col + 1 - min_col) if max_col is not None else ()
+        counter = min_row
+        row_number = 1
+        for row_number, columns, values in self._rows():
+            if max_row is not None and row_number > max_row:
+                break
+            while counter < row_number:  # 빠진 행
+                counter += 1
+                yield empty_row
+            if counter <= row_number:
+                counter += 1
+                yield self._values(columns, values, min_col, max_col)
+        if max_row is not None and max_row < row_number:
+            for _ in range(counter, max_row + 1):
+                yield empty_row
+
+    @property
+    def values(self):
+        return self.iter_rows(values_only=True)
+
+    def __repr__(self):
+        return f'<StreamSheet "{self.title}">'
+
+
+class StreamWorkbook:
+    """openpyxl.load_workbook(read_only=True, data_only=True) 대신 쓰는 값 전용 워크북.
+    공유 문자열과 서식은 처음 시트를 읽을 때 한 번만 읽는다."""
+
+    def __init__(self, file_path):
+        self._zf = zipfile.ZipFile(file_path)
+        members = set(self._zf.namelist())
+        self._paths = {name: path for name, path in sheet_paths(self._zf).items() if path in members}
+        self._sheets = {}
+        self._shared = None
+
+    def _context(self):
+        if self._shared is None:
+            # openpyxl과 같이 이스케이프 잔재 'x005F_'를 지운다
+            strings = [text.replace('x005F_', '') for text in read_shared_strings(self._zf)]
+            self._shared = strings, _date_styles(self._zf), _epoch(self._zf)
+        return self._shared
+
+    @property
+    def sheetnames(self):
+        return list(self._paths)
+
+    def __getitem__(self, name):
+        if name not in self._paths:
+            raise KeyError(f'Worksheet {name} does not exist.')
+        if name not in self._sheets:
+            self._sheets[name] = StreamSheet(self, name, self._paths[name])
+        return self._sheets[name]
+
+    def __contains__(self, name):
+        return name in self._paths
+
+    def __iter__(self):
+        return (self[name] for name in self._paths)
+
+    @property
+    def worksheets(self):
+        return list(self)
+
+    def close(self):
+        self._zf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_workbook(file_path):
+    """값 전용 스트리밍 워크북 (openpyxl.load_workbook(file_path, read_only=True, data_only=True) 대체)"""
+    return StreamWorkbook(file_path)